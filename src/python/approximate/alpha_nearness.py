@@ -0,0 +1,157 @@
+from collections import defaultdict
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from candidate_index import TSPCandidateIndex
+from lower_bound import TSPHeldKarpBound
+
+# Candidatos por alpha-proximidade (Helsgaun).
+#
+# alpha(i, j) é o quanto a árvore mínima encarece se a aresta (i, j) for
+# forçada nela: c(i, j) - beta(i, j), onde beta é a maior aresta no caminho
+# entre i e j na árvore. Arestas da árvore têm alpha 0. Ordenar vizinhos por
+# alpha (em vez de distância) acerta muito mais arestas do tour ótimo, então
+# 5 candidatos por cidade bastam onde 10-15 vizinhos geométricos seriam
+# necessários. alpha é calculado em blocos de linhas e só os k melhores de cada
+# linha são guardados; nenhuma matriz n x n de beta ou alpha é formada.
+
+class TSPAlphaNearness:
+
+    def __init__(self, matrix, block_size: int = 1024):
+        costs = np.asarray(matrix, dtype=np.float64)
+        self.cost = np.minimum(costs, costs.T)
+        self.n_cities = self.cost.shape[0]
+        self.block_size = block_size
+        self.matrix_digest = TSPCandidateIndex.digest(matrix)
+
+    # Linha de Kruskal da árvore: percorrendo as arestas em ordem crescente de
+    # peso, cada uma concatena as listas das duas componentes e o peso fica na
+    # junção. A maior aresta do caminho entre i e j na árvore é então o máximo
+    # das junções entre as posições de i e j. `edge_weight[v]` é o peso da aresta
+    # (v, parent[v]); vértices fora da árvore ficam separados por junções infinitas.
+    # Retorna (posição de cada cidade na linha, junções entre posições vizinhas).
+    @staticmethod
+    def _tree_line(parent: np.ndarray, edge_weight: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        n = parent.shape[0]
+        tree = np.flatnonzero(parent >= 0)
+        tree = tree[np.argsort(edge_weight[tree], kind='stable')]
+
+        leader = list(range(n))
+        tail = list(range(n))
+        following = [-1] * n
+        link = [np.inf] * n
+
+        def find(x):
+            while leader[x] != x:
+                leader[x] = leader[leader[x]]
+                x = leader[x]
+            return x
+
+        for v in tree.tolist():
+            a, b = find(v), find(int(parent[v]))
+            following[tail[a]] = b
+            link[tail[a]] = float(edge_weight[v])
+            leader[b] = a
+            tail[a] = tail[b]
+
+        order = []
+        for head in range(n):
+            if leader[head] == head:
+                city = head
+                while city >= 0:
+                    order.append(city)
+                    city = following[city]
+
+        order = np.asarray(order, dtype=np.int64)
+        position = np.empty(n, dtype=np.int64)
+        position[order] = np.arange(n)
+        junction = np.asarray(link, dtype=np.float64)[order[:-1]]
+        return position, junction
+
+    # beta(i, j) = maior aresta no caminho da árvore entre i e j, para i em `rows`
+    # (uma linha por vez, O(n) cada). Diagonal -inf; +inf entre componentes.
+    @staticmethod
+    def _path_maxima(line: Tuple[np.ndarray, np.ndarray], rows) -> np.ndarray:
+        position, junction = line
+        n = position.shape[0]
+        beta = np.empty((len(rows), n))
+        ordered = np.empty(n)
+        for r, i in enumerate(rows):
+            p = position[i]
+            ordered[p] = -np.inf
+            ordered[p + 1:] = np.maximum.accumulate(junction[p:])
+            ordered[:p] = np.maximum.accumulate(junction[:p][::-1])[::-1]
+            beta[r] = ordered[position]
+        return beta
+
+    # Custos penalizados c[i][j] + pi[i] + pi[j] das linhas start..stop-1
+    def _weights(self, pi: np.ndarray, start: int, stop: int) -> np.ndarray:
+        return self.cost[start:stop] + pi[start:stop, None] + pi[None, :]
+
+    # Linhas de alpha sob demanda para TSPCandidateIndex.from_rows. `special`
+    # substitui a linha e a coluna da cidade 0 (fora da árvore na 1-árvore).
+    def _alpha_rows(self, parent: np.ndarray, pi: np.ndarray, special: Optional[np.ndarray] = None):
+        children = np.flatnonzero(parent >= 0)
+        edge_weight = np.full(self.n_cities, np.inf)
+        edge_weight[children] = (self.cost[children, parent[children]]
+                                 + pi[children] + pi[parent[children]])
+        line = self._tree_line(parent, edge_weight)
+
+        def rows(start: int, stop: int) -> np.ndarray:
+            beta = self._path_maxima(line, range(start, stop))
+            alpha = self._weights(pi, start, stop) - beta
+            alpha[~np.isfinite(beta)] = np.inf
+            if special is not None:
+                alpha[:, 0] = special[start:stop]
+                if start == 0:
+                    alpha[0] = special
+            return alpha
+
+        return rows
+
+    # Alpha sobre a MST de find_mst_prim (lista de arestas (u, v, peso))
+    def from_mst(self, mst_edges: List[Tuple[int, int, int]], k: int = 5) -> TSPCandidateIndex:
+        parent = np.full(self.n_cities, -1, dtype=np.int64)
+        adjacency = defaultdict(list)
+        for u, v, _ in mst_edges:
+            adjacency[u].append(v)
+            adjacency[v].append(u)
+
+        # Orienta a árvore a partir da cidade 0
+        seen = [False] * self.n_cities
+        seen[0] = True
+        stack = [0]
+        while stack:
+            u = stack.pop()
+            for v in adjacency[u]:
+                if not seen[v]:
+                    seen[v] = True
+                    parent[v] = u
+                    stack.append(v)
+
+        pi = np.zeros(self.n_cities)
+        return self._candidates(self._alpha_rows(parent, pi), pi, k)
+
+    # Alpha sobre a 1-árvore com penalidades pi (ex.: TSPHeldKarpBound.pi).
+    # Sem pi, usa a 1-árvore sem penalidades.
+    def from_one_tree(self, pi: Optional[np.ndarray] = None, k: int = 5) -> TSPCandidateIndex:
+        n = self.n_cities
+        pi = np.zeros(n) if pi is None else np.asarray(pi, dtype=np.float64)
+        bound = TSPHeldKarpBound(self.cost)
+        _, _, parent, (first, second) = bound.one_tree(pi)
+
+        # Cidade especial 0: entra na 1-árvore pelas duas arestas mais baratas.
+        # Forçar (0, j) troca a segunda mais barata por ela.
+        row = self._weights(pi, 0, 1)[0]
+        row[0] = np.inf
+        special = np.maximum(row - row[second], 0.0)
+        special[[first, second]] = 0.0
+        special[0] = np.inf
+
+        return self._candidates(self._alpha_rows(parent, pi, special), pi, k)
+
+    def _candidates(self, alpha_rows, pi: np.ndarray, k: int) -> TSPCandidateIndex:
+        return TSPCandidateIndex.from_rows(alpha_rows, self.n_cities, k, self.block_size,
+                                           secondary=lambda start, stop: self._weights(pi, start, stop),
+                                           matrix_digest=self.matrix_digest)
@@ -0,0 +1,111 @@
+import os
+import hashlib
+from typing import Callable, List, Optional
+
+import numpy as np
+
+# Índice de candidatos: os k vizinhos mais próximos de cada cidade.
+#
+# Calculado uma única vez (O(n²), em blocos de linhas com argpartition) e
+# compartilhado por todas as etapas que precisam de vizinhança: busca local,
+# construção gulosa, MST esparsa. Pode ser persistido ao lado do arquivo da
+# instância para que execuções repetidas apenas carreguem o resultado.
+
+class TSPCandidateIndex:
+
+    def __init__(self, neighbors: np.ndarray, matrix_digest: str = ""):
+        self.neighbors = np.ascontiguousarray(neighbors, dtype=np.int32)
+        self.n_cities, self.k = self.neighbors.shape
+        self.matrix_digest = matrix_digest
+
+    @staticmethod
+    def digest(matrix) -> str:
+        data = np.ascontiguousarray(np.asarray(matrix, dtype=np.int64))
+        return hashlib.blake2b(data.tobytes(), digest_size=16).hexdigest()
+
+    # kNN por blocos de linhas: cada bloco custa block_size x n de memória.
+    # `secondary` desempata vizinhos com a mesma chave (ex.: custo para alpha);
+    # `matrix_digest` identifica a instância quando `matrix` é uma chave derivada.
+    @classmethod
+    def compute(cls, matrix, k: int = 10, block_size: int = 1024, secondary=None,
+                matrix_digest: Optional[str] = None) -> 'TSPCandidateIndex':
+        distances = np.asarray(matrix)
+        ties = None if secondary is None else (lambda start, stop: np.asarray(secondary[start:stop]))
+        return cls.from_rows(lambda start, stop: distances[start:stop], distances.shape[0], k,
+                             block_size, ties, matrix_digest or cls.digest(distances))
+
+    # Mesmo kNN sobre linhas geradas sob demanda: `rows(start, stop)` devolve o
+    # bloco de chaves (stop - start) x n e `secondary(start, stop)` o de desempate,
+    # sem materializar a matriz de chaves inteira.
+    @classmethod
+    def from_rows(cls, rows: Callable[[int, int], np.ndarray], n: int, k: int = 10,
+                  block_size: int = 1024, secondary: Optional[Callable[[int, int], np.ndarray]] = None,
+                  matrix_digest: str = "") -> 'TSPCandidateIndex':
+        k = max(1, min(k, n - 1))
+        neighbors = np.empty((n, k), dtype=np.int32)
+
+        for start in range(0, n, block_size):
+            stop = min(start + block_size, n)
+            block = rows(start, stop).astype(np.float64)
+            local = np.arange(stop - start)
+            block[local, local + start] = np.inf
+
+            if k < n - 1:
+                nearest = np.argpartition(block, k - 1, axis=1)[:, :k]
+            else:
+                nearest = np.argsort(block, axis=1, kind='stable')[:, :k]
+            keys = np.take_along_axis(block, nearest, axis=1)
+            if secondary is None:
+                ties = nearest
+            else:
+                ties = np.take_along_axis(secondary(start, stop), nearest, axis=1)
+            order = np.lexsort((ties, keys), axis=1)
+            neighbors[start:stop] = np.take_along_axis(nearest, order, axis=1)
+
+        return cls(neighbors, matrix_digest)
+
+    @staticmethod
+    def default_path(instance_file: str, k: int) -> str:
+        return f"{instance_file}.knn{k}.npz"
+
+    def save(self, path: str):
+        np.savez(path, neighbors=self.neighbors, matrix_digest=np.array(self.matrix_digest))
+
+    # Carrega o índice se existir e corresponder à matriz; senão retorna None
+    @classmethod
+    def load(cls, path: str, matrix=None, k: Optional[int] = None) -> Optional['TSPCandidateIndex']:
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as data:
+                index = cls(data['neighbors'], str(data['matrix_digest']))
+        except Exception:
+            return None
+
+        if matrix is not None and index.matrix_digest != cls.digest(matrix):
+            return None
+        if k is not None:
+            if index.k < k:
+                return None
+            index = cls(index.neighbors[:, :k], index.matrix_digest)
+        return index
+
+    # Carrega do cache ao lado da instância ou calcula e salva
+    @classmethod
+    def for_instance(cls, instance_file: str, matrix, k: int = 10) -> 'TSPCandidateIndex':
+        k = max(1, min(k, len(matrix) - 1))
+        path = cls.default_path(instance_file, k)
+        index = cls.load(path, matrix, k)
+        if index is not None:
+            return index
+
+        index = cls.compute(matrix, k)
+        try:
+            index.save(path)
+        except OSError as e:
+            print(f"Aviso: não foi possível salvar índice de candidatos: {e}")
+        return index
+
+    # Listas Python para os laços internos da busca local
+    def as_lists(self) -> List[List[int]]:
+        return self.neighbors.tolist()
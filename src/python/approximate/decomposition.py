@@ -0,0 +1,374 @@
+import time
+import os
+import argparse
+from multiprocessing import Pool, shared_memory
+from typing import List, Optional
+
+import numpy as np
+
+from mst_algorithm import TSPMSTApproximation
+from local_search import TSPLocalSearch
+from vectorized_prim import TSPVectorizedPrim
+
+# Decomposição em clusters para instâncias muito grandes.
+#
+#   1. Particiona as cidades: k-means ou grade sobre coordenadas, ou corte da
+#      MST (ligação simples com tamanho máximo) para entradas em matriz.
+#   2. Resolve cada cluster com TSPMSTApproximation + 2-opt em processos
+#      trabalhadores independentes. As coordenadas (ou a matriz) ficam em
+#      memória compartilhada e cada tarefa leva só os índices do cluster; a
+#      submatriz é montada no trabalhador.
+#   3. Resolve o tour de clusters (ordem de visita) da mesma forma.
+#   4. Costura os tours: cada cluster é aberto na aresta que melhor liga o
+#      cluster anterior ao seguinte.
+#   5. Repara as fronteiras com 2-opt de caminho em janelas ao redor de cada
+#      junção (extremos fixos).
+# Com coordenadas, a matriz completa nunca é formada: apenas submatrizes de
+# clusters e janelas, uma de cada vez por processo. Nenhum cluster passa de
+# cluster_size: os grandes demais (k-means e grade não controlam o tamanho)
+# são bisseccionados pela mediana do eixo de maior extensão.
+
+class TSPClusterDecomposition:
+
+    def __init__(self, matrix=None, coordinates=None, cluster_size: int = 200,
+                 method: str = 'auto', processes: Optional[int] = None,
+                 repair_window: int = 15, seed: int = 0):
+        if matrix is None and coordinates is None:
+            raise ValueError("Informe a matriz de distâncias ou as coordenadas")
+        self.matrix = None if matrix is None else np.asarray(matrix, dtype=np.int64)
+        self.coordinates = None if coordinates is None else np.asarray(coordinates, dtype=np.float64)
+        source = self.matrix if self.matrix is not None else self.coordinates
+        self.n_cities = source.shape[0]
+        self.cluster_size = max(2, cluster_size)
+        self.method = method if method != 'auto' else ('mst' if self.matrix is not None else 'kmeans')
+        self.processes = processes or os.cpu_count() or 1
+        self.repair_window = repair_window
+        self.rng = np.random.default_rng(seed)
+        self.timings = {}
+
+    # Distâncias entre pares (vetorizado): matriz ou euclidiana arredondada
+    def distance(self, a, b):
+        if self.matrix is not None:
+            return self.matrix[a, b]
+        delta = self.coordinates[a] - self.coordinates[b]
+        return np.rint(np.sqrt((delta ** 2).sum(axis=-1))).astype(np.int64)
+
+    def submatrix(self, cities: np.ndarray) -> np.ndarray:
+        return self.distance(cities[:, None], cities[None, :])
+
+    # --- Particionamento ---
+
+    def _kmeans(self, iterations: int = 20) -> np.ndarray:
+        points = self.coordinates
+        k = max(1, -(-self.n_cities // self.cluster_size))
+        centers = points[self.rng.choice(self.n_cities, size=k, replace=False)]
+        labels = np.zeros(self.n_cities, dtype=np.int64)
+        block = max(1, 2 ** 22 // k)
+
+        for _ in range(iterations):
+            for start in range(0, self.n_cities, block):
+                chunk = points[start:start + block]
+                distances = ((chunk[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+                labels[start:start + block] = distances.argmin(axis=1)
+            counts = np.bincount(labels, minlength=k)
+            for axis in range(points.shape[1]):
+                sums = np.bincount(labels, weights=points[:, axis], minlength=k)
+                centers[counts > 0, axis] = sums[counts > 0] / counts[counts > 0]
+        return labels
+
+    def _grid(self) -> np.ndarray:
+        points = self.coordinates
+        cells = max(1, int(np.ceil(np.sqrt(self.n_cities / self.cluster_size))))
+        low, high = points.min(axis=0), points.max(axis=0)
+        span = np.where(high > low, high - low, 1.0)
+        cell = np.minimum(((points - low) / span * cells).astype(np.int64), cells - 1)
+        return cell[:, 0] * cells + cell[:, 1]
+
+    # Ligação simples sobre as arestas da MST em ordem crescente, sem deixar
+    # componentes passarem de cluster_size; componentes muito pequenos são
+    # depois absorvidos pelo vizinho mais próximo na árvore, se couberem.
+    def _mst_cut(self) -> np.ndarray:
+        parent, order, _ = TSPVectorizedPrim.mst(self.matrix)
+        children = order[1:]
+        weights = self.matrix[children, parent[children]]
+        edges = [(int(children[i]), int(parent[children[i]])) for i in np.argsort(weights, kind='stable')]
+
+        root = list(range(self.n_cities))
+        size = [1] * self.n_cities
+
+        def find(v):
+            while root[v] != v:
+                root[v] = root[root[v]]
+                v = root[v]
+            return v
+
+        def merge_pass(limit, small):
+            for u, v in edges:
+                ru, rv = find(u), find(v)
+                if ru == rv or size[ru] + size[rv] > limit:
+                    continue
+                if small is not None and min(size[ru], size[rv]) >= small:
+                    continue
+                if size[ru] < size[rv]:
+                    ru, rv = rv, ru
+                root[rv] = ru
+                size[ru] += size[rv]
+
+        merge_pass(self.cluster_size, None)
+        merge_pass(self.cluster_size, max(2, self.cluster_size // 4))
+
+        _, labels = np.unique([find(v) for v in range(self.n_cities)], return_inverse=True)
+        return labels.astype(np.int64)
+
+    # Divide pela mediana do eixo de maior extensão até caber em cluster_size
+    def _bisect(self, cluster: np.ndarray) -> List[np.ndarray]:
+        if len(cluster) <= self.cluster_size:
+            return [cluster]
+        points = self.coordinates[cluster]
+        axis = int(np.ptp(points, axis=0).argmax())
+        ordered = cluster[np.argsort(points[:, axis], kind='stable')]
+        half = len(ordered) // 2
+        return self._bisect(ordered[:half]) + self._bisect(ordered[half:])
+
+    def partition(self) -> List[np.ndarray]:
+        if self.method == 'mst':
+            labels = self._mst_cut()
+        elif self.method == 'grid':
+            labels = self._grid()
+        else:
+            labels = self._kmeans()
+
+        order = np.argsort(labels, kind='stable')
+        bounds = np.flatnonzero(np.diff(labels[order])) + 1
+        clusters = [cluster for cluster in np.split(order, bounds) if len(cluster) > 0]
+        if self.method == 'mst':
+            return clusters
+        return [piece for cluster in clusters for piece in self._bisect(cluster)]
+
+    # --- Ordem dos clusters ---
+
+    def _cluster_distances(self, clusters: List[np.ndarray]) -> np.ndarray:
+        k = len(clusters)
+        if self.matrix is None:
+            centers = np.array([self.coordinates[c].mean(axis=0) for c in clusters])
+            delta = centers[:, None, :] - centers[None, :, :]
+            return np.rint(np.sqrt((delta ** 2).sum(axis=2))).astype(np.int64)
+
+        # Menor distância entre cidades de cada par de clusters
+        order = np.concatenate(clusters)
+        starts = np.cumsum([0] + [len(c) for c in clusters[:-1]])
+        distances = np.empty((k, k), dtype=np.int64)
+        for a, cluster in enumerate(clusters):
+            rows = self.matrix[cluster][:, order]
+            distances[a] = np.minimum.reduceat(rows.min(axis=0), starts)
+        distances = np.minimum(distances, distances.T)
+        np.fill_diagonal(distances, 0)
+        return distances
+
+    # --- Costura e reparo ---
+
+    # Abre o ciclo do cluster na aresta que minimiza entrar vindo de `previous`
+    # e sair em direção ao cluster seguinte; retorna o caminho orientado.
+    def _open_cycle(self, cycle: np.ndarray, previous: Optional[int], following: np.ndarray) -> np.ndarray:
+        m = len(cycle)
+        if m == 1:
+            return cycle
+        heads = cycle
+        tails = np.roll(cycle, -1)
+        removed = self.distance(heads, tails)
+
+        # Sentido direto: entra em tails[i], percorre o ciclo e sai em heads[i]
+        exit_forward = self.distance(heads[:, None], following[None, :]).min(axis=1)
+        exit_backward = self.distance(tails[:, None], following[None, :]).min(axis=1)
+        if previous is None:
+            enter_forward = np.zeros(m, dtype=np.int64)
+            enter_backward = np.zeros(m, dtype=np.int64)
+        else:
+            enter_forward = self.distance(np.full(m, previous), tails)
+            enter_backward = self.distance(np.full(m, previous), heads)
+
+        forward = enter_forward + exit_forward - removed
+        backward = enter_backward + exit_backward - removed
+        i_forward, i_backward = int(forward.argmin()), int(backward.argmin())
+
+        if forward[i_forward] <= backward[i_backward]:
+            return np.roll(cycle, -(i_forward + 1))
+        # Sentido inverso: entra em heads[i], percorre ao contrário e sai em tails[i]
+        return np.roll(cycle, -(i_backward + 1))[::-1]
+
+    # 2-opt sobre um caminho aberto com extremos fixos
+    @staticmethod
+    def _two_opt_path(path: List[int], rows: List[List[int]]) -> List[int]:
+        m = len(path)
+        improved = True
+        while improved:
+            improved = False
+            for i in range(m - 3):
+                a, b = path[i], path[i + 1]
+                for j in range(i + 2, m - 1):
+                    c, d = path[j], path[j + 1]
+                    if rows[a][c] + rows[b][d] < rows[a][b] + rows[c][d]:
+                        path[i + 1:j + 1] = path[i + 1:j + 1][::-1]
+                        b = path[i + 1]
+                        improved = True
+        return path
+
+    def repair_boundaries(self, tour: np.ndarray, junctions: List[int]) -> np.ndarray:
+        n = len(tour)
+        w = self.repair_window
+        if n < 2 * w + 2:
+            return tour
+        tour = tour.copy()
+        for junction in junctions:
+            positions = (np.arange(junction - w, junction + w + 1)) % n
+            window = tour[positions]
+            rows = self.submatrix(window).tolist()
+            local = self._two_opt_path(list(range(len(window))), rows)
+            tour[positions] = window[local]
+        return tour
+
+    # --- Execução ---
+
+    def _solve_clusters_parallel(self, clusters: List[np.ndarray]) -> List[List[int]]:
+        source = self.matrix if self.matrix is not None else self.coordinates
+        block = shared_memory.SharedMemory(create=True, size=max(source.nbytes, 1))
+        try:
+            view = np.ndarray(source.shape, dtype=source.dtype, buffer=block.buf)
+            view[...] = source
+            spec = (block.name, source.shape, source.dtype)
+            with Pool(min(self.processes, len(clusters)), initializer=_init_worker,
+                      initargs=(spec, self.matrix is not None)) as pool:
+                return pool.map(_solve_cluster, clusters)
+        finally:
+            block.close()
+            block.unlink()
+
+    def solve(self, progress: bool = True) -> dict:
+        start_time = time.time()
+
+        clusters = self.partition()
+        self.timings['partition'] = time.time() - start_time
+        if progress:
+            sizes = [len(c) for c in clusters]
+            print(f"  {len(clusters)} clusters (tamanho mín {min(sizes)}, máx {max(sizes)})")
+
+        step = time.time()
+        if self.processes > 1 and len(clusters) > 1:
+            local_tours = self._solve_clusters_parallel(clusters)
+        else:
+            local_tours = [_solve_subproblem(self.submatrix(cluster)) for cluster in clusters]
+        cycles = [cluster[np.asarray(local)] for cluster, local in zip(clusters, local_tours)]
+        self.timings['clusters'] = time.time() - step
+
+        step = time.time()
+        cluster_order = _solve_subproblem(self._cluster_distances(clusters))
+        self.timings['cluster_order'] = time.time() - step
+
+        step = time.time()
+        pieces = []
+        junctions = []
+        previous = None
+        position = 0
+        for idx, c in enumerate(cluster_order):
+            following = cycles[cluster_order[(idx + 1) % len(cluster_order)]]
+            path = self._open_cycle(cycles[c], previous, following)
+            pieces.append(path)
+            junctions.append(position)
+            position += len(path)
+            previous = int(path[-1])
+        tour = np.concatenate(pieces)
+        self.timings['stitch'] = time.time() - step
+
+        step = time.time()
+        if len(clusters) > 1:
+            tour = self.repair_boundaries(tour, junctions)
+        self.timings['repair'] = time.time() - step
+
+        cost = int(self.distance(tour, np.roll(tour, -1)).sum())
+        start = int(np.flatnonzero(tour == 0)[0])
+        tour = np.roll(tour, -start)
+
+        return {
+            'tour': tour.tolist(),
+            'cost': cost,
+            'n_clusters': len(clusters),
+            'execution_time': time.time() - start_time,
+            'timings': dict(self.timings)
+        }
+
+# Estado de cada processo trabalhador (preenchido por _init_worker)
+_worker = {}
+
+def _init_worker(spec, is_matrix: bool):
+    name, shape, dtype = spec
+    block = shared_memory.SharedMemory(name=name)
+    source = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    _worker['block'] = block
+    if is_matrix:
+        _worker['decomposition'] = TSPClusterDecomposition(matrix=source, processes=1)
+    else:
+        _worker['decomposition'] = TSPClusterDecomposition(coordinates=source, processes=1)
+
+# Monta a submatriz do cluster no próprio trabalhador e a resolve
+def _solve_cluster(cluster: np.ndarray) -> List[int]:
+    return _solve_subproblem(_worker['decomposition'].submatrix(cluster))
+
+# Resolve um subproblema (cluster ou ordem de clusters) com MST + 2-opt;
+# retorna índices locais.
+def _solve_subproblem(matrix: np.ndarray) -> List[int]:
+    n = len(matrix)
+    if n <= 3:
+        return list(range(n))
+    solver = TSPMSTApproximation("<cluster>", matrix=matrix.tolist(), verbose=False)
+    tour = solver.solve()['tour']
+    return TSPLocalSearch(solver.matrix).two_opt(tour)
+
+def load_coordinates(filename: str) -> np.ndarray:
+    return np.loadtxt(filename, dtype=np.float64, ndmin=2)[:, -2:]
+
+def main():
+    parser = argparse.ArgumentParser(description='Decomposição em clusters + costura (instâncias grandes)')
+    parser.add_argument('filename', help='Arquivo TSP (matriz) ou de coordenadas com --coordinates')
+    parser.add_argument('--coordinates', action='store_true', help='Arquivo contém coordenadas "x y" por linha')
+    parser.add_argument('--cluster-size', type=int, default=200, help='Tamanho máximo de cada cluster')
+    parser.add_argument('--method', choices=['auto', 'kmeans', 'grid', 'mst'], default='auto')
+    parser.add_argument('--processes', type=int, default=None, help='Processos (padrão: núcleos)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--check-metric', action='store_true',
+                        help='Verifica a desigualdade triangular antes de declarar a garantia de 2x')
+    args = parser.parse_args()
+
+    if args.coordinates:
+        coordinates = load_coordinates(args.filename)
+        decomposition = TSPClusterDecomposition(coordinates=coordinates, cluster_size=args.cluster_size,
+                                                method=args.method, processes=args.processes, seed=args.seed)
+        reporter = TSPMSTApproximation(args.filename, matrix=[], verbose=False)
+    else:
+        reporter = TSPMSTApproximation(args.filename)
+        decomposition = TSPClusterDecomposition(matrix=reporter.matrix, cluster_size=args.cluster_size,
+                                                method=args.method, processes=args.processes, seed=args.seed)
+
+    print(f"\n=== Decomposição em clusters: {decomposition.n_cities} cidades, "
+          f"método {decomposition.method}, {decomposition.processes} processos ===")
+    outcome = decomposition.solve()
+    for stage, elapsed in outcome['timings'].items():
+        print(f"  {stage}: {elapsed:.3f}s")
+
+    optimal_value = reporter.get_optimal_value()
+    result = {
+        'algorithm': 'CLUSTER_DECOMPOSITION_PYTHON',
+        'filename': args.filename,
+        'n_cities': decomposition.n_cities,
+        'tour': outcome['tour'],
+        'cost': outcome['cost'],
+        'execution_time': outcome['execution_time'],
+        'optimal_value': optimal_value,
+        'approximation_ratio': outcome['cost'] / optimal_value if optimal_value > 0 else None
+    }
+    if args.check_metric:
+        reporter.check_metric(result)
+    reporter.print_results(result)
+    reporter.save_results(result)
+
+if __name__ == "__main__":
+    main()
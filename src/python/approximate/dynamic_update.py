@@ -0,0 +1,188 @@
+import time
+import random
+import heapq
+import argparse
+from typing import List, Optional, Iterable, Tuple
+
+from tour_structure import create_tour
+from local_search import TSPLocalSearch
+
+# Reparo local do tour após mudanças de peso em poucas arestas (ex.: trânsito).
+#
+# A matriz, as listas de candidatos e a estrutura do tour são mantidas entre
+# atualizações. Cada lote de mudanças (i, j, w) corrige a matriz no lugar,
+# ajusta o custo do tour em O(1) por aresta, atualiza as listas de candidatos
+# de i e j e roda o 2-opt apenas a partir das extremidades e de seus vizinhos
+# no tour, sem reconstruir a MST. Assume matriz simétrica, como o 2-opt.
+
+class TSPDynamicTour:
+
+    def __init__(self, matrix, tour: List[int], neighbors: Optional[List[List[int]]] = None,
+                 k: int = 10, radius: int = 2):
+        self.matrix = matrix
+        self.n_cities = len(matrix)
+        self.search = TSPLocalSearch(matrix, neighbors, k)
+        self.neighbors = self.search.neighbors
+        self.k = max((len(row) for row in self.neighbors), default=0)
+        self.radius = radius
+        self.structure = create_tour(tour)
+        self.cost = self.search.tour_cost(tour)
+        self.updates_applied = 0
+
+    def tour(self) -> List[int]:
+        return self.structure.to_list()
+
+    # Mantém a lista de candidatos de `a` ordenada após a mudança de c(a, b)
+    def _update_candidates(self, a: int, b: int):
+        row = self.matrix[a]
+        candidates = self.neighbors[a]
+
+        if b in candidates:
+            candidates.remove(b)
+            if candidates and row[b] > row[candidates[-1]]:
+                # b pode ter saído dos k mais próximos: refaz a lista em O(n)
+                others = (c for c in range(self.n_cities) if c != a)
+                candidates[:] = heapq.nsmallest(self.k, others, key=row.__getitem__)
+                return
+        elif len(candidates) >= self.k and row[b] >= row[candidates[-1]]:
+            return
+
+        position = len(candidates)
+        while position > 0 and row[candidates[position - 1]] > row[b]:
+            position -= 1
+        candidates.insert(position, b)
+        if len(candidates) > self.k:
+            candidates.pop()
+
+    # Cidades a reexaminar: extremidades alteradas e até `radius` vizinhos de
+    # cada lado no tour
+    def _neighborhood(self, cities: Iterable[int]) -> List[int]:
+        active = set()
+        for city in cities:
+            active.add(city)
+            forward = backward = city
+            for _ in range(self.radius):
+                forward = self.structure.next(forward)
+                backward = self.structure.prev(backward)
+                active.add(forward)
+                active.add(backward)
+        return sorted(active)
+
+    # Aplica um lote de mudanças (i, j, w) e reotimiza localmente.
+    # Retorna o novo tour e custo, com estatísticas do reparo.
+    def update_edges(self, changes: Iterable[Tuple[int, int, int]], max_moves: Optional[int] = None,
+                     time_limit: Optional[float] = None) -> dict:
+        start_time = time.time()
+        structure = self.structure
+        matrix = self.matrix
+
+        touched = set()
+        for i, j, weight in changes:
+            if i == j:
+                continue
+            old = matrix[i][j]
+            if old == weight:
+                continue
+            if structure.next(i) == j or structure.prev(i) == j:
+                self.cost += weight - old
+            matrix[i][j] = weight
+            matrix[j][i] = weight
+            self._update_candidates(i, j)
+            self._update_candidates(j, i)
+            touched.add(i)
+            touched.add(j)
+            self.updates_applied += 1
+
+        cost_before = self.cost
+        active = self._neighborhood(touched)
+        moves_before = self.search.moves_applied
+        gain = self.search.optimize(structure, active, max_moves, time_limit) if self.n_cities >= 4 else 0
+        self.cost -= gain
+
+        return {
+            'tour': self.tour(),
+            'cost': self.cost,
+            'cost_before_repair': cost_before,
+            'gain': gain,
+            'moves': self.search.moves_applied - moves_before,
+            'active_cities': len(active),
+            'execution_time': time.time() - start_time
+        }
+
+# Lê mudanças "i j w" (uma por linha; '#' inicia comentário)
+def load_changes(path: str) -> List[Tuple[int, int, int]]:
+    changes = []
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if line:
+                i, j, w = line.split()[:3]
+                changes.append((int(i), int(j), int(float(w))))
+    return changes
+
+# Mudanças aleatórias de tráfego: arestas do tour com peso multiplicado por `factor`
+def random_changes(matrix, tour: List[int], count: int, factor: float,
+                   rng: random.Random) -> List[Tuple[int, int, int]]:
+    n = len(tour)
+    changes = []
+    for position in rng.sample(range(n), min(count, n)):
+        i, j = tour[position], tour[(position + 1) % n]
+        changes.append((i, j, max(1, int(matrix[i][j] * factor))))
+    return changes
+
+def main():
+    parser = argparse.ArgumentParser(description='Reparo local do tour após mudanças de peso')
+    parser.add_argument('filename', help='Arquivo TSP')
+    parser.add_argument('--changes', default=None, help='Arquivo com mudanças "i j w" (um lote)')
+    parser.add_argument('--batches', type=int, default=5, help='Lotes aleatórios (sem --changes)')
+    parser.add_argument('--batch-size', type=int, default=5, help='Arestas alteradas por lote')
+    parser.add_argument('--factor', type=float, default=3.0, help='Multiplicador de peso das mudanças aleatórias')
+    parser.add_argument('--radius', type=int, default=2, help='Vizinhos no tour reexaminados por extremidade')
+    parser.add_argument('--max-moves', type=int, default=None, help='Limite de movimentos por lote')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    from mst_algorithm import TSPMSTApproximation
+    from candidate_index import TSPCandidateIndex
+
+    solver = TSPMSTApproximation(args.filename)
+    result = solver.solve()
+
+    print("Passo 5: Busca local 2-opt...")
+    start_time = time.time()
+    candidates = TSPCandidateIndex.for_instance(solver.filename, solver.matrix, k=10)
+    neighbors = candidates.as_lists()
+    tour = TSPLocalSearch(solver.matrix, neighbors).two_opt(result['tour'])
+    dynamic = TSPDynamicTour(solver.matrix, tour, neighbors, radius=args.radius)
+    print(f"Tour inicial: custo {dynamic.cost} ({time.time() - start_time:.3f}s)")
+
+    rng = random.Random(args.seed)
+    n_batches = 1 if args.changes else args.batches
+    print(f"\n=== Atualizações de peso: {n_batches} lote(s) ===")
+    repair_time = 0.0
+    for number in range(1, n_batches + 1):
+        if args.changes:
+            changes = load_changes(args.changes)
+        else:
+            changes = random_changes(solver.matrix, dynamic.tour(), args.batch_size, args.factor, rng)
+        outcome = dynamic.update_edges(changes, max_moves=args.max_moves)
+        repair_time += outcome['execution_time']
+        print(f"  Lote {number}: {len(changes)} arestas, custo {outcome['cost_before_repair']} -> "
+              f"{outcome['cost']} ({outcome['moves']} movimentos, {outcome['active_cities']} cidades "
+              f"ativas, {outcome['execution_time'] * 1000:.2f} ms)")
+
+    tour = dynamic.tour()
+    start = tour.index(0)
+    result['tour'] = tour[start:] + tour[:start]
+    result['cost'] = dynamic.cost
+    result['execution_time'] = repair_time
+    result['algorithm'] = 'DYNAMIC_2OPT_PYTHON'
+    # A instância foi alterada: o valor ótimo do arquivo não se aplica
+    result['optimal_value'] = -1
+    result['approximation_ratio'] = None
+
+    solver.print_results(result)
+    solver.save_results(result)
+
+if __name__ == "__main__":
+    main()
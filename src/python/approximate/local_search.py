@@ -0,0 +1,192 @@
+import time
+import argparse
+from collections import deque
+from typing import List, Optional, Iterable
+
+from tour_structure import create_tour
+from candidate_index import TSPCandidateIndex
+from lower_bound import TSPHeldKarpBound
+from alpha_nearness import TSPAlphaNearness
+
+class TSPLocalSearch:
+
+    # `sorted_neighbors` indica listas em ordem crescente de distância (kNN), o que
+    # permite encerrar a varredura no primeiro candidato sem ganho; listas por
+    # alpha-proximidade não têm essa propriedade.
+    def __init__(self, matrix, neighbors: Optional[List[List[int]]] = None, k: int = 10,
+                 sorted_neighbors: bool = True):
+        self.matrix = matrix
+        self.n_cities = len(matrix)
+        self.neighbors = neighbors if neighbors is not None else self.nearest_neighbors(k)
+        self.sorted_neighbors = sorted_neighbors or neighbors is None
+        self.moves_applied = 0
+
+    # Lista dos k vizinhos mais próximos de cada cidade (ordem crescente de distância)
+    def nearest_neighbors(self, k: int) -> List[List[int]]:
+        return TSPCandidateIndex.compute(self.matrix, k).as_lists()
+
+    def tour_cost(self, tour: List[int]) -> int:
+        total_cost = 0
+        for i in range(len(tour) - 1):
+            total_cost += self.matrix[tour[i]][tour[i + 1]]
+        total_cost += self.matrix[tour[-1]][tour[0]]
+        return total_cost
+
+    # Tenta um movimento 2-opt envolvendo `a`; retorna (ganho, cidades afetadas) ou None
+    def _improve_city(self, tour, a: int):
+        matrix = self.matrix
+        row_a = matrix[a]
+
+        # Sentido sucessor: arestas (a, b) e (c, d) viram (a, c) e (b, d)
+        b = tour.next(a)
+        d_ab = row_a[b]
+        for c in self.neighbors[a]:
+            d_ac = row_a[c]
+            if d_ac >= d_ab:
+                if self.sorted_neighbors:
+                    break
+                continue
+            d = tour.next(c)
+            if c == b or d == a:
+                continue
+            gain = d_ab + matrix[c][d] - d_ac - matrix[b][d]
+            if gain > 0:
+                tour.reverse(b, c)
+                return gain, (a, b, c, d)
+
+        # Sentido predecessor: arestas (b, a) e (d, c) viram (c, a) e (d, b)
+        b = tour.prev(a)
+        d_ab = matrix[b][a]
+        for c in self.neighbors[a]:
+            d_ac = row_a[c]
+            if d_ac >= d_ab:
+                if self.sorted_neighbors:
+                    break
+                continue
+            d = tour.prev(c)
+            if c == b or d == a:
+                continue
+            gain = d_ab + matrix[d][c] - d_ac - matrix[b][d]
+            if gain > 0:
+                tour.reverse(a, d)
+                return gain, (a, b, c, d)
+
+        return None
+
+    # 2-opt com listas de vizinhos e "don't look bits".
+    # Assume matriz simétrica; `active` restringe as cidades inicialmente examinadas
+    # e `stop_cost` encerra a busca assim que o custo do tour chega a esse valor
+    # (por exemplo, limite inferior de Held-Karp x (1 + gap desejado)).
+    def two_opt(self, tour: List[int], active: Optional[Iterable[int]] = None,
+                max_moves: Optional[int] = None, time_limit: Optional[float] = None,
+                stop_cost: Optional[float] = None) -> List[int]:
+        if self.n_cities < 4:
+            return list(tour)
+
+        structure = create_tour(tour)
+        target_gain = None if stop_cost is None else self.tour_cost(tour) - stop_cost
+        self.optimize(structure, tour if active is None else active,
+                      max_moves, time_limit, target_gain)
+        return structure.to_list()
+
+    # Laço do 2-opt sobre uma estrutura de tour já existente (tour_structure),
+    # que é modificada no lugar. Retorna o ganho total; `target_gain` encerra a
+    # busca quando o ganho acumulado chega a esse valor.
+    def optimize(self, structure, active: Iterable[int], max_moves: Optional[int] = None,
+                 time_limit: Optional[float] = None, target_gain: Optional[float] = None) -> int:
+        start_time = time.time()
+
+        queue = deque(active)
+        in_queue = [False] * self.n_cities
+        for city in queue:
+            in_queue[city] = True
+
+        total_gain = 0
+        moves = 0
+        while queue:
+            a = queue.popleft()
+            in_queue[a] = False
+
+            move = self._improve_city(structure, a)
+            if move is None:
+                continue
+
+            gain, touched = move
+            total_gain += gain
+            moves += 1
+            for city in touched:
+                if not in_queue[city]:
+                    in_queue[city] = True
+                    queue.append(city)
+
+            if max_moves is not None and moves >= max_moves:
+                break
+            if target_gain is not None and total_gain >= target_gain:
+                break
+            if time_limit is not None and moves % 64 == 0 and time.time() - start_time > time_limit:
+                break
+
+        self.moves_applied += moves
+        return total_gain
+
+def main():
+    parser = argparse.ArgumentParser(description='MST + busca local 2-opt')
+    parser.add_argument('filename', help='Arquivo TSP')
+    parser.add_argument('--target-gap', type=float, default=None,
+                        help='Para a busca quando o gap para o limite de Held-Karp fica abaixo deste valor (ex.: 0.05)')
+    parser.add_argument('--candidates', choices=['knn', 'alpha'], default='knn',
+                        help='Vizinhos mais próximos ou alpha-proximidade (1-árvore)')
+    parser.add_argument('-k', type=int, default=None,
+                        help='Candidatos por cidade (padrão: 10 para knn, 5 para alpha)')
+    parser.add_argument('--check-metric', action='store_true',
+                        help='Verifica a desigualdade triangular antes de declarar a garantia de 2x')
+    args = parser.parse_args()
+
+    from mst_algorithm import TSPMSTApproximation
+
+    solver = TSPMSTApproximation(args.filename)
+    result = solver.solve()
+
+    bound = None
+    stop_cost = None
+    if args.target_gap is not None:
+        print("Calculando limite inferior de Held-Karp...")
+        bound = TSPHeldKarpBound(solver.matrix)
+        bound.compute(result['cost'], target_gap=args.target_gap)
+        stop_cost = bound.lower_bound * (1 + args.target_gap)
+
+    print("Passo 5: Busca local 2-opt...")
+    start_time = time.time()
+    if args.candidates == 'alpha':
+        alpha = TSPAlphaNearness(solver.matrix)
+        k = args.k or 5
+        if bound is not None:
+            candidates = alpha.from_one_tree(bound.pi, k)
+        else:
+            candidates = alpha.from_mst(result['mst_edges'], k)
+    else:
+        candidates = TSPCandidateIndex.for_instance(solver.filename, solver.matrix, k=args.k or 10)
+    search = TSPLocalSearch(solver.matrix, candidates.as_lists(),
+                            sorted_neighbors=args.candidates == 'knn')
+    tour = search.two_opt(result['tour'], stop_cost=stop_cost)
+
+    # Mantém a cidade 0 como inicial, como no tour MST
+    start = tour.index(0)
+    result['tour'] = tour[start:] + tour[:start]
+    result['cost'] = search.tour_cost(result['tour'])
+    result['execution_time'] += time.time() - start_time
+    result['algorithm'] = 'MST_2OPT_PYTHON'
+    if result['optimal_value'] > 0:
+        result['approximation_ratio'] = result['cost'] / result['optimal_value']
+    if bound is not None:
+        result['lower_bound'] = bound.lower_bound
+        result['gap'] = bound.gap(result['cost'])
+
+    print(f"Movimentos 2-opt aplicados: {search.moves_applied}")
+    if args.check_metric:
+        solver.check_metric(result)
+    solver.print_results(result)
+    solver.save_results(result)
+
+if __name__ == "__main__":
+    main()
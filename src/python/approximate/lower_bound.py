@@ -0,0 +1,122 @@
+import time
+import sys
+import math
+from typing import Optional
+
+import numpy as np
+
+from vectorized_prim import TSPVectorizedPrim
+
+# Limite inferior de Held-Karp (1-árvore com otimização por subgradiente).
+#
+# Uma 1-árvore é uma MST sobre as cidades 1..n-1 mais as duas arestas mais
+# baratas da cidade 0; todo tour é uma 1-árvore, então seu custo é um limite
+# inferior. As penalidades pi (custo c[i][j] + pi[i] + pi[j]) não mudam o
+# custo relativo dos tours, mas aproximam a 1-árvore de um tour, elevando o
+# limite. Para matrizes assimétricas usa-se min(c[i][j], c[j][i]), que ainda
+# limita inferiormente qualquer tour dirigido.
+
+class TSPHeldKarpBound:
+
+    def __init__(self, matrix):
+        costs = np.asarray(matrix, dtype=np.float64)
+        self.cost = np.minimum(costs, costs.T)
+        self.n_cities = self.cost.shape[0]
+        self.pi = np.zeros(self.n_cities)
+        self.lower_bound = -math.inf
+        self.iterations = 0
+        self.execution_time = 0.0
+
+    # Calcula a 1-árvore para as penalidades `pi`: (custo penalizado, graus, parent)
+    def one_tree(self, pi: np.ndarray):
+        n = self.n_cities
+        parent, order, total = TSPVectorizedPrim.mst(self.cost, root=1, nodes=np.arange(1, n), pi=pi)
+        degree = TSPVectorizedPrim.degrees(parent, order)
+
+        row = self.cost[0, 1:] + pi[1:] + pi[0]
+        first, second = np.argpartition(row, 1)[:2] + 1
+        total += row[first - 1] + row[second - 1]
+        degree[0] = 2
+        degree[first] += 1
+        degree[second] += 1
+        return total, degree, parent, (int(first), int(second))
+
+    # Otimização por subgradiente com passo de Polyak. Para quando o gap em
+    # relação a `upper_bound` fica abaixo de `target_gap`, quando a 1-árvore
+    # vira um tour (limite ótimo) ou quando o passo fica desprezível.
+    def compute(self, upper_bound: float, max_iterations: int = 1000, target_gap: float = 0.0,
+                time_limit: Optional[float] = None, patience: Optional[int] = None) -> float:
+        start_time = time.time()
+        n = self.n_cities
+        if n < 3:
+            self.lower_bound = float(upper_bound)
+            return self.lower_bound
+
+        patience = patience or max(10, min(n // 2, 100))
+        pi = self.pi.copy()
+        best = -math.inf
+        step_scale = 2.0
+        stale = 0
+
+        for iteration in range(1, max_iterations + 1):
+            total, degree, _, _ = self.one_tree(pi)
+            bound = total - 2.0 * pi.sum()
+            self.iterations = iteration
+
+            if bound > best + 1e-9:
+                best = bound
+                self.pi = pi.copy()
+                stale = 0
+            else:
+                stale += 1
+                if stale >= patience:
+                    step_scale /= 2.0
+                    stale = 0
+
+            subgradient = degree - 2
+            norm = float(np.dot(subgradient, subgradient))
+            if norm == 0:
+                # 1-árvore é um tour: o limite é o ótimo
+                break
+            if best > 0 and (upper_bound - best) / best <= target_gap:
+                break
+            if step_scale < 1e-4:
+                break
+            if time_limit is not None and time.time() - start_time > time_limit:
+                break
+
+            step = step_scale * max(upper_bound - bound, 1e-9) / norm
+            pi = pi + step * subgradient
+
+        # Custos inteiros: o limite pode ser arredondado para cima
+        self.lower_bound = math.ceil(best - 1e-6)
+        self.execution_time = time.time() - start_time
+        return self.lower_bound
+
+    # Gap certificado de um tour: (custo - limite) / limite
+    def gap(self, tour_cost: float) -> Optional[float]:
+        if self.lower_bound <= 0:
+            return None
+        return (tour_cost - self.lower_bound) / self.lower_bound
+
+def main():
+    if len(sys.argv) != 2:
+        print("Uso: python lower_bound.py <arquivo_tsp>")
+        sys.exit(1)
+
+    from mst_algorithm import TSPMSTApproximation
+
+    solver = TSPMSTApproximation(sys.argv[1])
+    result = solver.solve()
+
+    print("Calculando limite inferior de Held-Karp...")
+    bound = TSPHeldKarpBound(solver.matrix)
+    bound.compute(result['cost'])
+    result['lower_bound'] = bound.lower_bound
+    result['gap'] = bound.gap(result['cost'])
+
+    print(f"Iterações de subgradiente: {bound.iterations} ({bound.execution_time:.3f}s)")
+    solver.print_results(result)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+import time
+import math
+import argparse
+from typing import List, Optional
+
+import numpy as np
+
+# Metaheurísticas para instâncias médias (50-2000 cidades), partindo do tour MST.
+#
+#   - TSPSimulatedAnnealing: movimentos 2-opt e troca com delta O(1) (só as
+#     arestas afetadas são recalculadas; o tour só é alterado se aceito).
+#   - TSPGeneticAlgorithm: população inteira avaliada por um único gather
+#     NumPy (tour_costs), crossover OX e mutação por inversão.
+# Ambas assumem matriz simétrica e aceitam semente, limite de tempo e
+# registram o histórico de convergência.
+
+# Custo de cada tour (linhas de `population`) em uma única operação vetorizada
+def tour_costs(matrix: np.ndarray, population: np.ndarray) -> np.ndarray:
+    return matrix[population, np.roll(population, -1, axis=1)].sum(axis=1)
+
+class TSPSimulatedAnnealing:
+
+    def __init__(self, matrix, seed: int = 0):
+        self.matrix = np.asarray(matrix, dtype=np.int64)
+        self.rows = self.matrix.tolist()
+        self.n_cities = self.matrix.shape[0]
+        self.rng = np.random.default_rng(seed)
+
+    # Delta de inverter tour[i+1..j] (i < j): arestas (a,b),(c,d) -> (a,c),(b,d).
+    # Com j = n-1 a aresta removida é a de fechamento (tour[n-1], tour[0]).
+    def _two_opt_delta(self, tour: List[int], i: int, j: int) -> int:
+        rows = self.rows
+        n = self.n_cities
+        a, b = tour[i], tour[i + 1]
+        c, d = tour[j], tour[(j + 1) % n]
+        return rows[a][c] + rows[b][d] - rows[a][b] - rows[c][d]
+
+    # Delta de trocar as cidades nas posições i < j (i = 0, j = n-1 são vizinhas no ciclo)
+    def _swap_delta(self, tour: List[int], i: int, j: int) -> int:
+        rows = self.rows
+        n = self.n_cities
+        a, b = tour[i], tour[j]
+        pa, na = tour[i - 1], tour[(i + 1) % n]
+        pb, nb = tour[j - 1], tour[(j + 1) % n]
+        if j == i + 1:
+            return rows[pa][b] + rows[a][nb] - rows[pa][a] - rows[b][nb]
+        if i == 0 and j == n - 1:
+            return rows[b][na] + rows[pb][a] - rows[a][na] - rows[pb][b]
+        return (rows[pa][b] + rows[b][na] + rows[pb][a] + rows[a][nb]
+                - rows[pa][a] - rows[a][na] - rows[pb][b] - rows[b][nb])
+
+    # Temperatura inicial: aceita ~50% das pioras médias de movimentos aleatórios
+    def _initial_temperature(self, tour: List[int], samples: int = 200) -> float:
+        n = self.n_cities
+        worse = []
+        for _ in range(samples):
+            i, j = sorted(self.rng.choice(n, size=2, replace=False).tolist())
+            delta = self._two_opt_delta(tour, i, j)
+            if delta > 0:
+                worse.append(delta)
+        return (sum(worse) / len(worse)) / math.log(2) if worse else 1.0
+
+    def solve(self, initial_tour: List[int], time_limit: float = 10.0,
+              max_iterations: Optional[int] = None, final_temperature: float = 1e-3,
+              swap_probability: float = 0.2, trace_every: int = 10000) -> dict:
+        start_time = time.time()
+        n = self.n_cities
+        tour = list(initial_tour)
+        cost = int(tour_costs(self.matrix, np.array([tour]))[0])
+        best_tour, best_cost = list(tour), cost
+        trace = [(0, 0.0, cost, best_cost)]
+
+        if n < 5:
+            return self._result(best_tour, best_cost, 0, start_time, trace)
+
+        # Resfriamento geométrico ajustado ao orçamento: a temperatura cai de T0
+        # até T0 * final_temperature ao fim do tempo (ou das iterações)
+        initial_temperature = self._initial_temperature(tour)
+        temperature = initial_temperature
+        steps_per_temperature = max(100, 10 * n)
+        iteration = 0
+        batch = 4096
+
+        while True:
+            # Sorteios em lote: evita uma chamada ao gerador por iteração. As
+            # posições cobrem [0, n), então todas as arestas (inclusive a de
+            # fechamento) e todas as cidades podem ser movidas
+            pairs = np.sort(self.rng.integers(0, n, size=(batch, 2)), axis=1).tolist()
+            kinds = (self.rng.random(batch) < swap_probability).tolist()
+            uniforms = self.rng.random(batch).tolist()
+
+            for (i, j), is_swap, u in zip(pairs, kinds, uniforms):
+                iteration += 1
+                if i == j:
+                    continue
+
+                if is_swap:
+                    delta = self._swap_delta(tour, i, j)
+                else:
+                    # Inverter tour[1..n-1] só muda o sentido do ciclo
+                    if i == 0 and j == n - 1:
+                        continue
+                    delta = self._two_opt_delta(tour, i, j)
+
+                if delta <= 0 or u < math.exp(-delta / temperature):
+                    if is_swap:
+                        tour[i], tour[j] = tour[j], tour[i]
+                    else:
+                        tour[i + 1:j + 1] = tour[i + 1:j + 1][::-1]
+                    cost += delta
+                    if cost < best_cost:
+                        best_cost = cost
+                        best_tour = list(tour)
+
+                if iteration % steps_per_temperature == 0:
+                    if max_iterations is not None:
+                        progress = iteration / max_iterations
+                    else:
+                        progress = (time.time() - start_time) / time_limit
+                    temperature = max(initial_temperature * final_temperature ** min(progress, 1.0), 1e-9)
+                if iteration % trace_every == 0:
+                    trace.append((iteration, time.time() - start_time, cost, best_cost))
+
+            if max_iterations is not None and iteration >= max_iterations:
+                break
+            if time.time() - start_time > time_limit:
+                break
+
+        return self._result(best_tour, best_cost, iteration, start_time, trace)
+
+    def _result(self, tour, cost, iterations, start_time, trace) -> dict:
+        return {
+            'tour': tour,
+            'cost': int(cost),
+            'iterations': iterations,
+            'execution_time': time.time() - start_time,
+            'trace': trace
+        }
+
+class TSPGeneticAlgorithm:
+
+    def __init__(self, matrix, population_size: int = 100, seed: int = 0):
+        self.matrix = np.asarray(matrix, dtype=np.int64)
+        self.n_cities = self.matrix.shape[0]
+        self.population_size = population_size
+        self.rng = np.random.default_rng(seed)
+
+    # Inverte um trecho aleatório de cada linha marcada
+    def _mutate(self, population: np.ndarray, mask: np.ndarray):
+        n = self.n_cities
+        for row in np.flatnonzero(mask):
+            i, j = sorted(self.rng.choice(n, size=2, replace=False).tolist())
+            population[row, i:j + 1] = population[row, i:j + 1][::-1]
+
+    # Order crossover (OX): trecho de p1, demais cidades na ordem de p2
+    def _crossover(self, p1: np.ndarray, p2: np.ndarray) -> np.ndarray:
+        n = self.n_cities
+        i, j = sorted(self.rng.choice(n, size=2, replace=False).tolist())
+        child = np.empty(n, dtype=p1.dtype)
+        child[i:j + 1] = p1[i:j + 1]
+        taken = np.zeros(n, dtype=bool)
+        taken[p1[i:j + 1]] = True
+        rest = p2[~taken[p2]]
+        child[:i] = rest[:i]
+        child[j + 1:] = rest[i:]
+        return child
+
+    # População inicial: o tour MST, variações dele por inversões e tours aleatórios
+    def _initial_population(self, initial_tour: List[int]) -> np.ndarray:
+        size, n = self.population_size, self.n_cities
+        population = np.empty((size, n), dtype=np.int64)
+        population[:] = np.asarray(initial_tour)
+        half = size // 2
+        self._mutate(population[1:half], np.ones(max(half - 1, 0), dtype=bool))
+        for row in range(half, size):
+            population[row] = self.rng.permutation(n)
+        return population
+
+    def solve(self, initial_tour: List[int], time_limit: float = 10.0,
+              max_generations: Optional[int] = None, elite: int = 2,
+              tournament: int = 3, mutation_rate: float = 0.2) -> dict:
+        start_time = time.time()
+        size = self.population_size
+        population = self._initial_population(initial_tour)
+        costs = tour_costs(self.matrix, population)
+        trace = [(0, 0.0, int(costs.min()), float(costs.mean()))]
+
+        generation = 0
+        while True:
+            if max_generations is not None and generation >= max_generations:
+                break
+            if time.time() - start_time > time_limit:
+                break
+            generation += 1
+
+            # Seleção por torneio, vetorizada sobre todos os pais
+            contestants = self.rng.integers(0, size, size=(2 * size, tournament))
+            winners = contestants[np.arange(2 * size), costs[contestants].argmin(axis=1)]
+
+            ranked = np.argsort(costs, kind='stable')
+            offspring = np.empty_like(population)
+            offspring[:elite] = population[ranked[:elite]]
+            for child in range(elite, size):
+                offspring[child] = self._crossover(population[winners[2 * child]],
+                                                   population[winners[2 * child + 1]])
+            mutate = self.rng.random(size) < mutation_rate
+            mutate[:elite] = False
+            self._mutate(offspring, mutate)
+
+            population = offspring
+            costs = tour_costs(self.matrix, population)
+            trace.append((generation, time.time() - start_time, int(costs.min()), float(costs.mean())))
+
+        best = int(costs.argmin())
+        return {
+            'tour': population[best].tolist(),
+            'cost': int(costs[best]),
+            'generations': generation,
+            'execution_time': time.time() - start_time,
+            'trace': trace
+        }
+
+def main():
+    parser = argparse.ArgumentParser(description='Recozimento simulado / algoritmo genético a partir do tour MST')
+    parser.add_argument('filename', help='Arquivo TSP')
+    parser.add_argument('--method', choices=['sa', 'ga'], default='sa')
+    parser.add_argument('--time-limit', type=float, default=10.0, help='Orçamento de tempo (s)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--population', type=int, default=100, help='Tamanho da população (ga)')
+    parser.add_argument('--check-metric', action='store_true',
+                        help='Verifica a desigualdade triangular antes de declarar a garantia de 2x')
+    args = parser.parse_args()
+
+    from mst_algorithm import TSPMSTApproximation
+
+    solver = TSPMSTApproximation(args.filename)
+    result = solver.solve()
+    mst_time = result['execution_time']
+
+    if args.method == 'sa':
+        print("Passo 5: Recozimento simulado...")
+        engine = TSPSimulatedAnnealing(solver.matrix, seed=args.seed)
+        outcome = engine.solve(result['tour'], time_limit=args.time_limit)
+        print(f"Iterações: {outcome['iterations']:,}")
+        result['algorithm'] = 'MST_SA_PYTHON'
+    else:
+        print("Passo 5: Algoritmo genético...")
+        engine = TSPGeneticAlgorithm(solver.matrix, args.population, seed=args.seed)
+        outcome = engine.solve(result['tour'], time_limit=args.time_limit)
+        print(f"Gerações: {outcome['generations']:,}")
+        result['algorithm'] = 'MST_GA_PYTHON'
+
+    for step, elapsed, current, best in outcome['trace'][::max(1, len(outcome['trace']) // 10)]:
+        print(f"  [{elapsed:7.2f}s] passo {step:,}: atual {current}, melhor {best}")
+
+    tour = outcome['tour']
+    start = tour.index(0)
+    result['tour'] = tour[start:] + tour[:start]
+    result['cost'] = outcome['cost']
+    result['execution_time'] = mst_time + outcome['execution_time']
+    if result['optimal_value'] > 0:
+        result['approximation_ratio'] = result['cost'] / result['optimal_value']
+
+    if args.check_metric:
+        solver.check_metric(result)
+    solver.print_results(result)
+    solver.save_results(result)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+import os
+import time
+import threading
+import argparse
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# Fecho métrico: substitui c(i, j) pelo menor caminho entre i e j.
+#
+# A garantia de 2x do algoritmo MST só vale com desigualdade triangular, que
+# matrizes derivadas de malha viária costumam violar. Sobre o fecho ela volta
+# a valer, e o ótimo do fecho não é maior que o da matriz original. O tour
+# encontrado no fecho é então expandido: cada aresta que virou atalho é
+# substituída pelo caminho real, que pode repetir cidades.
+#
+# Floyd-Warshall vetorizado: para cada pivô k, as linhas são processadas em
+# blocos (block_size x n cabe na cache) com duas operações NumPy in-place.
+# As faixas de linhas são divididas entre threads (NumPy libera o GIL), com
+# uma barreira por pivô. Não há matriz de predecessores: os caminhos são
+# reconstruídos só para as arestas do tour, comparando fecho e matriz original.
+# O passo é limitado pela banda de memória e o custo é O(n³): de 5 a 15 s para
+# 2000 cidades em um núcleo, conforme a máquina, e 79 s para 5000 cidades em
+# um núcleo (medido). A meta de segundos em 5000 cidades não é atingida: as
+# threads dividem esse tempo no máximo pelo número de núcleos, e menos quando
+# a banda de memória satura. Blocos de 64 linhas foram os mais rápidos medidos
+# (5,0 s contra 6,9 s com 256 linhas em 2000 cidades).
+
+# Verificação da desigualdade triangular sem calcular o fecho: conta os pares
+# (i, j) com c(i, k) + c(k, j) < c(i, j) para pivôs k. Cada pivô custa O(n²);
+# acima de `budget` operações só uma amostra de pivôs é testada, e então um
+# resultado sem violações não prova que a matriz é métrica. Só as linhas dos
+# pivôs são convertidas de uma vez; o resto da matriz (lista ou array) é lido
+# em blocos de `block_size` linhas, sem cópia n x n.
+# Retorna (pares violados, pivôs testados).
+def triangle_violations(matrix, budget: int = 1 << 27, seed: int = 0,
+                        block_size: int = 256) -> Tuple[int, int]:
+    n = len(matrix)
+    if n < 3:
+        return 0, n
+    pivots = min(n, max(1, budget // (n * n)))
+    if pivots < n:
+        order = np.random.default_rng(seed).choice(n, size=pivots, replace=False)
+    else:
+        order = np.arange(n)
+    pivot_rows = np.array([matrix[k] for k in order.tolist()], dtype=np.int64)
+
+    violations = 0
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        rows = np.asarray(matrix[start:stop], dtype=np.int64)
+        through = rows[:, order]
+        shortcut = np.zeros(rows.shape, dtype=bool)
+        candidate = np.empty_like(rows)
+        for index in range(pivots):
+            np.add(through[:, index, None], pivot_rows[index], out=candidate)
+            shortcut |= candidate < rows
+        local = np.arange(stop - start)
+        shortcut[local, local + start] = False
+        violations += int(np.count_nonzero(shortcut))
+    return violations, pivots
+
+class TSPMetricClosure:
+
+    def __init__(self, matrix, block_size: int = 64, threads: Optional[int] = None):
+        self.original = np.asarray(matrix, dtype=np.int64)
+        self.n_cities = self.original.shape[0]
+        self.block_size = block_size
+        self.threads = threads or os.cpu_count() or 1
+        self.closure = None
+        self.violations = 0
+        self.execution_time = 0.0
+
+    @property
+    def is_metric(self) -> bool:
+        return self.violations == 0
+
+    # Relaxa as linhas [start, stop) por todos os pivôs. c(k, k) = 0, então a
+    # linha k não muda no próprio pivô e pode ser lida pelas outras threads.
+    def _relax_rows(self, distances: np.ndarray, start: int, stop: int,
+                    barrier: Optional[threading.Barrier]):
+        n = distances.shape[0]
+        block = self.block_size
+        buffer = np.empty((min(block, stop - start), n), dtype=distances.dtype)
+
+        for k in range(n):
+            if barrier is not None:
+                barrier.wait()
+            pivot_row = distances[k]
+            for s in range(start, stop, block):
+                e = min(s + block, stop)
+                rows = distances[s:e]
+                candidate = buffer[:e - s]
+                np.add(rows[:, k, None], pivot_row, out=candidate)
+                np.minimum(rows, candidate, out=rows)
+
+    # Calcula o fecho métrico e conta os pares (i, j) que tinham atalho
+    def compute(self) -> np.ndarray:
+        start_time = time.time()
+        n = self.n_cities
+
+        # int32 quando a soma de duas distâncias cabe (metade da banda de memória)
+        largest = int(self.original.max()) if n else 0
+        dtype = np.int32 if 2 * largest < np.iinfo(np.int32).max else np.int64
+        distances = self.original.astype(dtype)
+        np.fill_diagonal(distances, 0)
+
+        threads = max(1, min(self.threads, n // self.block_size))
+        if threads == 1:
+            self._relax_rows(distances, 0, n, None)
+        else:
+            bounds = np.linspace(0, n, threads + 1).astype(int).tolist()
+            barrier = threading.Barrier(threads)
+            workers = [threading.Thread(target=self._relax_rows,
+                                        args=(distances, bounds[t], bounds[t + 1], barrier))
+                       for t in range(threads)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+
+        self.closure = distances.astype(np.int64)
+        np.fill_diagonal(self.closure, np.diagonal(self.original))
+        off_diagonal = ~np.eye(n, dtype=bool)
+        self.violations = int(np.count_nonzero((self.closure < self.original) & off_diagonal))
+        self.execution_time = time.time() - start_time
+        return self.closure
+
+    # Caminho real de i até j (inclui os extremos): a cada passo escolhe um
+    # vizinho m com c(atual, m) + fecho(m, j) = fecho(atual, j)
+    def expand_path(self, i: int, j: int) -> List[int]:
+        closure = self.closure
+        original = self.original
+        path = [i]
+        visited = {i}
+        current = i
+
+        while current != j:
+            if original[current, j] == closure[current, j]:
+                path.append(j)
+                break
+            hops = np.flatnonzero(original[current] + closure[:, j] == closure[current, j])
+            current = next(int(m) for m in hops.tolist() if m not in visited)
+            path.append(current)
+            visited.add(current)
+        return path
+
+    # Expande um tour do fecho em um circuito sobre arestas reais; retorna o
+    # circuito (sem repetir a cidade inicial no fim) e o número de atalhos
+    def expand_tour(self, tour: List[int]):
+        route = []
+        shortcuts = 0
+        for a, b in zip(tour, tour[1:] + tour[:1]):
+            path = self.expand_path(a, b)
+            if len(path) > 2:
+                shortcuts += 1
+            route.extend(path[:-1])
+        return route, shortcuts
+
+    def route_cost(self, route: List[int]) -> int:
+        route = np.asarray(route)
+        return int(self.original[route, np.roll(route, -1)].sum())
+
+def main():
+    parser = argparse.ArgumentParser(description='Algoritmo MST sobre o fecho métrico da matriz')
+    parser.add_argument('filename', help='Arquivo TSP')
+    parser.add_argument('--threads', type=int, default=None, help='Threads do Floyd-Warshall (padrão: núcleos)')
+    parser.add_argument('--block-size', type=int, default=64, help='Linhas por bloco')
+    args = parser.parse_args()
+
+    from mst_algorithm import TSPMSTApproximation
+
+    solver = TSPMSTApproximation(args.filename)
+
+    print("Passo 0: Fecho métrico (Floyd-Warshall vetorizado)...")
+    metric = TSPMetricClosure(solver.matrix, args.block_size, args.threads)
+    closure = metric.compute()
+    print(f"Violações da desigualdade triangular: {metric.violations} pares "
+          f"({metric.execution_time:.3f}s)")
+
+    if metric.is_metric:
+        result = solver.solve()
+        result['execution_time'] += metric.execution_time
+        result['is_metric'] = True
+    else:
+        closure_solver = TSPMSTApproximation(solver.filename, matrix=closure.tolist())
+        result = closure_solver.solve()
+
+        print("Passo 5: Expandindo atalhos em caminhos reais...")
+        start_time = time.time()
+        route, shortcuts = metric.expand_tour(result['tour'])
+        result['route'] = route
+        result['cost'] = metric.route_cost(route)
+        result['execution_time'] += metric.execution_time + time.time() - start_time
+        # O tour foi construído sobre o fecho (métrico); o circuito expandido
+        # custa o mesmo e o ótimo do fecho não excede o da matriz original,
+        # então a garantia de 2x vale
+        result['is_metric'] = True
+        result['algorithm'] = 'METRIC_CLOSURE_MST_PYTHON'
+        if result['optimal_value'] > 0:
+            result['approximation_ratio'] = result['cost'] / result['optimal_value']
+        print(f"Atalhos expandidos: {shortcuts} ({len(route) - solver.n_cities} visitas repetidas)")
+
+    result['triangle_violations'] = metric.violations
+    solver.print_results(result)
+    solver.save_results(result)
+
+if __name__ == "__main__":
+    main()
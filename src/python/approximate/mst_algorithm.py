@@ -1,17 +1,31 @@
 import time
 import sys
 import os
+import argparse
 from typing import List, Tuple, Optional
 import heapq
 from collections import defaultdict
 
+from metric_closure import triangle_violations
+
 class TSPMSTApproximation:
     
-    def __init__(self, filename: str):
+    # `matrix` permite resolver uma instância já em memória (ex.: subproblemas
+    # da decomposição); nesse caso `filename` serve apenas como identificação.
+    def __init__(self, filename: str, matrix: Optional[List[List[int]]] = None, verbose: bool = True):
         self.filename = filename
         self.matrix = []
         self.n_cities = 0
-        self.load_tsp_file()
+        self.verbose = verbose
+        if matrix is None:
+            self.load_tsp_file()
+        else:
+            self.matrix = [[int(value) for value in row] for row in matrix]
+            self.n_cities = len(self.matrix)
+    
+    def log(self, message: str):
+        if self.verbose:
+            print(message)
         
     def load_tsp_file(self):
         try:
@@ -67,7 +81,7 @@ class TSPMSTApproximation:
                 if not visited[next_v]:
                     heapq.heappush(min_heap, (self.matrix[v][next_v], next_v, v))
         
-        print(f"MST construída com peso total: {total_weight}")
+        self.log(f"MST construída com peso total: {total_weight}")
         return mst_edges
     
     def build_adjacency_list(self, mst_edges: List[Tuple[int, int, int]]) -> defaultdict:
@@ -108,19 +122,19 @@ class TSPMSTApproximation:
     
     # Algoritmo MST - Aproximação com garantia de 2x o ótimo
     def solve(self) -> dict:
-        print(f"\n=== Iniciando algoritmo MST para {self.n_cities} cidades ===")
+        self.log(f"\n=== Iniciando algoritmo MST para {self.n_cities} cidades ===")
         start_time = time.time()
         
-        print("Passo 1: Construindo MST...")
+        self.log("Passo 1: Construindo MST...")
         mst_edges = self.find_mst_prim()
         
-        print("Passo 2: Construindo lista de adjacência...")
+        self.log("Passo 2: Construindo lista de adjacência...")
         adj_list = self.build_adjacency_list(mst_edges)
         
-        print("Passo 3: Executando DFS preorder...")
+        self.log("Passo 3: Executando DFS preorder...")
         tour = self.dfs_preorder(adj_list)
         
-        print("Passo 4: Calculando custo do tour...")
+        self.log("Passo 4: Calculando custo do tour...")
         tour_cost = self.calculate_tour_cost(tour)
         
         end_time = time.time()
@@ -154,149 +168,17 @@ class TSPMSTApproximation:
             pass
         return -1
     
-    def print_results(self, result: dict):
-        print(f"\n=== RESULTADOS MST APROXIMATIVO ===")
-        print(f"Arquivo: {result['filename']}")
-        print(f"Número de cidades: {result['n_cities']}")
-        print(f"Custo aproximado: {result['cost']}")
-        print(f"Tempo de execução: {result['execution_time']:.6f} segundos")
-        print(f"Tour: {' -> '.join(map(str, result['tour']))} -> {result['tour'][0]}")
-        
-        if result['optimal_value'] > 0:
-            ratio = result['approximation_ratio']
-            print(f"Valor ótimo esperado: {result['optimal_value']}")
-            print(f"Razão de aproximação: {ratio:.3f}")
-            print(f"Qualidade: {ratio * 100:.1f}% do ótimo")
-            
-            if ratio <= 2.0:
-                print("✓ Garantia teórica respeitada (≤ 2x ótimo)")
-            else:
-                print("⚠ Razão acima da garantia teórica")
-    
-    def save_results(self, result: dict, output_file: str = "results/approximate_results.txt"):
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        
-        try:
-            with open(output_file, 'a') as f:
-                f.write(f"{result['filename']},{result['n_cities']},{result['cost']},"
-                       f"{result['execution_time']:.6f},{result['algorithm']},"
-                       f"{result['optimal_value']},{result['approximation_ratio']:.3f}\n")
-        except Exception as e:
-            print(f"Erro ao salvar resultados: {e}")
-            try:
-                alt_path = "../../results/approximate_results.txt"
-                os.makedirs(os.path.dirname(alt_path), exist_ok=True)
-                with open(alt_path, 'a') as f:
-                    f.write(f"{result['filename']},{result['n_cities']},{result['cost']},"
-                           f"{result['execution_time']:.6f},{result['algorithm']},"
-                           f"{result['optimal_value']},{result['approximation_ratio']:.3f}\n")
-                print(f"Salvo em path alternativo: {alt_path}")
-            except Exception as e2:
-                print(f"Erro também no path alternativo: {e2}")
-
-def main():
-    if len(sys.argv) != 2:
-        print("Uso: python mst_algorithm.py <arquivo_tsp>")
-        sys.exit(1)
-    
-    filename = sys.argv[1]
-    
-    try:
-        solver = TSPMSTApproximation(filename)
-        result = solver.solve()
-        solver.print_results(result)
-        solver.save_results(result)
-        
-    except Exception as e:
-        print(f"Erro durante execução: {e}")
-        import traceback
-        traceback.print_exc()
-
-if __name__ == "__main__":
-    main()
-    
-    def build_adjacency_list(self, mst_edges: List[Tuple[int, int, int]]) -> defaultdict:
-        adj_list = defaultdict(list)
-        
-        for u, v, weight in mst_edges:
-            adj_list[u].append(v)
-            adj_list[v].append(u)
-            
-        return adj_list
-    
-    def dfs_preorder(self, adj_list: defaultdict, start: int = 0) -> List[int]:
-        visited = [False] * self.n_cities
-        tour = []
-        
-        def dfs(vertex):
-            visited[vertex] = True
-            tour.append(vertex)
-            
-            for neighbor in adj_list[vertex]:
-                if not visited[neighbor]:
-                    dfs(neighbor)
-        
-        dfs(start)
-        return tour
-    
-    def calculate_tour_cost(self, tour: List[int]) -> int:
-        if len(tour) != self.n_cities:
-            raise ValueError(f"Tour incompleto: {len(tour)} != {self.n_cities}")
-            
-        total_cost = 0
-        for i in range(len(tour) - 1):
-            total_cost += self.matrix[tour[i]][tour[i + 1]]
-        
-        total_cost += self.matrix[tour[-1]][tour[0]]
-        
-        return total_cost
-    
-    def solve(self) -> dict:
-        print(f"\n=== Iniciando algoritmo MST para {self.n_cities} cidades ===")
-        start_time = time.time()
-        
-        print("Passo 1: Construindo MST...")
-        mst_edges = self.find_mst_prim()
-        
-        print("Passo 2: Construindo lista de adjacência...")
-        adj_list = self.build_adjacency_list(mst_edges)
-        
-        print("Passo 3: Executando DFS preorder...")
-        tour = self.dfs_preorder(adj_list)
-        
-        print("Passo 4: Calculando custo do tour...")
-        tour_cost = self.calculate_tour_cost(tour)
-        
-        end_time = time.time()
-        execution_time = end_time - start_time
-        
-        optimal_value = self.get_optimal_value()
-        
-        result = {
-            'algorithm': 'MST_APPROXIMATION_PYTHON',
-            'filename': self.filename,
-            'n_cities': self.n_cities,
-            'tour': tour,
-            'cost': tour_cost,
-            'execution_time': execution_time,
-            'optimal_value': optimal_value,
-            'approximation_ratio': tour_cost / optimal_value if optimal_value > 0 else None,
-            'mst_edges': mst_edges
-        }
-        
-        return result
-    
-    def get_optimal_value(self) -> int:
-        try:
-            filename = self.filename.split('/')[-1]
-            if '_' in filename and '.' in filename:
-                underscore_pos = filename.rfind('_')
-                dot_pos = filename.rfind('.')
-                if underscore_pos < dot_pos:
-                    return int(filename[underscore_pos + 1:dot_pos])
-        except:
-            pass
-        return -1
+    # Preenche is_metric (e as violações) para resultados sobre esta matriz que
+    # ainda não o trazem; a verificação é amostral em matrizes grandes. Opcional
+    # (--check-metric nas linhas de comando): custa O(n²) por pivô testado.
+    def check_metric(self, result: dict):
+        if 'is_metric' in result or not self.matrix:
+            return
+        violations, pivots = triangle_violations(self.matrix)
+        result['is_metric'] = violations == 0
+        result['triangle_violations'] = violations
+        if pivots < self.n_cities:
+            self.log(f"Desigualdade triangular verificada por amostragem ({pivots} de {self.n_cities} pivôs)")
     
     def print_results(self, result: dict):
         print(f"\n=== RESULTADOS MST APROXIMATIVO ===")
@@ -312,19 +194,32 @@ if __name__ == "__main__":
             print(f"Razão de aproximação: {ratio:.3f}")
             print(f"Qualidade: {ratio * 100:.1f}% do ótimo")
             
-            if ratio <= 2.0:
+            # A garantia de 2x pressupõe desigualdade triangular (ver metric_closure.py)
+            if not result.get('is_metric', True):
+                print(f"⚠ Matriz viola a desigualdade triangular ({result['triangle_violations']} pares): "
+                      "garantia de 2x não se aplica (ver metric_closure.py)")
+            elif ratio <= 2.0:
                 print("✓ Garantia teórica respeitada (≤ 2x ótimo)")
             else:
                 print("⚠ Razão acima da garantia teórica")
+
+        # Limite inferior de Held-Karp (lower_bound.py): certifica o gap sem ótimo conhecido
+        if result.get('lower_bound') is not None:
+            print(f"Limite inferior (Held-Karp): {result['lower_bound']}")
+            if result.get('gap') is not None:
+                print(f"Gap certificado: {result['gap'] * 100:.2f}%")
     
     def save_results(self, result: dict, output_file: str = "results/approximate_results.txt"):
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        # Razão vazia quando não há valor ótimo de referência
+        ratio = result['approximation_ratio']
+        ratio_text = f"{ratio:.3f}" if ratio is not None else ""
         
         try:
             with open(output_file, 'a') as f:
                 f.write(f"{result['filename']},{result['n_cities']},{result['cost']},"
                        f"{result['execution_time']:.6f},{result['algorithm']},"
-                       f"{result['optimal_value']},{result['approximation_ratio']:.3f}\n")
+                       f"{result['optimal_value']},{ratio_text}\n")
         except Exception as e:
             print(f"Erro ao salvar resultados: {e}")
             try:
@@ -333,21 +228,23 @@ if __name__ == "__main__":
                 with open(alt_path, 'a') as f:
                     f.write(f"{result['filename']},{result['n_cities']},{result['cost']},"
                            f"{result['execution_time']:.6f},{result['algorithm']},"
-                           f"{result['optimal_value']},{result['approximation_ratio']:.3f}\n")
+                           f"{result['optimal_value']},{ratio_text}\n")
                 print(f"Salvo em path alternativo: {alt_path}")
             except Exception as e2:
                 print(f"Erro também no path alternativo: {e2}")
 
 def main():
-    if len(sys.argv) != 2:
-        print("Uso: python mst_algorithm.py <arquivo_tsp>")
-        sys.exit(1)
-    
-    filename = sys.argv[1]
+    parser = argparse.ArgumentParser(description='Algoritmo aproximativo MST (2x em matriz métrica)')
+    parser.add_argument('filename', help='Arquivo TSP')
+    parser.add_argument('--check-metric', action='store_true',
+                        help='Verifica a desigualdade triangular antes de declarar a garantia de 2x')
+    args = parser.parse_args()
     
     try:
-        solver = TSPMSTApproximation(filename)
+        solver = TSPMSTApproximation(args.filename)
         result = solver.solve()
+        if args.check_metric:
+            solver.check_metric(result)
         solver.print_results(result)
         solver.save_results(result)
         
@@ -357,4 +254,4 @@ def main():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,201 @@
+import time
+import os
+import argparse
+import random
+from multiprocessing import Pool, shared_memory
+from typing import List, Optional
+
+import numpy as np
+
+from vectorized_prim import TSPVectorizedPrim
+from candidate_index import TSPCandidateIndex
+from local_search import TSPLocalSearch
+
+# Multi-start paralelo: N partidas independentes (raiz aleatória, pesos
+# perturbados, ordem aleatória dos filhos na DFS), cada uma seguida de 2-opt.
+# A matriz e o índice de candidatos ficam em memória compartilhada; cada
+# processo apenas mapeia os buffers, sem cópia: o 2-opt lê a matriz direto da
+# view NumPy (uma cópia em listas Python custaria ~8x os bytes int64 por
+# processo).
+
+# Estado de cada processo trabalhador (preenchido por _init_worker)
+_worker = {}
+
+def _attach(name: str, shape, dtype):
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+def _init_worker(matrix_spec, neighbors_spec, perturbation: float):
+    matrix_block, matrix = _attach(*matrix_spec)
+    neighbors_block, neighbors = _attach(*neighbors_spec)
+    _worker['blocks'] = (matrix_block, neighbors_block)
+    _worker['matrix'] = matrix
+    _worker['search'] = TSPLocalSearch(matrix, neighbors.tolist())
+    _worker['perturbation'] = perturbation
+
+# Constrói o tour MST de uma partida. A primeira partida é determinística (raiz
+# 0, sem perturbação, filhos na ordem de inclusão no Prim): a mesma construção
+# do TSPMSTApproximation, mas com o Prim vetorizado em O(n²) em vez do heap.
+# Com arestas de mesmo peso a árvore escolhida pode diferir, e então o tour
+# também; a garantia de 2x em matriz métrica vale igualmente.
+def _mst_tour(cost: np.ndarray, seed: int, deterministic: bool, perturbation: float) -> List[int]:
+    n = cost.shape[0]
+    rng = random.Random(seed)
+
+    if deterministic:
+        root, pi = 0, None
+    else:
+        root = rng.randrange(n)
+        # Penalidades de vértice perturbam c[i][j] + pi[i] + pi[j] em O(n)
+        scale = perturbation * float(cost.mean())
+        pi = np.array([rng.uniform(-scale, scale) for _ in range(n)])
+
+    parent, order, _ = TSPVectorizedPrim.mst(cost, root=root, pi=pi)
+
+    children = [[] for _ in range(n)]
+    for v in order[1:].tolist():
+        children[parent[v]].append(v)
+    if not deterministic:
+        for child_list in children:
+            rng.shuffle(child_list)
+
+    tour = []
+    stack = [root]
+    while stack:
+        v = stack.pop()
+        tour.append(v)
+        stack.extend(reversed(children[v]))
+    return tour
+
+def _run_start(task) -> dict:
+    index, seed = task
+    start_time = time.time()
+    search = _worker['search']
+    tour = _mst_tour(_worker['matrix'], seed, index == 0, _worker['perturbation'])
+    mst_cost = search.tour_cost(tour)
+
+    moves_before = search.moves_applied
+    tour = search.two_opt(tour)
+    start = tour.index(0)
+    tour = tour[start:] + tour[:start]
+
+    return {
+        'seed': seed,
+        'tour': tour,
+        'cost': int(search.tour_cost(tour)),
+        'mst_cost': int(mst_cost),
+        'moves': search.moves_applied - moves_before,
+        'time': time.time() - start_time,
+        'pid': os.getpid()
+    }
+
+class TSPMultiStart:
+
+    def __init__(self, matrix, n_starts: int = 16, processes: Optional[int] = None,
+                 k: int = 10, perturbation: float = 0.1, seed: int = 0,
+                 candidates: Optional[TSPCandidateIndex] = None):
+        self.matrix = np.ascontiguousarray(np.asarray(matrix, dtype=np.int64))
+        self.n_cities = self.matrix.shape[0]
+        self.n_starts = n_starts
+        self.processes = processes or os.cpu_count() or 1
+        self.perturbation = perturbation
+        self.seed = seed
+        self.candidates = candidates or TSPCandidateIndex.compute(self.matrix, k)
+
+    @staticmethod
+    def _share(array: np.ndarray):
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+        view[...] = array
+        return block, (block.name, array.shape, array.dtype)
+
+    # Executa as partidas e retorna a melhor, com estatísticas de cada uma
+    def solve(self, progress: bool = True) -> dict:
+        start_time = time.time()
+        tasks = [(i, self.seed + i) for i in range(self.n_starts)]
+
+        matrix_block, matrix_spec = self._share(self.matrix)
+        neighbors_block, neighbors_spec = self._share(self.candidates.neighbors)
+        starts = []
+        try:
+            with Pool(self.processes, initializer=_init_worker,
+                      initargs=(matrix_spec, neighbors_spec, self.perturbation)) as pool:
+                for result in pool.imap_unordered(_run_start, tasks):
+                    starts.append(result)
+                    if progress:
+                        print(f"  Partida {result['seed']}: MST {result['mst_cost']} -> "
+                              f"2-opt {result['cost']} ({result['time']:.3f}s, pid {result['pid']})")
+        finally:
+            matrix_block.close()
+            matrix_block.unlink()
+            neighbors_block.close()
+            neighbors_block.unlink()
+
+        # Desempate determinístico pela semente
+        best = min(starts, key=lambda r: (r['cost'], r['seed']))
+        costs = [r['cost'] for r in starts]
+        starts.sort(key=lambda r: r['seed'])
+
+        return {
+            'tour': best['tour'],
+            'cost': best['cost'],
+            'best_seed': best['seed'],
+            'execution_time': time.time() - start_time,
+            'statistics': {
+                'starts': len(starts),
+                'processes': self.processes,
+                'best': min(costs),
+                'worst': max(costs),
+                'mean': sum(costs) / len(costs),
+                'cpu_time': sum(r['time'] for r in starts)
+            },
+            'per_start': [{key: value for key, value in r.items() if key != 'tour'} for r in starts]
+        }
+
+def main():
+    parser = argparse.ArgumentParser(description='Multi-start paralelo (MST aleatorizado + 2-opt)')
+    parser.add_argument('filename', help='Arquivo TSP')
+    parser.add_argument('--starts', type=int, default=16, help='Número de partidas')
+    parser.add_argument('--processes', type=int, default=None, help='Processos (padrão: núcleos)')
+    parser.add_argument('--seed', type=int, default=0, help='Semente inicial')
+    parser.add_argument('--perturbation', type=float, default=0.1,
+                        help='Amplitude da perturbação dos pesos (fração do custo médio)')
+    parser.add_argument('--check-metric', action='store_true',
+                        help='Verifica a desigualdade triangular antes de declarar a garantia de 2x')
+    args = parser.parse_args()
+
+    from mst_algorithm import TSPMSTApproximation
+
+    solver = TSPMSTApproximation(args.filename)
+    candidates = TSPCandidateIndex.for_instance(solver.filename, solver.matrix, k=10)
+    multistart = TSPMultiStart(solver.matrix, args.starts, args.processes,
+                               perturbation=args.perturbation, seed=args.seed,
+                               candidates=candidates)
+
+    print(f"\n=== Multi-start: {args.starts} partidas em {multistart.processes} processos ===")
+    outcome = multistart.solve()
+    stats = outcome['statistics']
+
+    optimal_value = solver.get_optimal_value()
+    result = {
+        'algorithm': 'MULTISTART_MST_2OPT_PYTHON',
+        'filename': solver.filename,
+        'n_cities': solver.n_cities,
+        'tour': outcome['tour'],
+        'cost': outcome['cost'],
+        'execution_time': outcome['execution_time'],
+        'optimal_value': optimal_value,
+        'approximation_ratio': outcome['cost'] / optimal_value if optimal_value > 0 else None
+    }
+
+    print(f"Melhor partida: semente {outcome['best_seed']}")
+    print(f"Custos: melhor {stats['best']}, média {stats['mean']:.1f}, pior {stats['worst']}")
+    print(f"Tempo de CPU somado: {stats['cpu_time']:.3f}s "
+          f"(paralelismo efetivo {stats['cpu_time'] / outcome['execution_time']:.1f}x)")
+    if args.check_metric:
+        solver.check_metric(result)
+    solver.print_results(result)
+    solver.save_results(result)
+
+if __name__ == "__main__":
+    main()
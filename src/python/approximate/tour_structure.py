@@ -0,0 +1,204 @@
+import math
+from typing import List
+
+# Estruturas de tour para busca local.
+#
+# Ambas expõem a mesma interface (next, prev, between, sequence, reverse,
+# to_list), permitindo que a busca local funcione sem saber qual
+# representação está em uso:
+#   - TSPArrayTour: vetor de ordem + vetor de posições. next/prev/between em
+#     O(1), reversão O(n) (inverte sempre o lado mais curto do ciclo).
+#   - TSPTwoLevelList: lista duplamente encadeada em dois níveis (segmentos de
+#     ~sqrt(n) cidades com bit de reversão). next/prev/between em O(1),
+#     reversão em O(sqrt(n)) amortizado.
+
+
+class TSPArrayTour:
+
+    def __init__(self, tour: List[int]):
+        self.n = len(tour)
+        self.order = list(tour)
+        self.pos = [0] * self.n
+        for i, city in enumerate(self.order):
+            self.pos[city] = i
+
+    def next(self, city: int) -> int:
+        i = self.pos[city] + 1
+        return self.order[i if i < self.n else 0]
+
+    def prev(self, city: int) -> int:
+        return self.order[self.pos[city] - 1]
+
+    # Posição da cidade no sentido de percurso do tour
+    def sequence(self, city: int) -> int:
+        return self.pos[city]
+
+    # True se b está no caminho a -> ... -> c (sentido de percurso)
+    def between(self, a: int, b: int, c: int) -> bool:
+        pa, pb, pc = self.pos[a], self.pos[b], self.pos[c]
+        if pa <= pc:
+            return pa <= pb <= pc
+        return pb >= pa or pb <= pc
+
+    # Inverte o caminho a -> ... -> b (sentido de percurso)
+    def reverse(self, a: int, b: int):
+        n = self.n
+        i, j = self.pos[a], self.pos[b]
+        length = (j - i) % n + 1
+
+        # Inverter o complemento produz o mesmo ciclo (sentido oposto)
+        if 2 * length > n:
+            i, j = (j + 1) % n, (i - 1) % n
+            length = n - length
+
+        order, pos = self.order, self.pos
+        if i <= j:
+            order[i:j + 1] = order[i:j + 1][::-1]
+            for k in range(i, j + 1):
+                pos[order[k]] = k
+            return
+
+        # Caminho dá a volta no vetor: troca elemento a elemento
+        for _ in range(length // 2):
+            ci, cj = order[i], order[j]
+            order[i], order[j] = cj, ci
+            pos[cj], pos[ci] = i, j
+            i = i + 1 if i + 1 < n else 0
+            j = j - 1 if j > 0 else n - 1
+
+    def to_list(self) -> List[int]:
+        return list(self.order)
+
+
+class _Segment:
+    __slots__ = ('cities', 'reversed', 'rank')
+
+    def __init__(self, cities: List[int], rank: int):
+        self.cities = cities
+        self.reversed = False
+        self.rank = rank
+
+
+class TSPTwoLevelList:
+
+    def __init__(self, tour: List[int], group_size: int = 0):
+        self.n = len(tour)
+        self.group_size = group_size or max(8, int(math.sqrt(self.n)))
+        self.parent: List[_Segment] = [None] * self.n
+        self.index = [0] * self.n
+        self.segments: List[_Segment] = []
+        self._rebuild(list(tour))
+
+    # Redistribui as cidades em segmentos de tamanho group_size
+    def _rebuild(self, tour: List[int]):
+        size = self.group_size
+        self.segments = []
+        for rank, start in enumerate(range(0, self.n, size)):
+            segment = _Segment(tour[start:start + size], rank)
+            self.segments.append(segment)
+            self._adopt(segment)
+        # Reversões criam segmentos novos; reconstrói ao passar deste limite
+        self.max_segments = 2 * len(self.segments) + 4
+
+    def _adopt(self, segment: _Segment):
+        parent, index = self.parent, self.index
+        for i, city in enumerate(segment.cities):
+            parent[city] = segment
+            index[city] = i
+
+    def _first(self, segment: _Segment) -> int:
+        return segment.cities[-1] if segment.reversed else segment.cities[0]
+
+    def _last(self, segment: _Segment) -> int:
+        return segment.cities[0] if segment.reversed else segment.cities[-1]
+
+    def next(self, city: int) -> int:
+        segment = self.parent[city]
+        i = self.index[city]
+        if segment.reversed:
+            if i > 0:
+                return segment.cities[i - 1]
+        elif i + 1 < len(segment.cities):
+            return segment.cities[i + 1]
+        rank = segment.rank + 1
+        return self._first(self.segments[rank if rank < len(self.segments) else 0])
+
+    def prev(self, city: int) -> int:
+        segment = self.parent[city]
+        i = self.index[city]
+        if segment.reversed:
+            if i + 1 < len(segment.cities):
+                return segment.cities[i + 1]
+        elif i > 0:
+            return segment.cities[i - 1]
+        return self._last(self.segments[segment.rank - 1])
+
+    # Par (rank do segmento, posição no segmento) no sentido de percurso
+    def sequence(self, city: int):
+        segment = self.parent[city]
+        i = self.index[city]
+        if segment.reversed:
+            i = len(segment.cities) - 1 - i
+        return segment.rank, i
+
+    def between(self, a: int, b: int, c: int) -> bool:
+        sa, sb, sc = self.sequence(a), self.sequence(b), self.sequence(c)
+        if sa <= sc:
+            return sa <= sb <= sc
+        return sb >= sa or sb <= sc
+
+    # Divide o segmento de `city` para que `city` passe a iniciar um segmento
+    def _split_before(self, city: int):
+        segment = self.parent[city]
+        k = self.sequence(city)[1]
+        if k == 0:
+            return
+        ordered = segment.cities[::-1] if segment.reversed else segment.cities
+        left = _Segment(ordered[:k], segment.rank)
+        right = _Segment(ordered[k:], segment.rank + 1)
+        self.segments[segment.rank:segment.rank + 1] = [left, right]
+        self._adopt(left)
+        self._adopt(right)
+        for rank in range(segment.rank + 2, len(self.segments)):
+            self.segments[rank].rank = rank
+
+    # Inverte o caminho a -> ... -> b (sentido de percurso)
+    def reverse(self, a: int, b: int):
+        if a == b:
+            return
+        if len(self.segments) + 2 > self.max_segments:
+            self._rebuild(self.to_list())
+
+        after_b = self.next(b)
+        if after_b == a:
+            # Caminho cobre o tour inteiro: o ciclo não muda
+            return
+        self._split_before(a)
+        self._split_before(after_b)
+
+        first = self.parent[a].rank
+        last = self.parent[b].rank
+        if first > last:
+            # Caminho dá a volta; o complemento é contíguo e equivalente
+            first, last = self.parent[after_b].rank, self.parent[self.prev(a)].rank
+
+        block = self.segments[first:last + 1]
+        block.reverse()
+        self.segments[first:last + 1] = block
+        for rank in range(first, last + 1):
+            segment = self.segments[rank]
+            segment.rank = rank
+            segment.reversed = not segment.reversed
+
+    def to_list(self) -> List[int]:
+        tour = []
+        for segment in self.segments:
+            tour.extend(segment.cities[::-1] if segment.reversed else segment.cities)
+        return tour
+
+
+# Escolhe a representação adequada ao tamanho do tour
+def create_tour(tour: List[int], two_level_threshold: int = 1000):
+    if len(tour) >= two_level_threshold:
+        return TSPTwoLevelList(tour)
+    return TSPArrayTour(tour)
@@ -0,0 +1,53 @@
+import numpy as np
+
+# Prim em O(n²) com a atualização de chaves vetorizada em NumPy.
+# Cada iteração é uma operação sobre uma linha da matriz, então o laço Python
+# tem apenas n passos (contra O(n² log n) operações do heap em find_mst_prim).
+
+class TSPVectorizedPrim:
+
+    # Retorna (parent, order, total): parent[root] = -1 e `order` lista os
+    # vértices na ordem de inserção (todo pai aparece antes dos filhos).
+    # `nodes` restringe a árvore a um subconjunto de vértices e `pi` aplica
+    # penalidades de vértice (custo c[i][j] + pi[i] + pi[j]) sem formar a
+    # matriz penalizada inteira.
+    @staticmethod
+    def mst(cost: np.ndarray, root: int = 0, nodes=None, pi: np.ndarray = None):
+        cost = np.asarray(cost)
+        n = cost.shape[0]
+        parent = np.full(n, -1, dtype=np.int64)
+
+        in_tree = np.ones(n, dtype=bool)
+        if nodes is None:
+            in_tree[:] = False
+        else:
+            in_tree[np.asarray(nodes)] = False
+        size = n - int(in_tree.sum())
+
+        key = np.full(n, np.inf)
+        key[root] = 0.0
+        order = np.empty(size, dtype=np.int64)
+        total = 0.0
+
+        for step in range(size):
+            candidates = np.where(in_tree, np.inf, key)
+            v = int(np.argmin(candidates))
+            order[step] = v
+            total += key[v]
+            in_tree[v] = True
+
+            row = cost[v] if pi is None else cost[v] + (pi + pi[v])
+            improve = (row < key) & ~in_tree
+            key[improve] = row[improve]
+            parent[improve] = v
+
+        return parent, order, total
+
+    # Grau de cada vértice na árvore descrita por `parent`
+    @staticmethod
+    def degrees(parent: np.ndarray, order: np.ndarray) -> np.ndarray:
+        degree = np.zeros(parent.shape[0], dtype=np.int64)
+        children = order[1:]
+        np.add.at(degree, children, 1)
+        np.add.at(degree, parent[children], 1)
+        return degree
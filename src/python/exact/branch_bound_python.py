@@ -1,8 +1,34 @@
 import time
 import sys
 import os
-from typing import List, Optional, Tuple
-import copy
+from typing import List
+import argparse
+import heapq
+from array import array
+
+import numpy as np
+
+from matrix_utils import add_approximate_path
+
+# vectorized_prim (bound 'onetree') e o pipeline do warm start ficam em ../approximate
+add_approximate_path()
+
+# 'recursive': um TSPNode novo (cópias de path e visited) por filho
+# 'backtrack': um único caminho e bitmask de visitadas, sem alocação por nó,
+#              e bound incremental (listas de vizinhos ordenadas + delta)
+# 'best':      best-first por um heap de nós compactos (arena plana)
+# 'hybrid':    best-first que mergulha em profundidade pelo melhor filho
+ENGINES = ('recursive', 'backtrack', 'best', 'hybrid')
+
+# Bounds dos motores backtrack/best/hybrid:
+# 'nearest': menor aresta de saída de cada cidade pendente (o de calculate_bound)
+# 'reduced': matriz reduzida por linhas e colunas (Little), reduzida de novo a cada ramificação
+# 'onetree': MST das não visitadas + menores arestas de entrada e de saída
+BOUNDS = ('nearest', 'reduced', 'onetree')
+
+# Ordem dos filhos na busca em profundidade: índice da cidade, vizinho mais
+# próximo da última cidade (lista pré-ordenada) ou bound crescente
+ORDERS = ('index', 'nearest', 'bound')
 
 class TSPNode:
     
@@ -24,6 +50,14 @@ class TSPBranchBound:
         self.execution_time = 0.0
         self.nodes_explored = 0
         self.nodes_pruned = 0
+        # Limite de nós da arena (best/hybrid); cheia, a busca segue em profundidade
+        self.max_nodes = 2_000_000
+        self.peak_pool = 0
+        self.depth_first_fallbacks = 0
+        self.warm_start_cost = None
+        self.warm_start_time = 0.0
+        self.bound = 'nearest'
+        self.order = 'index'
         self.load_tsp_file()
         
     def load_tsp_file(self):
@@ -107,21 +141,399 @@ class TSPBranchBound:
                 else:
                     self.nodes_pruned += 1
     
+    # Bound incremental, igual ao de calculate_bound: para cada linha i (não
+    # visitadas e a última cidade), a menor aresta para uma coluna não visitada
+    # ou 0. Cada linha percorre sua lista de vizinhos ordenada uma única vez;
+    # _pointer[i] aponta para o mínimo atual e _watchers[c] lista as linhas
+    # cujo mínimo está na coluna c. Visitar c avança só essas linhas e devolve
+    # o delta da soma; as mudanças são desfeitas na volta do backtracking.
+    def sort_neighbors(self):
+        n = self.n_cities
+        matrix = self.matrix
+        self._neighbors = [sorted((j for j in range(n) if j != i), key=lambda j: (matrix[i][j], j))
+                           for i in range(n)]
+    
+    # Estado incremental para as cidades visitadas em `visited`; retorna a soma
+    # das menores arestas das não visitadas
+    def prepare_incremental_bound(self, visited: int = 1) -> int:
+        n = self.n_cities
+        matrix = self.matrix
+        self._pointer = [0] * n
+        self._min_edge = [0] * n
+        self._watchers = [[] for _ in range(n)]
+        row_sum = 0
+        for i in range(1, n):
+            neighbors = self._neighbors[i]
+            p = 0
+            while neighbors[p] and visited >> neighbors[p] & 1:
+                p += 1
+            self._pointer[i] = p
+            self._min_edge[i] = matrix[i][neighbors[p]]
+            self._watchers[neighbors[p]].append(i)
+            if not visited >> i & 1:
+                row_sum += self._min_edge[i]
+        return row_sum
+    
+    # O mesmo bound calculado do zero pelas listas ordenadas (nós da arena não
+    # compartilham o estado incremental)
+    def neighbor_bound(self, visited: int, last: int, cost: int) -> int:
+        bound = cost
+        matrix = self.matrix
+        for i in range(1, self.n_cities):
+            if visited >> i & 1 and i != last:
+                continue
+            for j in self._neighbors[i]:
+                if not j or not visited >> j & 1:
+                    bound += matrix[i][j]
+                    break
+        return bound
+    
+    # Remove a coluna c; retorna (delta da soma das linhas, mudanças para desfazer)
+    def _visit_column(self, c: int, visited: int):
+        matrix = self.matrix
+        pointer = self._pointer
+        min_edge = self._min_edge
+        delta = 0
+        changes = []
+        for r in self._watchers[c]:
+            if visited >> r & 1:
+                continue
+            neighbors = self._neighbors[r]
+            p = pointer[r] + 1
+            # 0 é sempre uma coluna permitida, então o ponteiro nunca passa do fim
+            while neighbors[p] and visited >> neighbors[p] & 1:
+                p += 1
+            column = neighbors[p]
+            value = matrix[r][column]
+            changes.append((r, pointer[r], min_edge[r]))
+            delta += value - min_edge[r]
+            pointer[r] = p
+            min_edge[r] = value
+            self._watchers[column].append(r)
+        return delta, changes
+    
+    def _undo_columns(self, changes):
+        for r, p, value in reversed(changes):
+            self._watchers[self._neighbors[r][self._pointer[r]]].pop()
+            self._pointer[r] = p
+            self._min_edge[r] = value
+    
+    # Cidades candidatas a seguir `last`, na ordem de self.order ('bound'
+    # parte da ordem por índice e é reordenado por cada motor)
+    def _children(self, last: int, visited: int) -> List[int]:
+        if self.order == 'nearest':
+            return [j for j in self._neighbors[last] if j and not visited >> j & 1]
+        return [i for i in self._cities if not visited >> i & 1]
+    
+    # Backtracking: self._path é compartilhado e só a posição `level` é
+    # escrita; a bitmask é um inteiro passado por valor. `row_sum` é a soma das
+    # menores arestas das cidades não visitadas, mantida por delta.
+    def branch_and_bound_backtrack(self, level: int, visited: int, cost: int, row_sum: int):
+        self.nodes_explored += 1
+        path = self._path
+        last = path[level - 1]
+        
+        if level == self.n_cities:
+            final_cost = cost + self.matrix[last][0]
+            if final_cost < self.best_cost:
+                self.best_cost = final_cost
+                self.best_path = path.copy()
+            return
+        
+        row = self.matrix[last]
+        min_edge = self._min_edge
+        children = self._children(last, visited)
+        if self.order == 'bound':
+            # Bound de cada filho: custo + soma das linhas atualizada pelo delta;
+            # empates pela aresta saindo de `last` (o bound empata com frequência)
+            scored = []
+            for i in children:
+                delta, changes = self._visit_column(i, visited | 1 << i)
+                scored.append((cost + row[i] + row_sum + delta, row[i], i))
+                self._undo_columns(changes)
+            scored.sort()
+            children = [i for _, _, i in scored]
+        
+        for i in children:
+            child_visited = visited | 1 << i
+            child_cost = cost + row[i]
+            delta, changes = self._visit_column(i, child_visited)
+            # i sai das não visitadas e entra como última cidade: a linha conta igual
+            child_sum = row_sum - min_edge[i] + delta
+            if child_cost + child_sum + min_edge[i] < self.best_cost:
+                path[level] = i
+                self.branch_and_bound_backtrack(level + 1, child_visited, child_cost, child_sum)
+            else:
+                self.nodes_pruned += 1
+            self._undo_columns(changes)
+    
+    # Estruturas NumPy dos bounds 'reduced' e 'onetree'
+    def prepare_bounds(self):
+        n = self.n_cities
+        self._cost = np.asarray(self.matrix, dtype=np.float64)
+        if self.bound == 'reduced':
+            # Uma matriz reduzida por nível do caminho, reaproveitada entre irmãos
+            self._reduced = np.empty((n + 1, n, n))
+        elif self.bound == 'onetree':
+            from vectorized_prim import TSPVectorizedPrim
+            self._prim = TSPVectorizedPrim
+            # Aresta não direcionada mais barata entre i e j: a MST continua sendo
+            # limite inferior do trecho do caminho dentro das não visitadas
+            self._symmetric_cost = np.minimum(self._cost, self._cost.T)
+    
+    # Subtrai o mínimo de cada linha e depois de cada coluna; retorna o total
+    # subtraído. Linhas e colunas só com inf (já usadas) não contam.
+    @staticmethod
+    def _reduce(reduced: np.ndarray) -> float:
+        rows = reduced.min(axis=1)
+        rows[np.isinf(rows)] = 0
+        reduced -= rows[:, None]
+        columns = reduced.min(axis=0)
+        columns[np.isinf(columns)] = 0
+        reduced -= columns
+        return rows.sum() + columns.sum()
+    
+    # Matriz reduzida de um nó calculada do zero: saem as linhas das visitadas
+    # (menos a última), as colunas das visitadas (menos o 0) e, se ainda há
+    # cidades pendentes, a aresta de volta last -> 0
+    def reduced_state(self, visited: int, last: int, cost: int):
+        n = self.n_cities
+        reduced = self._cost.copy()
+        np.fill_diagonal(reduced, np.inf)
+        cities = [v for v in range(n) if visited >> v & 1]
+        reduced[[v for v in cities if v != last], :] = np.inf
+        reduced[:, [v for v in cities if v != 0]] = np.inf
+        if visited != (1 << n) - 1:
+            reduced[last, 0] = np.inf
+        return reduced, cost + self._reduce(reduced)
+    
+    def reduced_bound(self, visited: int, last: int, cost: int) -> float:
+        return self.reduced_state(visited, last, cost)[1]
+    
+    # O restante do tour é um caminho last -> (não visitadas) -> 0: contém uma
+    # árvore geradora das não visitadas, uma aresta saindo de last e uma chegando ao 0
+    def onetree_bound(self, visited: int, last: int, cost: int) -> float:
+        pending = [i for i in self._cities if not visited >> i & 1]
+        if not pending:
+            return cost + self.matrix[last][0]
+        nodes = np.array(pending)
+        tree = 0.0
+        if len(pending) > 1:
+            tree = self._prim.mst(self._symmetric_cost, root=pending[0], nodes=nodes)[2]
+        return cost + tree + self._cost[last, nodes].min() + self._cost[nodes, 0].min()
+    
+    def node_bound(self, visited: int, last: int, cost: int) -> float:
+        if self.bound == 'reduced':
+            return self.reduced_bound(visited, last, cost)
+        if self.bound == 'onetree':
+            return self.onetree_bound(visited, last, cost)
+        return self.neighbor_bound(visited, last, cost)
+    
+    # Preenche self._reduced[level + 1] com a matriz do filho i e retorna seu bound
+    def _reduced_child(self, level: int, last: int, i: int, child_visited: int, bound: float) -> float:
+        reduced = self._reduced[level]
+        child = self._reduced[level + 1]
+        np.copyto(child, reduced)
+        child[last, :] = np.inf
+        child[:, i] = np.inf
+        if child_visited != (1 << self.n_cities) - 1:
+            child[i, 0] = np.inf
+        return bound + reduced[last, i] + self._reduce(child)
+    
+    # Backtracking com o bound de Little: o filho parte da matriz reduzida do
+    # pai (self._reduced[level]), bloqueia a linha de `last`, a coluna de i e
+    # a volta i -> 0, e soma ao bound o custo reduzido da aresta e a nova redução
+    def branch_and_bound_reduced(self, level: int, visited: int, cost: int, bound: float):
+        self.nodes_explored += 1
+        n = self.n_cities
+        path = self._path
+        last = path[level - 1]
+        
+        if level == n:
+            final_cost = cost + self.matrix[last][0]
+            if final_cost < self.best_cost:
+                self.best_cost = final_cost
+                self.best_path = path.copy()
+            return
+        
+        row = self.matrix[last]
+        children = self._children(last, visited)
+        if self.order == 'bound':
+            # O buffer do filho é reescrito por cada irmão: a matriz é refeita ao descer
+            scored = sorted((self._reduced_child(level, last, i, visited | 1 << i, bound), row[i], i)
+                            for i in children)
+        else:
+            scored = [(None, None, i) for i in children]
+        
+        for child_bound, _, i in scored:
+            if child_bound is not None and child_bound >= self.best_cost:
+                self.nodes_pruned += 1
+                continue
+            child_visited = visited | 1 << i
+            child_bound = self._reduced_child(level, last, i, child_visited, bound)
+            if child_bound < self.best_cost:
+                path[level] = i
+                self.branch_and_bound_reduced(level + 1, child_visited, cost + row[i], child_bound)
+            else:
+                self.nodes_pruned += 1
+    
+    # Backtracking com bound calculado do zero em cada filho ('onetree')
+    def branch_and_bound_scratch(self, level: int, visited: int, cost: int):
+        self.nodes_explored += 1
+        path = self._path
+        last = path[level - 1]
+        
+        if level == self.n_cities:
+            final_cost = cost + self.matrix[last][0]
+            if final_cost < self.best_cost:
+                self.best_cost = final_cost
+                self.best_path = path.copy()
+            return
+        
+        row = self.matrix[last]
+        scored = [(self.node_bound(visited | 1 << i, i, cost + row[i]), row[i], i)
+                  for i in self._children(last, visited)]
+        if self.order == 'bound':
+            scored.sort()
+        
+        for child_bound, _, i in scored:
+            if child_bound < self.best_cost:
+                path[level] = i
+                self.branch_and_bound_scratch(level + 1, visited | 1 << i, cost + row[i])
+            else:
+                self.nodes_pruned += 1
+    
+    # Busca em profundidade a partir do nó em self._path[:level], com o bound escolhido
+    def depth_first(self, level: int, visited: int, cost: int):
+        if self.bound == 'reduced':
+            reduced, bound = self.reduced_state(visited, self._path[level - 1], cost)
+            self._reduced[level] = reduced
+            self.branch_and_bound_reduced(level, visited, cost, bound)
+        elif self.bound == 'onetree':
+            self.branch_and_bound_scratch(level, visited, cost)
+        else:
+            self.branch_and_bound_backtrack(level, visited, cost, self.prepare_incremental_bound(visited))
+    
+    # Caminho de um nó da arena, seguindo os ponteiros de pai
+    def _arena_path(self, index: int) -> List[int]:
+        path = []
+        while index >= 0:
+            path.append(self._arena_last[index])
+            index = self._arena_parent[index]
+        return path[::-1]
+    
+    # Arena cheia: explora a subárvore do nó com o motor backtrack
+    def _depth_first_from(self, index: int):
+        self.depth_first_fallbacks += 1
+        path = self._arena_path(index)
+        visited = self._arena_mask[index]
+        self._path = path + [0] * (self.n_cities - len(path))
+        self.depth_first(len(path), visited, self._arena_cost[index])
+    
+    # Best-first: o heap guarda (bound, -nível, índice) e a arena guarda cada
+    # nó como bitmask, última cidade, custo e pai em arrays planos. 'hybrid'
+    # segue em profundidade pelo filho de menor bound e empilha os irmãos.
+    def branch_and_bound_best_first(self, dive: bool):
+        n = self.n_cities
+        matrix = self.matrix
+        full = (1 << n) - 1
+        masks = self._arena_mask = array('q', [1])
+        lasts = self._arena_last = array('q', [0])
+        costs = self._arena_cost = array('q', [0])
+        parents = self._arena_parent = array('q', [-1])
+        heap = [(self.node_bound(1, 0, 0), -1, 0)]
+        
+        while heap:
+            bound, _, node = heapq.heappop(heap)
+            if bound >= self.best_cost:
+                self.nodes_pruned += 1
+                continue
+            
+            while node is not None:
+                if len(masks) >= self.max_nodes:
+                    self._depth_first_from(node)
+                    break
+                
+                self.nodes_explored += 1
+                visited, last, cost = masks[node], lasts[node], costs[node]
+                row = matrix[last]
+                level = bin(visited).count('1') + 1
+                children = []
+                for i in range(1, n):
+                    bit = 1 << i
+                    if visited & bit:
+                        continue
+                    child_visited = visited | bit
+                    child_cost = cost + row[i]
+                    if child_visited == full:
+                        # Folha: o bound é o custo do tour
+                        final_cost = child_cost + matrix[i][0]
+                        if final_cost < self.best_cost:
+                            self.nodes_explored += 1
+                            self.best_cost = final_cost
+                            self.best_path = self._arena_path(node) + [i]
+                        else:
+                            self.nodes_pruned += 1
+                        continue
+                    child_bound = self.node_bound(child_visited, i, child_cost)
+                    if child_bound >= self.best_cost:
+                        self.nodes_pruned += 1
+                        continue
+                    masks.append(child_visited)
+                    lasts.append(i)
+                    costs.append(child_cost)
+                    parents.append(node)
+                    children.append((child_bound, -level, len(masks) - 1))
+                
+                node = None
+                if dive and children:
+                    children.sort()
+                    node = children.pop(0)[2]
+                for child in children:
+                    heapq.heappush(heap, child)
+                self.peak_pool = max(self.peak_pool, len(heap))
+    
+    # Incumbente inicial pelo MST aproximativo + 2-opt (warm_start). A poda é
+    # estrita (bound < best_cost), então o tour semente fica como resposta se
+    # nenhum melhor existir.
+    def seed_incumbent(self):
+        from warm_start import approximate_incumbent
+        
+        cost, tour, elapsed = approximate_incumbent(self.filename, self.matrix)
+        self.best_cost = cost
+        self.best_path = tour
+        self.warm_start_cost = cost
+        self.warm_start_time = elapsed
+        print(f"Incumbente inicial (MST + 2-opt): {cost} ({elapsed:.3f}s)")
+    
     # Algoritmo Branch and Bound - Otimização: fixa cidade 0 como inicial
-    def solve(self) -> dict:
+    def solve(self, engine: str = 'recursive', warm_start: bool = False) -> dict:
         print(f"Iniciando Branch and Bound para {self.n_cities} cidades...")
         start_time = time.time()
         
-        root = TSPNode(self.n_cities)
-        
-        # Fixa cidade 0 como inicial
-        root.path[0] = 0
-        root.visited[0] = True
-        root.current_cost = 0
-        root.level = 1
-        root.bound = self.calculate_bound(root)
+        if warm_start and self.n_cities >= 3:
+            self.seed_incumbent()
         
-        self.branch_and_bound_recursive(root)
+        if engine in ('backtrack', 'best', 'hybrid'):
+            self._cities = list(range(1, self.n_cities))
+            self._path = [0] * self.n_cities
+            self.sort_neighbors()
+            self.prepare_bounds()
+            if engine == 'backtrack' or self.n_cities < 3:
+                self.depth_first(1, 1, 0)
+            else:
+                self.branch_and_bound_best_first(dive=engine == 'hybrid')
+        else:
+            root = TSPNode(self.n_cities)
+            
+            # Fixa cidade 0 como inicial
+            root.path[0] = 0
+            root.visited[0] = True
+            root.current_cost = 0
+            root.level = 1
+            root.bound = self.calculate_bound(root)
+            
+            self.branch_and_bound_recursive(root)
         
         end_time = time.time()
         self.execution_time = end_time - start_time
@@ -138,6 +550,12 @@ class TSPBranchBound:
             'nodes_explored': self.nodes_explored,
             'nodes_pruned': self.nodes_pruned,
             'pruning_rate': (self.nodes_pruned / (self.nodes_explored + self.nodes_pruned)) * 100,
+            'engine': engine,
+            'bound': self.bound if engine != 'recursive' else 'nearest',
+            'order': self.order if engine != 'recursive' else 'index',
+            'peak_pool': self.peak_pool,
+            'depth_first_fallbacks': self.depth_first_fallbacks,
+            'warm_start_cost': self.warm_start_cost,
             'optimal_value': optimal_value,
             'is_optimal': self.best_cost == optimal_value if optimal_value > 0 else None
         }
@@ -165,6 +583,16 @@ class TSPBranchBound:
         print(f"Nós explorados: {result['nodes_explored']:,}")
         print(f"Nós podados: {result['nodes_pruned']:,}")
         print(f"Taxa de poda: {result['pruning_rate']:.2f}%")
+        if result.get('engine', 'recursive') != 'recursive':
+            print(f"Motor: {result['engine']} (bound: {result['bound']}, ordem dos filhos: {result['order']})")
+        if result.get('warm_start_cost') is not None:
+            print(f"Incumbente inicial (MST + 2-opt): {result['warm_start_cost']}")
+        if result.get('nodes_saved') is not None:
+            print(f"Nós economizados pelo warm start: {result['nodes_saved']:,} "
+                  f"(sem ele: {result['nodes_explored_cold']:,} nós)")
+        if result.get('engine') in ('best', 'hybrid'):
+            print(f"Maior fila de nós: {result['peak_pool']:,} "
+                  f"({result['depth_first_fallbacks']:,} subárvores em profundidade por limite de memória)")
         print(f"Melhor caminho: {' -> '.join(map(str, result['best_path']))}")
         
         if result['optimal_value'] > 0:
@@ -187,15 +615,41 @@ class TSPBranchBound:
             print(f"Erro ao salvar resultados: {e}")
 
 def main():
-    if len(sys.argv) != 2:
-        print("Uso: python branch_bound_python.py <arquivo_tsp>")
-        sys.exit(1)
-    
-    filename = sys.argv[1]
+    parser = argparse.ArgumentParser(description='Branch and Bound para o TSP')
+    parser.add_argument('filename', help='Arquivo TSP')
+    parser.add_argument('--engine', default='recursive', choices=ENGINES,
+                        help='Motor de busca')
+    parser.add_argument('--bound', default='nearest', choices=BOUNDS,
+                        help='Limite inferior (motores backtrack/best/hybrid)')
+    parser.add_argument('--order', default='index', choices=ORDERS,
+                        help='Ordem de exploração dos filhos na busca em profundidade')
+    parser.add_argument('--max-nodes', type=int, default=2_000_000,
+                        help='Nós na arena (best/hybrid) antes de seguir em profundidade')
+    parser.add_argument('--warm-start', action='store_true',
+                        help='Inicia com o tour do MST aproximativo + 2-opt como incumbente')
+    parser.add_argument('--report-savings', action='store_true',
+                        help='Com --warm-start, resolve também sem ele e informa os nós economizados')
+    args = parser.parse_args()
+    if args.engine == 'recursive' and (args.bound != 'nearest' or args.order != 'index'):
+        parser.error("--bound e --order requerem o motor backtrack, best ou hybrid")
     
     try:
-        solver = TSPBranchBound(filename)
-        result = solver.solve()
+        solver = TSPBranchBound(args.filename)
+        solver.max_nodes = args.max_nodes
+        solver.bound = args.bound
+        solver.order = args.order
+        result = solver.solve(args.engine, warm_start=args.warm_start)
+        
+        if args.warm_start and args.report_savings:
+            print("\nResolvendo sem warm start para comparação...")
+            cold = TSPBranchBound(args.filename)
+            cold.max_nodes = args.max_nodes
+            cold.bound = args.bound
+            cold.order = args.order
+            cold_result = cold.solve(args.engine)
+            result['nodes_explored_cold'] = cold_result['nodes_explored']
+            result['nodes_saved'] = cold_result['nodes_explored'] - result['nodes_explored']
+        
         solver.print_results(result)
         solver.save_results(result)
         
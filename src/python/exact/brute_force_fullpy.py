@@ -1,9 +1,20 @@
 import time
 import sys
 import os
+import argparse
 from itertools import permutations
 from typing import List, Tuple
 
+from enumeration import TSPHeapEnumeration
+from instrumentation import SearchMonitor
+from matrix_utils import is_symmetric
+
+# Força bruta n! sem otimização: referência para medir quanto as versões
+# otimizadas economizam. Por isso a eliminação de espelhados fica desligada por
+# padrão (--symmetry liga), ao contrário de TSPBruteForce em brute_force_python,
+# onde ela é ligada por padrão (--no-symmetry desliga): aqui a contagem padrão
+# precisa ser exatamente n! para a comparação com (n-1)! em print_results.
+
 class TSPBruteForceNFactorial:
     
     def __init__(self, filename: str):
@@ -13,7 +24,10 @@ class TSPBruteForceNFactorial:
         self.best_cost = float('inf')
         self.best_path = []
         self.permutations_tested = 0
+        # Progresso amostrado por timer e histórico do incumbente (instrumentation)
+        self.monitor = SearchMonitor()
         self.load_tsp_file()
+        self.symmetric = self.is_symmetric()
         
     def load_tsp_file(self):
         try:
@@ -59,8 +73,45 @@ class TSPBruteForceNFactorial:
             result *= i
         return result
     
+    def is_symmetric(self) -> bool:
+        return is_symmetric(self.matrix)
+    
+    # Pares (a, b) com a < b para a primeira e a última posição: em matriz
+    # simétrica uma permutação e sua inversa custam o mesmo
+    def mirror_ends(self):
+        for b in range(1, self.n_cities):
+            for a in range(b):
+                yield a, b
+    
+    def candidate_paths(self, mirror: bool = False):
+        # SEM OTIMIZAÇÃO: usa TODAS as cidades, não fixa a primeira
+        all_cities = list(range(self.n_cities))
+        if not mirror:
+            for perm in permutations(all_cities):
+                yield list(perm)
+            return
+        
+        for a, b in self.mirror_ends():
+            middle = [c for c in all_cities if c != a and c != b]
+            for perm in permutations(middle):
+                yield [a] + list(perm) + [b]
+    
+    # Motor original: itertools.permutations e custo recalculado por permutação
+    def permutations_search(self, mirror: bool = False):
+        for path in self.candidate_paths(mirror):
+            self.permutations_tested += 1
+            
+            cost = self.calculate_path_cost(path)
+            
+            if cost < self.best_cost:
+                self.best_cost = cost
+                self.best_path = path.copy()
+                self.monitor.incumbent(cost, self.permutations_tested)
+    
     # Resolve TSP usando força bruta SEM OTIMIZAÇÃO - usa n! permutações
-    def solve(self) -> dict:
+    # engine: 'permutations' (original) ou 'heap' (trocas com delta)
+    # use_symmetry: em matriz simétrica só gera perm[0] < perm[-1] (n!/2)
+    def solve(self, engine: str = 'permutations', use_symmetry: bool = False) -> dict:
         print(f"\n=== Iniciando Força Bruta n! Python para {self.n_cities} cidades ===")
         
         if self.n_cities > 10:
@@ -76,42 +127,48 @@ class TSPBruteForceNFactorial:
         print(f"⚡ Versão (n-1)! (otimizada): {optimized_permutations:,} permutações")
         print(f"📊 Diferença: {self.n_cities}x mais permutações ({expected_permutations / optimized_permutations:.1f}x)")
         print(f"⚠️  Esta versão é {self.n_cities}x mais lenta que a otimizada!")
+        
+        full_permutations = expected_permutations
+        mirror = use_symmetry and self.symmetric and self.n_cities >= 2
+        if mirror:
+            expected_permutations //= 2
+            print(f"🪞 Matriz simétrica: só perm[0] < perm[-1] ({expected_permutations:,} permutações)")
         print("")
         
         start_time = time.time()
         
-        # SEM OTIMIZAÇÃO: usa TODAS as cidades, não fixa a primeira
-        all_cities = list(range(self.n_cities))
-        
-        for perm in permutations(all_cities):
-            self.permutations_tested += 1
-            
-            path = list(perm)
-            
-            cost = self.calculate_path_cost(path)
-            
-            if cost < self.best_cost:
-                self.best_cost = cost
-                self.best_path = path.copy()
-                print(f"Nova melhor solução encontrada: {cost} (permutação {self.permutations_tested:,})")
-            
-            if self.permutations_tested % 100_000 == 0:
-                elapsed = time.time() - start_time
-                rate = self.permutations_tested / elapsed if elapsed > 0 else 0
-                eta = (expected_permutations - self.permutations_tested) / rate if rate > 0 else 0
-                print(f"Progresso: {self.permutations_tested:,}/{expected_permutations:,} "
-                      f"({100*self.permutations_tested/expected_permutations:.1f}%) "
-                      f"ETA: {eta/60:.1f}min")
+        with self.monitor.running(lambda: self.permutations_tested, expected_permutations):
+            if engine == 'heap':
+                # Algoritmo de Heap: uma troca por permutação e custo atualizado por delta
+                enumeration = TSPHeapEnumeration(self.matrix, fix_first=False, monitor=self.monitor)
+                self.monitor.track(lambda: enumeration.permutations_tested)
+                if not mirror:
+                    enumeration.search()
+                else:
+                    for a, b in self.mirror_ends():
+                        middle = [c for c in range(self.n_cities) if c != a and c != b]
+                        enumeration.search([a] + middle + [b], 1, self.n_cities - 1)
+                self.best_cost = enumeration.best_cost
+                self.best_path = enumeration.best_path
+                self.permutations_tested = enumeration.permutations_tested
+            else:
+                self.permutations_search(mirror)
         
         end_time = time.time()
         execution_time = end_time - start_time
         
-        print(f"Permutações testadas: {self.permutations_tested:,}")
+        print(f"Permutações testadas: {self.permutations_tested:,} "
+              f"({self.monitor.summary()['rate']:,.0f} permutações/s)")
         print(f"Permutações esperadas: {expected_permutations:,}")
         
         if self.permutations_tested != expected_permutations:
             print(f"⚠️  AVISO: Número de permutações não confere!")
         
+        skipped = full_permutations - self.permutations_tested
+        if mirror:
+            print(f"Permutações espelhadas evitadas: {skipped:,} "
+                  f"(redução de {full_permutations / self.permutations_tested:.1f}x)")
+        
         optimal_value = self.get_optimal_value()
         
         result = {
@@ -123,6 +180,9 @@ class TSPBruteForceNFactorial:
             'execution_time': execution_time,
             'permutations_tested': self.permutations_tested,
             'permutations_expected': expected_permutations,
+            'permutations_skipped': skipped,
+            'symmetric': self.symmetric,
+            'permutations_per_second': self.monitor.summary()['rate'],
             'optimal_value': optimal_value,
             'is_optimal': self.best_cost == optimal_value if optimal_value > 0 else None
         }
@@ -184,22 +244,19 @@ class TSPBruteForceNFactorial:
             print(f"Erro ao salvar resultados: {e}")
 
 def main():
-    if len(sys.argv) != 2:
-        print("Uso: python brute_force_n_factorial.py <arquivo_tsp>")
-        print("")
-        print("Esta versão usa n! permutações (SEM otimização)")
-        print("Para comparar com a versão otimizada que usa (n-1)!")
-        print("")
-        print("Exemplo:")
-        print("  python brute_force_n_factorial.py data/tsp2_1248.txt")
-        print("  python brute_force_n_factorial.py data/tsp1_253.txt")
-        sys.exit(1)
-    
-    filename = sys.argv[1]
+    parser = argparse.ArgumentParser(
+        description='Força bruta n! sem otimização, para comparar com a versão (n-1)!',
+        epilog='Exemplo: python brute_force_fullpy.py data/tsp1_253.txt heap --symmetry')
+    parser.add_argument('filename', help='Arquivo TSP')
+    parser.add_argument('engine', nargs='?', default='permutations', choices=('permutations', 'heap'),
+                        help='Motor de enumeração')
+    parser.add_argument('--symmetry', action='store_true',
+                        help='Em matriz simétrica gera só perm[0] < perm[-1] (n!/2)')
+    args = parser.parse_args()
     
     try:
-        solver = TSPBruteForceNFactorial(filename)
-        result = solver.solve()
+        solver = TSPBruteForceNFactorial(args.filename)
+        result = solver.solve(args.engine, args.symmetry)
         solver.print_results(result)
         solver.save_results(result)
         
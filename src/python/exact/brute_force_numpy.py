@@ -0,0 +1,79 @@
+from itertools import combinations, permutations
+from math import comb, factorial
+from typing import List, Optional
+
+import numpy as np
+
+from instrumentation import SearchMonitor
+
+# Força bruta avaliada em blocos NumPy.
+#
+# As k! permutações das últimas k posições são geradas uma única vez como
+# matriz de índices (k! x k). Para cada conjunto de cidades do prefixo, o
+# bloco de sufixos sobre as cidades restantes é avaliado com um gather e uma
+# soma vetorizados: o custo interno do sufixo (incluindo a volta ao 0) só
+# depende do conjunto restante, e a primeira aresta só da última cidade do
+# prefixo. Assim cada bloco é calculado uma vez por (conjunto, última cidade)
+# e compartilhado pelas ordens do prefixo que terminam nela. Todas as (n-1)!
+# permutações são cobertas, mas só evaluations() delas são somadas de fato:
+# permutations_tested conta as avaliadas (é o que o monitor amostra, então taxa
+# e ETA medem trabalho real) e permutations_covered as cobertas.
+
+class TSPNumpyBlockEnumeration:
+
+    def __init__(self, matrix: List[List[int]], suffix_length: int = 8,
+                 monitor: Optional[SearchMonitor] = None):
+        self.matrix = np.asarray(matrix, dtype=np.int64)
+        self.n_cities = self.matrix.shape[0]
+        self.k = max(1, min(suffix_length, self.n_cities - 1))
+        # Permutações de range(k) em ordem lexicográfica
+        self.suffixes = np.array(list(permutations(range(self.k))), dtype=np.int16)
+        self.best_cost = float('inf')
+        self.best_path = []
+        self.permutations_tested = 0
+        self.permutations_covered = 0
+        self.monitor = monitor or SearchMonitor()
+
+    # Permutações somadas: um bloco de k! sufixos por (conjunto do prefixo, última cidade)
+    @staticmethod
+    def evaluations(n_cities: int, suffix_length: int = 8) -> int:
+        k = max(1, min(suffix_length, n_cities - 1))
+        prefix = n_cities - 1 - k
+        return comb(n_cities - 1, prefix) * max(prefix, 1) * factorial(k)
+
+    def search(self):
+        matrix = self.matrix
+        n, k = self.n_cities, self.k
+        suffixes = self.suffixes
+        block = suffixes.shape[0]
+        first, last = suffixes[:, 0], suffixes[:, -1]
+        cities = list(range(1, n))
+
+        for chosen in combinations(cities, n - 1 - k):
+            taken = set(chosen)
+            remaining = np.array([c for c in cities if c not in taken])
+
+            # Custo do sufixo sem a primeira aresta: arestas internas + volta ao 0
+            sub = matrix[np.ix_(remaining, remaining)]
+            internal = sub[suffixes[:, :-1], suffixes[:, 1:]].sum(axis=1) + matrix[remaining, 0][last]
+
+            completions = {}
+            for order in permutations(chosen):
+                prefix = (0,) + order
+                tail = prefix[-1]
+                if tail not in completions:
+                    totals = matrix[tail, remaining][first] + internal
+                    index = int(totals.argmin())
+                    completions[tail] = (int(totals[index]), index)
+                    self.permutations_tested += block
+                completion, index = completions[tail]
+
+                cost = completion
+                for i in range(len(prefix) - 1):
+                    cost += int(matrix[prefix[i], prefix[i + 1]])
+                self.permutations_covered += block
+
+                if cost < self.best_cost:
+                    self.best_cost = cost
+                    self.best_path = list(prefix) + remaining[suffixes[index]].tolist()
+                    self.monitor.incumbent(cost, self.permutations_tested)
@@ -0,0 +1,183 @@
+import time
+import os
+import argparse
+import multiprocessing as mp
+from multiprocessing import Pool
+from typing import List, Optional
+
+from brute_force_python import TSPBruteForce
+
+# Força bruta em paralelo por partição de prefixos.
+#
+# O espaço de permutações é dividido por prefixos fixos (as primeiras cidades
+# após o 0; no modo simétrico também a última) e cada prefixo vira uma tarefa
+# do pool. O melhor custo conhecido fica em um multiprocessing.Value: cada
+# tarefa parte dele e descarta subárvores (inclusive o próprio prefixo) cujo
+# custo parcial já o excede. Empates são mantidos (poda só com custo
+# estritamente maior), e o resultado final é o menor (custo, caminho), igual
+# para qualquer número de processos e ordem de conclusão.
+
+# Sem solução conhecida
+_NO_INCUMBENT = 2 ** 62
+
+# Estado de cada processo trabalhador (preenchido por _init_worker)
+_worker = {}
+
+def _init_worker(filename: str, matrix: List[List[int]], shared_best, prune: bool):
+    solver = TSPBruteForce(filename, matrix=matrix)
+    solver.monitor.verbose = False
+    solver.prune = prune
+    _worker['solver'] = solver
+    _worker['best'] = shared_best
+
+def _run_task(task) -> dict:
+    index, prefix, end = task
+    start_time = time.time()
+    solver = _worker['solver']
+    shared_best = _worker['best']
+
+    # +1: custos inteiros, então empates com o incumbente também são registrados
+    incumbent = shared_best.value
+    solver.best_cost = incumbent + 1
+    solver.best_path = []
+    solver.permutations_tested = 0
+    solver.permutations_pruned = 0
+
+    solver.search_prefix(prefix, end)
+
+    found = bool(solver.best_path)
+    if found:
+        with shared_best.get_lock():
+            if solver.best_cost < shared_best.value:
+                shared_best.value = solver.best_cost
+
+    return {
+        'index': index,
+        'prefix': prefix,
+        'end': end,
+        'cost': solver.best_cost if found else None,
+        'path': solver.best_path if found else None,
+        'permutations_tested': solver.permutations_tested,
+        'permutations_pruned': solver.permutations_pruned,
+        'time': time.time() - start_time,
+        'pid': os.getpid()
+    }
+
+class TSPBruteForceParallel(TSPBruteForce):
+
+    def __init__(self, filename: str, processes: Optional[int] = None, prefix_depth: int = 2,
+                 matrix: Optional[List[List[int]]] = None):
+        super().__init__(filename, matrix)
+        self.processes = processes or os.cpu_count() or 1
+        self.prefix_depth = prefix_depth
+        self.tasks_skipped = 0
+
+    # Incumbente inicial pelo vizinho mais próximo: permite podar desde as primeiras tarefas
+    def nearest_neighbor_cost(self) -> int:
+        n = self.n_cities
+        visited = [False] * n
+        visited[0] = True
+        current, cost = 0, 0
+        for _ in range(n - 1):
+            row = self.matrix[current]
+            nxt = min((c for c in range(n) if not visited[c]), key=row.__getitem__)
+            cost += row[nxt]
+            visited[nxt] = True
+            current = nxt
+        return cost + self.matrix[current][0]
+
+    def solve(self, use_symmetry: bool = True) -> dict:
+        print(f"\n=== Iniciando Força Bruta Paralela Python para {self.n_cities} cidades ===")
+
+        full_permutations = self.factorial(self.n_cities - 1)
+        mirror = use_symmetry and self.symmetric and self.n_cities >= 3
+        # No modo simétrico a última cidade também é fixa
+        if mirror:
+            depth = min(max(self.prefix_depth, 1), self.n_cities - 2)
+        else:
+            depth = min(self.prefix_depth, max(self.n_cities - 1, 0))
+        tasks = [(index, prefix, end) for index, (prefix, end)
+                 in enumerate(self.prefix_tasks(mirror, depth))]
+
+        # A poda pressupõe pesos não negativos
+        prune = all(value >= 0 for row in self.matrix for value in row)
+        initial = self.nearest_neighbor_cost() if prune and self.n_cities > 1 else _NO_INCUMBENT
+        shared_best = mp.Value('q', initial)
+
+        print(f"Tarefas: {len(tasks)} prefixos em {self.processes} processos"
+              f"{' (simetria: tours espelhados uma única vez)' if mirror else ''}")
+        if initial != _NO_INCUMBENT:
+            print(f"Incumbente inicial (vizinho mais próximo): {initial}")
+
+        start_time = time.time()
+        results = []
+        with Pool(self.processes, initializer=_init_worker,
+                  initargs=(self.filename, self.matrix, shared_best, prune)) as pool:
+            for done, result in enumerate(pool.imap_unordered(_run_task, tasks), 1):
+                results.append(result)
+                if result['permutations_tested'] == 0:
+                    self.tasks_skipped += 1
+                if result['cost'] is not None and result['cost'] < self.best_cost:
+                    self.best_cost = result['cost']
+                    print(f"Nova melhor solução encontrada: {result['cost']} "
+                          f"(tarefa {done}/{len(tasks)}, prefixo {result['prefix']})")
+
+        # Junção determinística: menor (custo, caminho) entre todas as tarefas
+        candidates = [(r['cost'], r['path']) for r in results if r['cost'] is not None]
+        self.best_cost, self.best_path = min(candidates)
+        self.permutations_tested = sum(r['permutations_tested'] for r in results)
+        self.permutations_pruned = sum(r['permutations_pruned'] for r in results)
+        execution_time = time.time() - start_time
+        cpu_time = sum(r['time'] for r in results)
+
+        print(f"Permutações testadas: {self.permutations_tested:,}")
+        print(f"Permutações podadas: {self.permutations_pruned:,} "
+              f"({self.tasks_skipped} tarefas descartadas pelo prefixo)")
+        print(f"Tempo de CPU somado: {cpu_time:.3f}s "
+              f"(paralelismo efetivo {cpu_time / execution_time if execution_time > 0 else 0:.1f}x)")
+
+        optimal_value = self.get_optimal_value()
+
+        return {
+            'algorithm': 'BRUTE_FORCE_PARALLEL_PYTHON',
+            'filename': self.filename,
+            'n_cities': self.n_cities,
+            'best_path': self.best_path,
+            'best_cost': self.best_cost,
+            'execution_time': execution_time,
+            'permutations_tested': self.permutations_tested,
+            'permutations_pruned': self.permutations_pruned,
+            'permutations_skipped': full_permutations - self.permutations_tested - self.permutations_pruned,
+            'symmetric': self.symmetric,
+            'tasks': len(tasks),
+            'tasks_skipped': self.tasks_skipped,
+            'processes': self.processes,
+            'optimal_value': optimal_value,
+            'is_optimal': self.best_cost == optimal_value if optimal_value > 0 else None
+        }
+
+def main():
+    parser = argparse.ArgumentParser(description='Força bruta paralela por partição de prefixos')
+    parser.add_argument('filename', help='Arquivo TSP')
+    parser.add_argument('--processes', type=int, default=None, help='Processos (padrão: núcleos)')
+    parser.add_argument('--prefix-depth', type=int, default=2,
+                        help='Cidades fixas após o 0 em cada tarefa')
+    parser.add_argument('--no-symmetry', action='store_true',
+                        help='Não elimina tours espelhados em matriz simétrica')
+    args = parser.parse_args()
+
+    try:
+        solver = TSPBruteForceParallel(args.filename, args.processes, args.prefix_depth)
+        result = solver.solve(use_symmetry=not args.no_symmetry)
+        solver.print_results(result)
+        solver.save_results(result)
+
+    except KeyboardInterrupt:
+        print("\n⚠️ Execução interrompida pelo usuário")
+    except Exception as e:
+        print(f"Erro durante execução: {e}")
+        import traceback
+        traceback.print_exc()
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,72 @@
 import time
 import sys
 import os
+import json
+import signal
+import hashlib
+import argparse
 from itertools import permutations
-from typing import List, Tuple
+from typing import List, Tuple, Optional
+
+from enumeration import TSPHeapEnumeration
+from instrumentation import SearchMonitor
+from matrix_utils import is_symmetric
+
+ENGINES = ('dfs', 'heap', 'numpy', 'permutations')
+
+# Posições livres por tarefa do motor dfs: tarefas de até 10! folhas (cerca de
+# um segundo), granularidade dos checkpoints
+TASK_FREE_POSITIONS = 10
+
+# SIGTERM (agendador, timeout, preempção) segue o mesmo caminho do Ctrl-C: a
+# exceção herda de KeyboardInterrupt, então o dfs grava o checkpoint antes de sair
+class SearchTerminated(KeyboardInterrupt):
+
+    def __init__(self, signum: int):
+        super().__init__(signum)
+        self.signum = signum
+
+def _terminate(signum, frame):
+    raise SearchTerminated(signum)
+
+# SHA-256 das linhas da matriz: identifica a instância independente do arquivo
+# (checkpoints daqui e parciais de brute_force_shard)
+def matrix_digest(matrix: List[List[int]]) -> str:
+    text = '\n'.join(' '.join(map(str, row)) for row in matrix)
+    return hashlib.sha256(text.encode()).hexdigest()
 
 class TSPBruteForce:
     
-    def __init__(self, filename: str):
+    # `matrix` permite resolver uma instância já em memória (ex.: processos de
+    # brute_force_parallel); nesse caso `filename` serve apenas como identificação.
+    def __init__(self, filename: str, matrix: Optional[List[List[int]]] = None):
         self.filename = filename
         self.matrix = []
         self.n_cities = 0
         self.best_cost = float('inf')
         self.best_path = []
         self.permutations_tested = 0
-        self.load_tsp_file()
+        # Permutações representadas pela busca (o motor numpy avalia menos do que cobre)
+        self.permutations_covered = 0
+        # Poda de subárvores cujo prefixo já custa >= best_cost (desligada na força bruta pura)
+        self.prune = False
+        self.permutations_pruned = 0
+        # Progresso amostrado por timer e histórico do incumbente (instrumentation)
+        self.monitor = SearchMonitor()
+        self._closing_end = None
+        # Sem confirmação para n > 12 quando False (execuções em lote)
+        self.interactive = True
+        # Checkpoint JSON do motor dfs: tarefas de prefixo concluídas + incumbente
+        self.checkpoint_file = None
+        self.checkpoint_interval = 60.0
+        self.resume = False
+        self._elapsed_before = 0.0
+        if matrix is None:
+            self.load_tsp_file()
+        else:
+            self.matrix = [[int(value) for value in row] for row in matrix]
+            self.n_cities = len(self.matrix)
+        self.symmetric = self.is_symmetric()
         
     def load_tsp_file(self):
         try:
@@ -59,207 +112,341 @@ class TSPBruteForce:
             result *= i
         return result
     
-    # Resolve TSP usando força bruta - Otimização: fixa cidade 0 como inicial (reduz n! para (n-1)!)
-    def solve(self) -> dict:
-        print(f"\n=== Iniciando Força Bruta Python para {self.n_cities} cidades ===")
-        
-        if self.n_cities > 12:
-            response = input(f"AVISO: {self.n_cities} cidades pode demorar muito! Continuar? (s/n): ")
-            if response.lower() not in ['s', 'sim', 'y', 'yes']:
-                print("Execução cancelada.")
-                sys.exit(0)
-        
-        expected_permutations = self.factorial(self.n_cities - 1)
-        print(f"Número de permutações a testar: {expected_permutations:,}")
-        
-        start_time = time.time()
-        
-        # Fixa cidade 0 como inicial
-        cities_without_first = list(range(1, self.n_cities))
+    def is_symmetric(self) -> bool:
+        return is_symmetric(self.matrix)
+    
+    # Pares (a, b) com a < b para a segunda e a última posição do tour. Em matriz
+    # simétrica 0 -> p1 ... pk e 0 -> pk ... p1 custam o mesmo: basta p1 < pk.
+    def mirror_ends(self):
+        for b in range(2, self.n_cities):
+            for a in range(1, b):
+                yield a, b
+    
+    # Caminhos completos na ordem do motor original; com `mirror`, só p1 < pk
+    def candidate_paths(self, mirror: bool = False):
+        if not mirror:
+            # Fixa cidade 0 como inicial
+            cities_without_first = list(range(1, self.n_cities))
+            for perm in permutations(cities_without_first):
+                # Constrói caminho completo (começando com cidade 0)
+                yield [0] + list(perm)
+            return
         
-        for perm in permutations(cities_without_first):
+        for a, b in self.mirror_ends():
+            middle = [c for c in range(1, self.n_cities) if c != a and c != b]
+            for perm in permutations(middle):
+                yield [0, a] + list(perm) + [b]
+    
+    # Motor original: itertools.permutations e custo recalculado por permutação
+    def permutations_search(self, mirror: bool = False):
+        for full_path in self.candidate_paths(mirror):
             self.permutations_tested += 1
             
-            # Constrói caminho completo (começando com cidade 0)
-            full_path = [0] + list(perm)
-            
             cost = self.calculate_path_cost(full_path)
             
             if cost < self.best_cost:
                 self.best_cost = cost
                 self.best_path = full_path.copy()
-                print(f"Nova melhor solução encontrada: {cost} (permutação {self.permutations_tested:,})")
-            
-            if self.permutations_tested % 100_000 == 0:
-                print(f"Progresso: {self.permutations_tested:,} permutações testadas...")
-        
-        end_time = time.time()
-        execution_time = end_time - start_time
+                self.monitor.incumbent(cost, self.permutations_tested)
+    
+    # Subárvores da busca: (prefixo começando em 0, última cidade fixa ou None).
+    # `depth` cidades após o 0 ficam fixas; com `mirror` a segunda cidade a e a
+    # última b satisfazem a < b (conta como uma das fixas).
+    def prefix_tasks(self, mirror: bool = False, depth: int = 0) -> List[Tuple[List[int], Optional[int]]]:
+        cities = list(range(1, self.n_cities))
+        if not mirror:
+            return [([0] + list(prefix), None) for prefix in permutations(cities, depth)]
         
-        print(f"Permutações testadas: {self.permutations_tested:,}")
+        tasks = []
+        for a, b in self.mirror_ends():
+            rest = [c for c in cities if c != a and c != b]
+            for prefix in permutations(rest, max(depth - 1, 0)):
+                tasks.append(([0, a] + list(prefix), b))
+        return tasks
+    
+    # Cidades fixas após o 0 nas tarefas do motor dfs
+    def task_depth(self, mirror: bool = False) -> int:
+        if mirror:
+            return max(1, self.n_cities - 2 - TASK_FREE_POSITIONS)
+        return max(0, self.n_cities - 1 - TASK_FREE_POSITIONS)
+    
+    # Busca em profundidade na árvore de permutações (ordem lexicográfica, como
+    # itertools). O custo do prefixo desce com a recursão; caminho e marcas de
+    # visita são pré-alocados e os quatro últimos níveis são desenrolados, então
+    # cada folha custa O(1) e nenhuma lista é criada por permutação.
+    # Com `mirror`, fixa a segunda e a última cidade (a < b) e percorre o meio.
+    # As tarefas de prefixo são percorridas em ordem; com checkpoint_file, o
+    # índice da última concluída e o incumbente são gravados periodicamente.
+    def dfs_search(self, mirror: bool = False):
+        depth = self.task_depth(mirror)
+        tasks = self.prefix_tasks(mirror, depth)
+        first_task = 0
+        if self.checkpoint_file and self.resume and os.path.exists(self.checkpoint_file):
+            first_task = self.load_checkpoint(mirror, depth, len(tasks))
         
-        optimal_value = self.get_optimal_value()
+        start_time = time.time()
+        next_checkpoint = start_time + self.checkpoint_interval
+        completed = first_task
+        snapshot = self.permutations_tested
+        try:
+            for index in range(first_task, len(tasks)):
+                prefix, end = tasks[index]
+                self.search_prefix(prefix, end)
+                completed = index + 1
+                snapshot = self.permutations_tested
+                if self.checkpoint_file and time.time() >= next_checkpoint:
+                    self.save_checkpoint(mirror, depth, len(tasks), completed, snapshot,
+                                         time.time() - start_time)
+                    next_checkpoint = time.time() + self.checkpoint_interval
+        except KeyboardInterrupt:
+            # Ctrl-C ou SIGTERM: grava o progresso até a última tarefa concluída
+            if self.checkpoint_file:
+                self.save_checkpoint(mirror, depth, len(tasks), completed, snapshot,
+                                     time.time() - start_time)
+                print(f"Checkpoint salvo em {self.checkpoint_file} ({completed}/{len(tasks)} tarefas)")
+            raise
         
-        result = {
-            'algorithm': 'BRUTE_FORCE_PYTHON',
+        if self.checkpoint_file:
+            self.save_checkpoint(mirror, depth, len(tasks), completed, snapshot,
+                                 time.time() - start_time)
+    
+    # Escrita atômica: arquivo temporário + os.replace, então um checkpoint
+    # interrompido no meio nunca substitui o anterior
+    def save_checkpoint(self, mirror: bool, depth: int, tasks: int, completed: int,
+                        permutations_tested: int, elapsed: float):
+        state = {
             'filename': self.filename,
             'n_cities': self.n_cities,
+            'matrix_digest': matrix_digest(self.matrix),
+            'engine': 'dfs',
+            'mirror': mirror,
+            'task_depth': depth,
+            'tasks': tasks,
+            'completed_tasks': completed,
+            'permutations_tested': permutations_tested,
+            'best_cost': self.best_cost if self.best_path else None,
             'best_path': self.best_path,
-            'best_cost': self.best_cost,
-            'execution_time': execution_time,
-            'permutations_tested': self.permutations_tested,
-            'optimal_value': optimal_value,
-            'is_optimal': self.best_cost == optimal_value if optimal_value > 0 else None
+            'incumbent_history': self.monitor.incumbent_history,
+            'elapsed': self._elapsed_before + elapsed
         }
-        
-        return result
+        directory = os.path.dirname(self.checkpoint_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary = self.checkpoint_file + '.tmp'
+        with open(temporary, 'w') as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self.checkpoint_file)
     
-    def get_optimal_value(self) -> int:
-        try:
-            filename = self.filename.split('/')[-1]
-            if '_' in filename and '.' in filename:
-                underscore_pos = filename.rfind('_')
-                dot_pos = filename.rfind('.')
-                if underscore_pos < dot_pos:
-                    return int(filename[underscore_pos + 1:dot_pos])
-        except:
-            pass
-        return -1
-    
-    def print_results(self, result: dict):
-        print(f"\n=== RESULTADOS FORÇA BRUTA PYTHON ===")
-        print(f"Arquivo: {result['filename']}")
-        print(f"Número de cidades: {result['n_cities']}")
-        print(f"Melhor custo encontrado: {result['best_cost']}")
-        print(f"Tempo de execução: {result['execution_time']:.6f} segundos")
-        print(f"Permutações testadas: {result['permutations_tested']:,}")
-        print(f"Melhor caminho: {' -> '.join(map(str, result['best_path']))}")
+    # Restaura incumbente e contadores; retorna o índice da próxima tarefa
+    def load_checkpoint(self, mirror: bool, depth: int, tasks: int) -> int:
+        with open(self.checkpoint_file, 'r') as f:
+            state = json.load(f)
         
-        if result['optimal_value'] > 0:
-            print(f"Valor ótimo esperado: {result['optimal_value']}")
-            if result['is_optimal']:
-                print("✅ Solução ótima encontrada!")
-            else:
-                ratio = result['best_cost'] / result['optimal_value']
-                print(f"⚠️ Razão: {ratio:.3f}")
+        expected = {'n_cities': self.n_cities, 'engine': 'dfs', 'mirror': mirror,
+                    'task_depth': depth, 'tasks': tasks}
+        for key, value in expected.items():
+            if state.get(key) != value:
+                raise ValueError(f"Checkpoint incompatível: {key} = {state.get(key)} (esperado {value})")
+        # Mesmo tamanho não basta: uma instância diferente daria um ótimo errado
+        if state.get('matrix_digest') != matrix_digest(self.matrix):
+            raise ValueError("Checkpoint de outra instância (digest da matriz diferente)")
+        
+        if state['best_path']:
+            self.best_cost = state['best_cost']
+            self.best_path = state['best_path']
+        self.permutations_tested = state['permutations_tested']
+        self._elapsed_before = state['elapsed']
+        self.monitor.resumed(self.permutations_tested, self._elapsed_before,
+                             state.get('incumbent_history', []))
+        print(f"Retomando do checkpoint {self.checkpoint_file}: "
+              f"{state['completed_tasks']}/{tasks} tarefas concluídas, "
+              f"melhor custo {state['best_cost']}")
+        return state['completed_tasks']
     
-    def save_results(self, result: dict, output_file: str = "results/exact_results.txt"):
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    # Enumera todos os tours que começam por `prefix` (e terminam em `end`)
+    def search_prefix(self, prefix: List[int], end: Optional[int] = None):
+        n = self.n_cities
+        self._path = [0] * n
+        self._used = [False] * n
+        self._cities = list(range(1, n))
+        for position, city in enumerate(prefix):
+            self._path[position] = city
+            self._used[city] = True
+        self._end = n
+        if end is not None:
+            self._end = n - 1
+            self._path[n - 1] = end
+            self._used[end] = True
         
-        try:
-            with open(output_file, 'a') as f:
-                f.write(f"{result['filename']},{result['n_cities']},{result['best_cost']},"
-                       f"{result['execution_time']:.6f},{result['algorithm']},"
-                       f"{result['optimal_value']},{result['permutations_tested']}\n")
-        except Exception as e:
-            print(f"Erro ao salvar resultados: {e}")
-
-def main():
-    if len(sys.argv) != 2:
-        print("Uso: python brute_force_python.py <arquivo_tsp>")
-        sys.exit(1)
+        depth = len(prefix)
+        cost = sum(self.matrix[prefix[i]][prefix[i + 1]] for i in range(depth - 1))
+        if self._end - depth < 4:
+            self._search_small(depth)
+            return
+        
+        self._leaves_below = [self.factorial(self._end - d) for d in range(self._end + 1)]
+        closing_end = 0 if end is None else end
+        if self._closing_end != closing_end:
+            self._prepare_closing(closing_end)
+            self._closing_end = closing_end
+        self._dfs_search(depth, cost)
     
-    filename = sys.argv[1]
+    # Poucas posições livres: enumera o restante diretamente
+    def _search_small(self, depth: int):
+        remaining = [city for city in self._cities if not self._used[city]]
+        for perm in permutations(remaining):
+            full_path = self._path[:depth] + list(perm) + self._path[self._end:]
+            cost = self.calculate_path_cost(full_path)
+            self.permutations_tested += 1
+            if cost < self.best_cost:
+                self.best_cost = cost
+                self.best_path = full_path
+                self.monitor.incumbent(cost, self.permutations_tested)
     
-    try:
-        solver = TSPBruteForce(filename)
-        result = solver.solve()
-        solver.print_results(result)
-        solver.save_results(result)
+    # Tabelas de fechamento até o fim do tour (cidade `end` e depois 0)
+    def _prepare_closing(self, end: int):
+        matrix = self.matrix
+        n = self.n_cities
+        tail = [matrix[z][end] + matrix[end][0] if end else matrix[z][0] for z in range(n)]
+        # Custo de fechar o tour por y -> z -> fim
+        self._closing = [[matrix[y][z] + tail[z] for z in range(n)] for y in range(n)]
+        # Melhor fechamento a partir de x pelas cidades {y, z}, nas duas ordens
+        closing = self._closing
+        self._closing_pair = [[[min(matrix[x][y] + closing[y][z], matrix[x][z] + closing[z][y])
+                                for z in range(n)] for y in range(n)] for x in range(n)]
+    
+    def _dfs_search(self, depth: int, cost: int):
+        if self.prune and cost >= self.best_cost:
+            self.permutations_pruned += self._leaves_below[depth]
+            return
         
-    except KeyboardInterrupt:
-        print("\n⚠️ Execução interrompida pelo usuário")
-    except Exception as e:
-        print(f"Erro durante execução: {e}")
-        import traceback
-        traceback.print_exc()
-
-if __name__ == "__main__":
-    main()dlines()
-                
-            lines = [line.strip() for line in lines if line.strip()]
-            
-            # Primeira linha determina número de cidades
-            first_row = list(map(int, lines[0].split()))
-            self.n_cities = len(first_row)
-            
-            self.matrix = []
-            
-            for line in lines:
-                row = list(map(int, line.split()))
-                if len(row) == self.n_cities:
-                    self.matrix.append(row)
-                    
-            if len(self.matrix) != self.n_cities:
-                raise ValueError(f"Matriz inconsistente: esperado {self.n_cities}x{self.n_cities}")
-                
-            print(f"Arquivo carregado: {self.n_cities} cidades")
-            
-        except FileNotFoundError:
-            print(f"Erro: Arquivo {self.filename} não encontrado")
-            sys.exit(1)
-        except Exception as e:
-            print(f"Erro ao carregar arquivo: {e}")
-            sys.exit(1)
+        path = self._path
+        used = self._used
+        matrix = self.matrix
+        row = matrix[path[depth - 1]]
+        
+        # Últimos quatro níveis desenrolados: escolhida a próxima cidade, as
+        # três restantes geram seis folhas avaliadas pela tabela de pares
+        if depth == self._end - 4:
+            remaining = [city for city in self._cities if not used[city]]
+            p, q, r, s = remaining
+            pair = self._closing_pair
+            for first, a, b, c in ((p, q, r, s), (q, p, r, s), (r, p, q, s), (s, p, q, r)):
+                row_first = matrix[first]
+                sub_cost = cost + row[first]
+                best = min(row_first[a] + pair[a][b][c], row_first[b] + pair[b][a][c],
+                           row_first[c] + pair[c][a][b]) + sub_cost
+                if best < self.best_cost:
+                    path[depth] = first
+                    self._record(depth + 1, sub_cost, (a, b, c))
+                self.permutations_tested += 6
+            return
+        
+        for c in self._cities:
+            if used[c]:
+                continue
+            used[c] = True
+            path[depth] = c
+            self._dfs_search(depth + 1, cost + row[c])
+            used[c] = False
     
-    def calculate_path_cost(self, path: List[int]) -> int:
-        total_cost = 0
-        for i in range(len(path) - 1):
-            total_cost += self.matrix[path[i]][path[i + 1]]
-        total_cost += self.matrix[path[-1]][path[0]]
-        return total_cost
+    # Registra a primeira (em ordem lexicográfica) das seis folhas que melhora a solução
+    def _record(self, depth: int, cost: int, remaining: Tuple[int, int, int]):
+        a, b, c = remaining
+        last = self._path[depth - 1]
+        for index, (x, y, z) in enumerate(((a, b, c), (a, c, b), (b, a, c),
+                                           (b, c, a), (c, a, b), (c, b, a))):
+            total = cost + self.matrix[last][x] + self.matrix[x][y] + self._closing[y][z]
+            if total < self.best_cost:
+                self.best_cost = total
+                self.best_path = self._path[:depth] + [x, y, z] + self._path[self._end:]
+                self.monitor.incumbent(total, self.permutations_tested + index + 1)
     
-    def factorial(self, n: int) -> int:
-        if n <= 1:
-            return 1
-        result = 1
-        for i in range(2, n + 1):
-            result *= i
-        return result
+    # Algoritmo de Heap: uma troca por permutação e custo atualizado por delta
+    def heap_search(self, mirror: bool = False):
+        enumeration = TSPHeapEnumeration(self.matrix, fix_first=True, monitor=self.monitor)
+        self.monitor.track(lambda: enumeration.permutations_tested)
+        if not mirror:
+            enumeration.search()
+        else:
+            n = self.n_cities
+            for a, b in self.mirror_ends():
+                middle = [c for c in range(1, n) if c != a and c != b]
+                enumeration.search([0, a] + middle + [b], 2, n - 1)
+        self.best_cost = enumeration.best_cost
+        self.best_path = enumeration.best_path
+        self.permutations_tested = enumeration.permutations_tested
     
-    def solve(self) -> dict:
-        """
-        Resolve TSP usando força bruta
-        Fixa cidade 0 como inicial para reduzir permutações
-        """
+    # Blocos de sufixos avaliados em NumPy (brute_force_numpy); não usa a simetria
+    def numpy_search(self):
+        if self.n_cities < 4:
+            self.dfs_search()
+            return
+        from brute_force_numpy import TSPNumpyBlockEnumeration
+        
+        enumeration = TSPNumpyBlockEnumeration(self.matrix, monitor=self.monitor)
+        self.monitor.track(lambda: enumeration.permutations_tested)
+        enumeration.search()
+        self.best_cost = enumeration.best_cost
+        self.best_path = enumeration.best_path
+        self.permutations_tested = enumeration.permutations_tested
+        self.permutations_covered = enumeration.permutations_covered
+    
+    # Resolve TSP usando força bruta - Otimização: fixa cidade 0 como inicial (reduz n! para (n-1)!)
+    # engine: 'dfs' (custo incremental do prefixo), 'heap' (trocas com delta),
+    # 'numpy' (blocos vetorizados) ou 'permutations' (original)
+    # use_symmetry: em matriz simétrica enumera cada tour em um só sentido ((n-1)!/2)
+    def solve(self, engine: str = 'dfs', use_symmetry: bool = True) -> dict:
         print(f"\n=== Iniciando Força Bruta Python para {self.n_cities} cidades ===")
         
-        if self.n_cities > 12:
+        if self.n_cities > 12 and self.interactive:
             response = input(f"AVISO: {self.n_cities} cidades pode demorar muito! Continuar? (s/n): ")
             if response.lower() not in ['s', 'sim', 'y', 'yes']:
                 print("Execução cancelada.")
                 sys.exit(0)
         
-        expected_permutations = self.factorial(self.n_cities - 1)
-        print(f"Número de permutações a testar: {expected_permutations:,}")
+        full_permutations = self.factorial(self.n_cities - 1)
+        mirror = use_symmetry and self.symmetric and self.n_cities >= 3 and engine != 'numpy'
+        expected_permutations = full_permutations // 2 if mirror else full_permutations
+        if mirror:
+            print("Matriz simétrica: tours espelhados são enumerados uma única vez")
+        if engine == 'numpy' and self.n_cities >= 4:
+            # Blocos memoizados: avalia menos permutações do que cobre
+            from brute_force_numpy import TSPNumpyBlockEnumeration
+            expected_permutations = TSPNumpyBlockEnumeration.evaluations(self.n_cities)
+            print(f"Número de permutações a avaliar: {expected_permutations:,} "
+                  f"(cobrindo {full_permutations:,})")
+        else:
+            print(f"Número de permutações a testar: {expected_permutations:,}")
         
         start_time = time.time()
+        # Todos os motores cobrem o espaço inteiro; só o numpy avalia menos do que cobre
+        self.permutations_covered = full_permutations
         
-        # Fixa cidade 0 como inicial
-        cities_without_first = list(range(1, self.n_cities))
-        
-        # Testa todas as permutações
-        for perm in permutations(cities_without_first):
-            self.permutations_tested += 1
-            
-            # Constrói caminho completo (começando com cidade 0)
-            full_path = [0] + list(perm)
-            
-            cost = self.calculate_path_cost(full_path)
-            
-            if cost < self.best_cost:
-                self.best_cost = cost
-                self.best_path = full_path.copy()
-                print(f"Nova melhor solução encontrada: {cost} (permutação {self.permutations_tested:,})")
-            
-            # Mostra progresso
-            if self.permutations_tested % 100_000 == 0:
-                print(f"Progresso: {self.permutations_tested:,} permutações testadas...")
+        with self.monitor.running(lambda: self.permutations_tested, expected_permutations):
+            if engine == 'dfs':
+                self.dfs_search(mirror)
+            elif engine == 'heap':
+                self.heap_search(mirror)
+            elif engine == 'numpy':
+                self.numpy_search()
+            else:
+                self.permutations_search(mirror)
         
         end_time = time.time()
-        execution_time = end_time - start_time
+        # Inclui o tempo das execuções anteriores quando retomado de checkpoint
+        execution_time = end_time - start_time + self._elapsed_before
         
-        print(f"Permutações testadas: {self.permutations_tested:,}")
+        print(f"Permutações testadas: {self.permutations_tested:,} "
+              f"({self.monitor.summary()['rate']:,.0f} permutações/s)")
+        if engine == 'numpy':
+            print(f"Permutações cobertas: {self.permutations_covered:,}")
+        skipped = full_permutations - self.permutations_tested
+        if mirror:
+            print(f"Permutações espelhadas evitadas: {skipped:,} "
+                  f"(redução de {full_permutations / self.permutations_tested:.1f}x)")
         
         optimal_value = self.get_optimal_value()
         
@@ -271,6 +458,10 @@ if __name__ == "__main__":
             'best_cost': self.best_cost,
             'execution_time': execution_time,
             'permutations_tested': self.permutations_tested,
+            'permutations_skipped': skipped,
+            'permutations_covered': self.permutations_covered,
+            'symmetric': self.symmetric,
+            'permutations_per_second': self.monitor.summary()['rate'],
             'optimal_value': optimal_value,
             'is_optimal': self.best_cost == optimal_value if optimal_value > 0 else None
         }
@@ -318,24 +509,54 @@ if __name__ == "__main__":
             print(f"Erro ao salvar resultados: {e}")
 
 def main():
-    if len(sys.argv) != 2:
-        print("Uso: python brute_force_python.py <arquivo_tsp>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description='Força bruta exata para o TSP')
+    parser.add_argument('filename', help='Arquivo TSP')
+    parser.add_argument('engine', nargs='?', default='dfs', choices=ENGINES, help='Motor de enumeração')
+    parser.add_argument('--no-symmetry', action='store_true',
+                        help='Não elimina tours espelhados em matriz simétrica')
+    parser.add_argument('--non-interactive', '-y', action='store_true',
+                        help='Não pede confirmação para mais de 12 cidades')
+    parser.add_argument('--checkpoint', default=None,
+                        help='Arquivo JSON de checkpoint (motor dfs)')
+    parser.add_argument('--checkpoint-interval', type=float, default=60.0,
+                        help='Segundos entre checkpoints')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continua a partir do checkpoint, se existir')
+    parser.add_argument('--report-interval', type=float, default=1.0,
+                        help='Segundos entre amostras de progresso')
+    parser.add_argument('--stats-json', default=None,
+                        help='Exporta resultado e instrumentação (taxa, amostras, incumbentes) em JSON')
+    args = parser.parse_args()
     
-    filename = sys.argv[1]
+    if (args.checkpoint or args.resume) and args.engine != 'dfs':
+        parser.error("checkpoints só são suportados pelo motor dfs")
+    if args.resume and not args.checkpoint:
+        parser.error("--resume requer --checkpoint")
     
+    signal.signal(signal.SIGTERM, _terminate)
     try:
-        solver = TSPBruteForce(filename)
-        result = solver.solve()
+        solver = TSPBruteForce(args.filename)
+        solver.interactive = not (args.non_interactive or args.resume)
+        solver.checkpoint_file = args.checkpoint
+        solver.checkpoint_interval = args.checkpoint_interval
+        solver.resume = args.resume
+        solver.monitor.interval = args.report_interval
+        result = solver.solve(args.engine, use_symmetry=not args.no_symmetry)
         solver.print_results(result)
         solver.save_results(result)
+        if args.stats_json:
+            solver.monitor.export_json(args.stats_json, result)
         
-    except KeyboardInterrupt:
-        print("\n⚠️ Execução interrompida pelo usuário")
+    except KeyboardInterrupt as e:
+        # Código 128 + sinal, como um processo morto pelo sinal: scripts não
+        # confundem uma execução interrompida com uma concluída
+        signum = e.signum if isinstance(e, SearchTerminated) else signal.SIGINT
+        print(f"\n⚠️ Execução interrompida ({signal.Signals(signum).name})")
+        sys.exit(128 + signum)
     except Exception as e:
         print(f"Erro durante execução: {e}")
         import traceback
         traceback.print_exc()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,224 @@
+import time
+import sys
+import os
+import json
+import glob
+import socket
+import argparse
+from typing import List, Optional, Tuple
+
+from brute_force_python import TSPBruteForce, matrix_digest
+
+# Força bruta distribuída por faixas de rank.
+#
+# O espaço do TSPBruteForce são as (n-1)! permutações de 1..n-1 em ordem
+# lexicográfica (tour = [0] + permutação). O shard i de k processa os ranks
+# [total*i/k, total*(i+1)/k): a faixa é coberta por subárvores de prefixo
+# inteiras (dfs normal), descendo só nos dois prefixos de fronteira, e as
+# subárvores fora da faixa são puladas sem enumeração. Cada shard grava um
+# arquivo JSON pequeno em um diretório compartilhado; o merge escolhe o menor
+# (custo, rank), o mesmo tour que uma execução única do motor dfs encontraria.
+# Cada parcial leva o digest da matriz, e o merge só aceita um conjunto de
+# shards (mesmo k) da mesma instância.
+
+def permutation_rank(permutation: List[int]) -> int:
+    items = sorted(permutation)
+    rank = 0
+    for value in permutation:
+        index = items.index(value)
+        rank = rank * len(items) + index
+        items.pop(index)
+    return rank
+
+def permutation_unrank(rank: int, items: List[int]) -> List[int]:
+    items = sorted(items)
+    digits = []
+    for base in range(1, len(items) + 1):
+        rank, digit = divmod(rank, base)
+        digits.append(digit)
+    return [items.pop(digit) for digit in reversed(digits)]
+
+# Rank do tour [0, p1, ..., pk] no espaço do TSPBruteForce
+def tour_rank(tour: List[int]) -> int:
+    return permutation_rank(tour[1:])
+
+def tour_unrank(rank: int, n_cities: int) -> List[int]:
+    return [0] + permutation_unrank(rank, list(range(1, n_cities)))
+
+def shard_filename(directory: str, filename: str, index: int, count: int) -> str:
+    name = os.path.splitext(os.path.basename(filename))[0]
+    return os.path.join(directory, f"{name}.shard{index:04d}-of-{count:04d}.json")
+
+class TSPBruteForceShard(TSPBruteForce):
+
+    def __init__(self, filename: str, matrix: Optional[List[List[int]]] = None):
+        super().__init__(filename, matrix)
+        self.total = self.factorial(self.n_cities - 1)
+        self.subtrees_skipped = 0
+
+    def shard_range(self, index: int, count: int) -> Tuple[int, int]:
+        if not 0 <= index < count:
+            raise ValueError(f"Shard inválido: {index} de {count}")
+        return self.total * index // count, self.total * (index + 1) // count
+
+    # Percorre só os ranks [start, stop): subárvores contidas na faixa vão
+    # inteiras para search_prefix, as disjuntas são puladas
+    def search_rank_range(self, start: int, stop: int):
+        if start >= stop:
+            return
+        self._cover([0], 0, start, stop)
+
+    def _cover(self, prefix: List[int], base: int, start: int, stop: int):
+        size = self.factorial(self.n_cities - len(prefix))
+        if base >= stop or base + size <= start:
+            self.subtrees_skipped += 1
+            return
+        if start <= base and base + size <= stop:
+            self.search_prefix(prefix)
+            return
+
+        child_size = size // (self.n_cities - len(prefix))
+        remaining = [c for c in range(1, self.n_cities) if c not in prefix]
+        for offset, city in enumerate(remaining):
+            self._cover(prefix + [city], base + offset * child_size, start, stop)
+
+    # Executa o shard e grava o resultado parcial (escrita atômica)
+    def solve_shard(self, index: int, count: int, directory: str) -> dict:
+        start, stop = self.shard_range(index, count)
+        print(f"\n=== Shard {index + 1}/{count}: ranks [{start:,}, {stop:,}) "
+              f"de {self.total:,} ({self.n_cities} cidades) ===")
+
+        start_time = time.time()
+        self.search_rank_range(start, stop)
+        execution_time = time.time() - start_time
+
+        found = bool(self.best_path)
+        partial = {
+            'filename': self.filename,
+            'n_cities': self.n_cities,
+            'matrix_digest': matrix_digest(self.matrix),
+            'shard': index,
+            'shards': count,
+            'rank_start': start,
+            'rank_stop': stop,
+            'best_cost': self.best_cost if found else None,
+            'best_path': self.best_path if found else None,
+            'best_rank': tour_rank(self.best_path) if found else None,
+            'permutations_tested': self.permutations_tested,
+            'execution_time': execution_time,
+            'host': socket.gethostname()
+        }
+
+        output = shard_filename(directory, self.filename, index, count)
+        os.makedirs(directory, exist_ok=True)
+        temporary = output + '.tmp'
+        with open(temporary, 'w') as f:
+            json.dump(partial, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, output)
+
+        print(f"Permutações testadas: {self.permutations_tested:,} "
+              f"({self.subtrees_skipped} subárvores puladas)")
+        print(f"Melhor custo do shard: {partial['best_cost']}")
+        print(f"Tempo de execução: {execution_time:.6f} segundos")
+        print(f"Resultado parcial salvo em {output}")
+        return partial
+
+    # Junta os k arquivos parciais; exige todos os shards e faixas contíguas.
+    # Sem `count`, o diretório deve conter um único conjunto de shards.
+    def merge(self, directory: str, count: Optional[int] = None) -> dict:
+        name = os.path.splitext(os.path.basename(self.filename))[0]
+        suffix = '*' if count is None else f"{count:04d}"
+        partials = []
+        for path in sorted(glob.glob(os.path.join(directory, f"{name}.shard*-of-{suffix}.json"))):
+            with open(path, 'r') as f:
+                partials.append(json.load(f))
+        if not partials:
+            raise ValueError(f"Nenhum resultado parcial em {directory}")
+
+        counts = sorted({p['shards'] for p in partials})
+        if len(counts) > 1:
+            raise ValueError(f"Conjuntos de shards misturados em {directory} (k = {counts}); "
+                             f"informe --shards ou remova os resultados antigos")
+        count = counts[0]
+        partials.sort(key=lambda p: p['shard'])
+        missing = sorted(set(range(count)) - {p['shard'] for p in partials})
+        if missing:
+            raise ValueError(f"Shards ausentes: {missing} de {count}")
+        digest = matrix_digest(self.matrix)
+        foreign = [p['shard'] for p in partials
+                   if p['n_cities'] != self.n_cities or p.get('matrix_digest') != digest]
+        if foreign:
+            raise ValueError(f"Shards {foreign} são de outra instância (digest da matriz diferente)")
+        covered = 0
+        for p in partials:
+            if p['rank_start'] != covered:
+                raise ValueError(f"Faixas não contíguas no shard {p['shard']}")
+            covered = p['rank_stop']
+        if covered != self.total:
+            raise ValueError(f"Faixas cobrem {covered:,} de {self.total:,} permutações")
+
+        # Menor custo; empate pelo menor rank (primeiro em ordem lexicográfica)
+        candidates = [(p['best_cost'], p['best_rank'], p['best_path'])
+                      for p in partials if p['best_cost'] is not None]
+        self.best_cost, _, self.best_path = min(candidates)
+        self.permutations_tested = sum(p['permutations_tested'] for p in partials)
+        cpu_time = sum(p['execution_time'] for p in partials)
+        hosts = sorted({p['host'] for p in partials})
+
+        print(f"\n=== Merge de {count} shards ({len(hosts)} hosts) ===")
+        print(f"Tempo somado dos shards: {cpu_time:.3f}s")
+
+        optimal_value = self.get_optimal_value()
+
+        return {
+            'algorithm': 'BRUTE_FORCE_SHARDED_PYTHON',
+            'filename': self.filename,
+            'n_cities': self.n_cities,
+            'best_path': self.best_path,
+            'best_cost': self.best_cost,
+            # Shards rodam em paralelo: o tempo de parede é o do mais lento
+            'execution_time': max(p['execution_time'] for p in partials),
+            'permutations_tested': self.permutations_tested,
+            'shards': count,
+            'hosts': hosts,
+            'optimal_value': optimal_value,
+            'is_optimal': self.best_cost == optimal_value if optimal_value > 0 else None
+        }
+
+def main():
+    parser = argparse.ArgumentParser(description='Força bruta distribuída por faixas de rank')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run = subparsers.add_parser('run', help='Processa o shard i de k')
+    run.add_argument('filename', help='Arquivo TSP')
+    run.add_argument('--shard', type=int, required=True, help='Índice do shard (0..k-1)')
+    run.add_argument('--shards', type=int, required=True, help='Número total de shards')
+    run.add_argument('--output-dir', default='results/shards', help='Diretório compartilhado')
+
+    merge = subparsers.add_parser('merge', help='Combina os resultados parciais')
+    merge.add_argument('filename', help='Arquivo TSP')
+    merge.add_argument('--shards', type=int, default=None,
+                       help='Número de shards a combinar (obrigatório se houver conjuntos de k diferentes)')
+    merge.add_argument('--output-dir', default='results/shards', help='Diretório compartilhado')
+
+    args = parser.parse_args()
+
+    try:
+        solver = TSPBruteForceShard(args.filename)
+        if args.command == 'run':
+            solver.solve_shard(args.shard, args.shards, args.output_dir)
+        else:
+            result = solver.merge(args.output_dir, args.shards)
+            solver.print_results(result)
+            solver.save_results(result)
+
+    except KeyboardInterrupt:
+        print("\n⚠️ Execução interrompida pelo usuário")
+    except Exception as e:
+        print(f"Erro durante execução: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
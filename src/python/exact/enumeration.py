@@ -0,0 +1,148 @@
+from math import factorial
+from typing import List, Optional
+
+from instrumentation import SearchMonitor
+
+# Enumeração de permutações pelo algoritmo de Heap.
+#
+# Permutações consecutivas diferem por uma única troca de posições, então o
+# custo do tour é atualizado pelas (no máximo quatro) arestas vizinhas às
+# posições trocadas, em vez de recalculado. A matriz fica em uma lista plana
+# de inteiros (c(u, v) = flat[u * n + v]) e o laço interno é só aritmética.
+#
+# Com `fix_first` a cidade 0 fica na posição 0 e são geradas as (n-1)!
+# permutações do restante (TSPBruteForce); sem ela, todas as n! (TSPBruteForceNFactorial).
+# search(tour, start, stop) permuta só as posições [start, stop) de um tour
+# inicial, o que permite fixar extremos (modo simétrico, ver brute_force_python).
+# O laço não mantém contador: o número de permutações já geradas é o valor
+# dos contadores de Heap em base fatorial (sum counters[i] * i!). Ele só é
+# calculado ao registrar um incumbente e ao concluir o nível `publish_level`
+# (a cada publish_level! permutações), quando é publicado em
+# permutations_tested para a amostragem do SearchMonitor.
+
+class TSPHeapEnumeration:
+
+    def __init__(self, matrix: List[List[int]], fix_first: bool = True,
+                 monitor: Optional[SearchMonitor] = None):
+        self.n_cities = len(matrix)
+        self.flat = [int(value) for row in matrix for value in row]
+        self.fix_first = fix_first
+        self.best_cost = float('inf')
+        self.best_path = []
+        self.permutations_tested = 0
+        self.monitor = monitor or SearchMonitor()
+
+    def tour_cost(self, tour: List[int]) -> int:
+        flat, n = self.flat, self.n_cities
+        total = flat[tour[-1] * n + tour[0]]
+        for k in range(len(tour) - 1):
+            total += flat[tour[k] * n + tour[k + 1]]
+        return total
+
+    def _record(self, tour: List[int], cost: int):
+        self.best_cost = cost
+        self.best_path = list(tour)
+        self.monitor.incumbent(cost, self.permutations_tested)
+
+    def search(self, tour: Optional[List[int]] = None, start: Optional[int] = None,
+               stop: Optional[int] = None, publish_level: int = 8):
+        n = self.n_cities
+        flat = self.flat
+        tour = list(range(n)) if tour is None else list(tour)
+        offset = (1 if self.fix_first else 0) if start is None else start
+        m = (n if stop is None else stop) - offset
+
+        cost = self.tour_cost(tour)
+        self.permutations_tested += 1
+        if cost < self.best_cost:
+            self._record(tour, cost)
+
+        # Com poucas posições as vizinhanças das trocas se sobrepõem:
+        # poucas permutações, custo recalculado
+        if n < 4 or m < 3:
+            counters = [0] * m
+            i = 1
+            while i < m:
+                if counters[i] < i:
+                    j = counters[i] if i & 1 else 0
+                    tour[offset + j], tour[offset + i] = tour[offset + i], tour[offset + j]
+                    self.permutations_tested += 1
+                    cost = self.tour_cost(tour)
+                    if cost < self.best_cost:
+                        self._record(tour, cost)
+                    counters[i] += 1
+                    i = 1
+                else:
+                    counters[i] = 0
+                    i += 1
+            return
+
+        last = n - 1
+        # Já inclui a permutação inicial
+        base = self.permutations_tested
+        weights = [factorial(i) for i in range(m)]
+        # Permutações contadas ao concluir o nível publish_level - 1: os contadores
+        # abaixo de publish_level acabaram de voltar a 0, mas valiam j em cada nível j
+        completed_block = factorial(publish_level) - 1 if publish_level < m else 0
+        counters = [0] * m
+        first = offset
+        second = offset + 1
+
+        # No algoritmo de Heap toda troca de nível i >= 2 é seguida pela troca
+        # das duas primeiras posições (nível 1); o laço alterna as duas
+        while True:
+            # Nível 1: posições adjacentes (before, x, y, after) -> (before, y, x, after)
+            x = tour[first]
+            y = tour[second]
+            before = tour[first - 1]
+            after = tour[second + 1] if second < last else tour[0]
+            cost += (flat[before * n + y] + flat[y * n + x] + flat[x * n + after]
+                     - flat[before * n + x] - flat[x * n + y] - flat[y * n + after])
+            tour[first] = y
+            tour[second] = x
+            if cost < self.best_cost:
+                self.permutations_tested = base + sum(c * w for c, w in zip(counters, weights)) + 1
+                self._record(tour, cost)
+
+            i = 2
+            while i < m and counters[i] >= i:
+                counters[i] = 0
+                i += 1
+                if i == publish_level:
+                    self.permutations_tested = (base + completed_block
+                                                + sum(c * w for c, w in zip(counters, weights)))
+            if i >= m:
+                break
+
+            # Nível i: ímpar troca com counters[i], par troca com a primeira posição
+            p = offset + (counters[i] if i & 1 else 0)
+            q = offset + i
+            counters[i] += 1
+            x = tour[p]
+            y = tour[q]
+            before = tour[p - 1]
+            after = tour[q + 1] if q < last else tour[0]
+
+            if q == p + 1:
+                delta = (flat[before * n + y] + flat[y * n + x] + flat[x * n + after]
+                         - flat[before * n + x] - flat[x * n + y] - flat[y * n + after])
+            elif p == 0 and q == last:
+                # Vizinhas pelo fechamento do ciclo: (pq, y, x, np) -> (pq, x, y, np)
+                pq = tour[q - 1]
+                np_ = tour[1]
+                delta = (flat[pq * n + x] + flat[x * n + y] + flat[y * n + np_]
+                         - flat[pq * n + y] - flat[y * n + x] - flat[x * n + np_])
+            else:
+                np_ = tour[p + 1]
+                pq = tour[q - 1]
+                delta = (flat[before * n + y] + flat[y * n + np_] + flat[pq * n + x] + flat[x * n + after]
+                         - flat[before * n + x] - flat[x * n + np_] - flat[pq * n + y] - flat[y * n + after])
+
+            tour[p] = y
+            tour[q] = x
+            cost += delta
+            if cost < self.best_cost:
+                self.permutations_tested = base + sum(c * w for c, w in zip(counters, weights))
+                self._record(tour, cost)
+
+        self.permutations_tested = base + weights[-1] * m - 1
@@ -0,0 +1,216 @@
+import time
+import sys
+import os
+import argparse
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# Programação dinâmica de Held-Karp, O(n² · 2ⁿ).
+#
+# A cidade 0 é fixa; a cidade c (1..n-1) corresponde ao bit c-1. dp[S, j] é o
+# menor custo de um caminho que sai de 0, visita exatamente o conjunto S e
+# termina em j (bit j de S ligado). As tabelas são arrays NumPy indexados pela
+# máscara: os conjuntos são processados em camadas por popcount, e para cada
+# j a camada inteira é resolvida com um gather de dp[S - {j}] e um min ao
+# longo do eixo da cidade anterior. parent[S, j] (int8) guarda essa cidade e
+# reconstrói o tour de trás para frente.
+
+class TSPHeldKarp:
+
+    def __init__(self, filename: str, matrix: Optional[List[List[int]]] = None):
+        self.filename = filename
+        self.matrix = []
+        self.n_cities = 0
+        self.best_cost = float('inf')
+        self.best_path = []
+        self.states_evaluated = 0
+        self.memory_bytes = 0
+        if matrix is None:
+            self.load_tsp_file()
+        else:
+            self.matrix = [[int(value) for value in row] for row in matrix]
+            self.n_cities = len(self.matrix)
+
+    def load_tsp_file(self):
+        try:
+            with open(self.filename, 'r') as file:
+                lines = file.readlines()
+
+            lines = [line.strip() for line in lines if line.strip()]
+
+            first_row = list(map(int, lines[0].split()))
+            self.n_cities = len(first_row)
+
+            self.matrix = []
+
+            for line in lines:
+                row = list(map(int, line.split()))
+                if len(row) == self.n_cities:
+                    self.matrix.append(row)
+
+            if len(self.matrix) != self.n_cities:
+                raise ValueError(f"Matriz inconsistente: esperado {self.n_cities}x{self.n_cities}")
+
+            print(f"Arquivo carregado: {self.n_cities} cidades")
+
+        except FileNotFoundError:
+            print(f"Erro: Arquivo {self.filename} não encontrado")
+            sys.exit(1)
+        except Exception as e:
+            print(f"Erro ao carregar arquivo: {e}")
+            sys.exit(1)
+
+    def calculate_path_cost(self, path: List[int]) -> int:
+        total_cost = 0
+        for i in range(len(path) - 1):
+            total_cost += self.matrix[path[i]][path[i + 1]]
+        total_cost += self.matrix[path[-1]][path[0]]
+        return total_cost
+
+    # int32 quando qualquer caminho (e o sentinela somado a uma aresta) cabe
+    def cost_dtype(self) -> Tuple[type, int]:
+        largest = max((abs(value) for row in self.matrix for value in row), default=0)
+        if (self.n_cities + 2) * largest < 2 ** 30:
+            return np.int32, 2 ** 30
+        return np.int64, 2 ** 62
+
+    # Máscaras de 1..2^m - 1 agrupadas por popcount (ordem crescente dentro da camada)
+    @staticmethod
+    def layers(m: int) -> List[np.ndarray]:
+        masks = np.arange(1 << m, dtype=np.int64)
+        popcount = np.zeros(1 << m, dtype=np.int8)
+        for bit in range(m):
+            popcount += ((masks >> bit) & 1).astype(np.int8)
+        order = np.argsort(popcount, kind='stable')
+        bounds = np.searchsorted(popcount[order], np.arange(m + 2))
+        return [order[bounds[k]:bounds[k + 1]] for k in range(m + 1)]
+
+    def held_karp(self):
+        n = self.n_cities
+        m = n - 1
+        dtype, infinity = self.cost_dtype()
+        cost = np.asarray(self.matrix, dtype=np.int64)
+        between = cost[1:, 1:].astype(dtype)
+        full = (1 << m) - 1
+
+        dp = np.full((1 << m, m), infinity, dtype=dtype)
+        parent = np.full((1 << m, m), -1, dtype=np.int8)
+        self.memory_bytes = dp.nbytes + parent.nbytes
+        print(f"Tabelas DP: {1 << m:,} conjuntos x {m} cidades "
+              f"({self.memory_bytes / 2 ** 20:.1f} MiB, {np.dtype(dtype).name})")
+
+        # Camada 1: 0 -> j
+        singles = np.left_shift(1, np.arange(m))
+        dp[singles, np.arange(m)] = cost[0, 1:]
+
+        for size, masks in enumerate(self.layers(m)[2:], start=2):
+            for j in range(m):
+                bit = 1 << j
+                with_j = masks[(masks & bit) != 0]
+                previous = dp[with_j ^ bit]
+                candidates = previous + between[:, j]
+                best = candidates.argmin(axis=1)
+                dp[with_j, j] = candidates[np.arange(len(with_j)), best]
+                parent[with_j, j] = best
+                self.states_evaluated += candidates.size
+
+        # Fecha o ciclo voltando para 0
+        closing = dp[full] + cost[1:, 0]
+        last = int(closing.argmin())
+        self.best_cost = int(closing[last])
+
+        path = []
+        mask = full
+        while last >= 0:
+            path.append(last + 1)
+            mask, last = mask ^ (1 << last), int(parent[mask, last])
+        self.best_path = [0] + path[::-1]
+
+    def solve(self) -> dict:
+        print(f"\n=== Iniciando Held-Karp Python para {self.n_cities} cidades ===")
+        start_time = time.time()
+
+        if self.n_cities <= 2:
+            self.best_path = list(range(self.n_cities))
+            self.best_cost = self.calculate_path_cost(self.best_path) if self.n_cities else 0
+        else:
+            self.held_karp()
+
+        execution_time = time.time() - start_time
+        optimal_value = self.get_optimal_value()
+
+        return {
+            'algorithm': 'HELD_KARP_PYTHON',
+            'filename': self.filename,
+            'n_cities': self.n_cities,
+            'best_path': self.best_path,
+            'best_cost': self.best_cost,
+            'execution_time': execution_time,
+            'states_evaluated': self.states_evaluated,
+            'memory_bytes': self.memory_bytes,
+            'optimal_value': optimal_value,
+            'is_optimal': self.best_cost == optimal_value if optimal_value > 0 else None
+        }
+
+    def get_optimal_value(self) -> int:
+        try:
+            filename = self.filename.split('/')[-1]
+            if '_' in filename and '.' in filename:
+                underscore_pos = filename.rfind('_')
+                dot_pos = filename.rfind('.')
+                if underscore_pos < dot_pos:
+                    return int(filename[underscore_pos + 1:dot_pos])
+        except:
+            pass
+        return -1
+
+    def print_results(self, result: dict):
+        print(f"\n=== RESULTADOS HELD-KARP PYTHON ===")
+        print(f"Arquivo: {result['filename']}")
+        print(f"Número de cidades: {result['n_cities']}")
+        print(f"Melhor custo encontrado: {result['best_cost']}")
+        print(f"Tempo de execução: {result['execution_time']:.6f} segundos")
+        print(f"Transições avaliadas: {result['states_evaluated']:,}")
+        print(f"Memória das tabelas: {result['memory_bytes'] / 2 ** 20:.1f} MiB")
+        print(f"Melhor caminho: {' -> '.join(map(str, result['best_path']))}")
+
+        if result['optimal_value'] > 0:
+            print(f"Valor ótimo esperado: {result['optimal_value']}")
+            if result['is_optimal']:
+                print("✅ Solução ótima encontrada!")
+            else:
+                ratio = result['best_cost'] / result['optimal_value']
+                print(f"⚠️ Razão: {ratio:.3f}")
+
+    def save_results(self, result: dict, output_file: str = "results/exact_results.txt"):
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+
+        try:
+            with open(output_file, 'a') as f:
+                f.write(f"{result['filename']},{result['n_cities']},{result['best_cost']},"
+                       f"{result['execution_time']:.6f},{result['algorithm']},"
+                       f"{result['optimal_value']},{result['states_evaluated']}\n")
+        except Exception as e:
+            print(f"Erro ao salvar resultados: {e}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Held-Karp (programação dinâmica) para o TSP')
+    parser.add_argument('filename', help='Arquivo TSP')
+    args = parser.parse_args()
+
+    try:
+        solver = TSPHeldKarp(args.filename)
+        result = solver.solve()
+        solver.print_results(result)
+        solver.save_results(result)
+
+    except KeyboardInterrupt:
+        print("\n⚠️ Execução interrompida pelo usuário")
+    except Exception as e:
+        print(f"Erro durante execução: {e}")
+        import traceback
+        traceback.print_exc()
+
+if __name__ == "__main__":
+    main()
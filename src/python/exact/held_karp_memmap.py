@@ -0,0 +1,157 @@
+import os
+import shutil
+import tempfile
+import argparse
+from math import comb
+from typing import List, Optional
+
+import numpy as np
+
+from held_karp import TSPHeldKarp
+
+# Held-Karp fora da memória.
+#
+# A tabela completa ocupa n · 2ⁿ entradas; aqui só as camadas de popcount
+# k-1 e k ficam em RAM. Cada camada é um array de máscaras em ordem crescente
+# gerado a partir da anterior ligando um bit acima do mais alto (cada máscara
+# surge uma única vez e a concatenação por bit já sai ordenada); dp[S - {j}]
+# é localizado na camada anterior por searchsorted. Os pais de cada camada
+# vão para um arquivo np.memmap (int8, uma linha por cidade final) e o tour é
+# reconstruído relendo as camadas de trás para frente: o índice de uma
+# máscara na camada é o seu rank colex, sem guardar as máscaras em disco.
+
+# Índice de `mask` entre as máscaras de mesmo popcount em ordem crescente
+def colex_rank(mask: int) -> int:
+    rank = 0
+    position = 0
+    bit = 0
+    while mask:
+        if mask & 1:
+            position += 1
+            rank += comb(bit, position)
+        mask >>= 1
+        bit += 1
+    return rank
+
+def next_layer(masks: np.ndarray, m: int) -> np.ndarray:
+    parts = []
+    for bit in range(m):
+        below = masks[:np.searchsorted(masks, 1 << bit)]
+        parts.append(below | (1 << bit))
+    return np.concatenate(parts)
+
+class TSPHeldKarpMemmap(TSPHeldKarp):
+
+    def __init__(self, filename: str, matrix: Optional[List[List[int]]] = None,
+                 workdir: Optional[str] = None, chunk_rows: int = 1 << 20, keep_files: bool = False):
+        super().__init__(filename, matrix)
+        self.workdir = workdir
+        self.chunk_rows = chunk_rows
+        self.keep_files = keep_files
+        self.disk_bytes = 0
+
+    def held_karp(self):
+        n = self.n_cities
+        m = n - 1
+        dtype, infinity = self.cost_dtype()
+        cost = np.asarray(self.matrix, dtype=np.int64)
+        between = cost[1:, 1:].astype(dtype)
+        itemsize = np.dtype(dtype).itemsize
+        largest = comb(m, m // 2)
+        print(f"Camadas DP: até {largest:,} conjuntos x {m} cidades em memória "
+              f"({2 * largest * m * itemsize / 2 ** 20:.1f} MiB), pais em disco")
+
+        if self.workdir:
+            os.makedirs(self.workdir, exist_ok=True)
+        directory = tempfile.mkdtemp(prefix='held_karp_', dir=self.workdir)
+        parent_file = lambda k: os.path.join(directory, f"parent_{k:02d}.int8")
+
+        try:
+            # Camada 1: 0 -> j
+            masks = np.left_shift(1, np.arange(m, dtype=np.int64))
+            dp = np.full((m, m), infinity, dtype=dtype)
+            dp[np.arange(m), np.arange(m)] = cost[0, 1:]
+
+            for size in range(2, m + 1):
+                current = next_layer(masks, m)
+                dp_current = np.full((len(current), m), infinity, dtype=dtype)
+                parent = np.memmap(parent_file(size), dtype=np.int8, mode='w+',
+                                   shape=(m, len(current)))
+                self.disk_bytes += parent.nbytes
+                self.memory_bytes = max(self.memory_bytes, dp.nbytes + dp_current.nbytes)
+
+                for j in range(m):
+                    bit = 1 << j
+                    rows = np.flatnonzero(current & bit)
+                    for start in range(0, len(rows), self.chunk_rows):
+                        chunk = rows[start:start + self.chunk_rows]
+                        previous = np.searchsorted(masks, current[chunk] ^ bit)
+                        candidates = dp[previous] + between[:, j]
+                        best = candidates.argmin(axis=1)
+                        dp_current[chunk, j] = candidates[np.arange(len(chunk)), best]
+                        parent[j, chunk] = best
+                        self.states_evaluated += candidates.size
+
+                parent.flush()
+                del parent
+                masks, dp = current, dp_current
+
+            # A última camada tem só o conjunto completo
+            closing = dp[0] + cost[1:, 0]
+            last = int(closing.argmin())
+            self.best_cost = int(closing[last])
+
+            path = []
+            mask = (1 << m) - 1
+            for size in range(m, 1, -1):
+                parent = np.memmap(parent_file(size), dtype=np.int8, mode='r',
+                                   shape=(m, comb(m, size)))
+                previous = int(parent[last, colex_rank(mask)])
+                del parent
+                path.append(last + 1)
+                mask ^= 1 << last
+                last = previous
+            path.append(last + 1)
+            self.best_path = [0] + path[::-1]
+
+        finally:
+            if self.keep_files:
+                print(f"Arquivos de pais mantidos em {directory}")
+            else:
+                shutil.rmtree(directory, ignore_errors=True)
+
+    def solve(self) -> dict:
+        result = super().solve()
+        result['algorithm'] = 'HELD_KARP_MEMMAP_PYTHON'
+        result['disk_bytes'] = self.disk_bytes
+        return result
+
+    def print_results(self, result: dict):
+        super().print_results(result)
+        print(f"Pais em disco: {result['disk_bytes'] / 2 ** 20:.1f} MiB")
+
+def main():
+    parser = argparse.ArgumentParser(description='Held-Karp com camadas em memória e pais em disco')
+    parser.add_argument('filename', help='Arquivo TSP')
+    parser.add_argument('--workdir', default=None, help='Diretório dos arquivos memmap (padrão: temporário)')
+    parser.add_argument('--chunk-rows', type=int, default=1 << 20,
+                        help='Conjuntos por bloco vetorizado (limita a memória temporária)')
+    parser.add_argument('--keep-files', action='store_true', help='Não apaga os arquivos de pais')
+    args = parser.parse_args()
+
+    try:
+        solver = TSPHeldKarpMemmap(args.filename, workdir=args.workdir,
+                                   chunk_rows=args.chunk_rows, keep_files=args.keep_files)
+        result = solver.solve()
+        solver.print_results(result)
+        solver.save_results(result)
+
+    except KeyboardInterrupt:
+        print("\n⚠️ Execução interrompida pelo usuário")
+    except Exception as e:
+        print(f"Erro durante execução: {e}")
+        import traceback
+        traceback.print_exc()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import time
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Callable, List, Optional
+
+# Instrumentação dos solvers exaustivos.
+#
+# O laço de enumeração só incrementa um contador; uma thread de amostragem lê
+# esse contador a cada `interval` segundos e imprime taxa (permutações/s) e
+# ETA em relação ao total esperado. Não há teste de módulo nem print por
+# folha no laço quente. Novas melhores soluções (raras) são registradas em
+# `incumbent_history`, com o tempo acumulado desde a primeira execução quando
+# retomada de checkpoint. summary() reúne tudo para exportação em JSON junto
+# do resultado.
+
+def format_duration(seconds: float) -> str:
+    if seconds == float('inf'):
+        return "?"
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m{seconds:02d}s"
+    if minutes:
+        return f"{minutes}m{seconds:02d}s"
+    return f"{seconds}s"
+
+class SearchMonitor:
+
+    def __init__(self, interval: float = 1.0, verbose: bool = True, unit: str = 'permutações'):
+        self.interval = interval
+        self.verbose = verbose
+        self.unit = unit
+        self.counter: Optional[Callable[[], int]] = None
+        self.total = 0
+        self.samples: List[List[float]] = []
+        self.incumbent_history: List[List[float]] = []
+        # Contagem herdada de um checkpoint: fora da taxa média e do ETA
+        self._offset = 0
+        # Tempo das execuções anteriores, somado só aos instantes do histórico
+        self._time_offset = 0.0
+        self._start = time.time()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def elapsed(self) -> float:
+        return time.time() - self._start
+
+    # Chamado pelo solver a cada nova melhor solução
+    def incumbent(self, cost: int, count: int):
+        self.incumbent_history.append([self._time_offset + self.elapsed(), cost, count])
+        if self.verbose:
+            print(f"Nova melhor solução encontrada: {cost} (após {count:,} {self.unit})")
+
+    def resumed(self, count: int, elapsed: float = 0.0, history: Optional[List[List[float]]] = None):
+        self._offset = count
+        self._time_offset = elapsed
+        self.incumbent_history = [list(entry) for entry in history or []]
+
+    # Troca o contador amostrado (ex.: motores que contam em outro objeto)
+    def track(self, counter: Callable[[], int]):
+        self.counter = counter
+
+    def sample(self) -> List[float]:
+        count = self.counter() if self.counter else 0
+        point = [self.elapsed(), count]
+        previous = self.samples[-1] if self.samples else [0.0, self._offset]
+        self.samples.append(point)
+
+        if self.verbose and self.total:
+            window = point[0] - previous[0]
+            rate = (count - previous[1]) / window if window > 0 else 0.0
+            average = (count - self._offset) / point[0] if point[0] > 0 else 0.0
+            eta = (self.total - count) / average if average > 0 else float('inf')
+            print(f"Progresso: {count:,}/{self.total:,} {self.unit} "
+                  f"({100 * count / self.total:.1f}%), {rate:,.0f}/s, ETA {format_duration(eta)}")
+        return point
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    # Amostra `counter` em segundo plano durante o bloco
+    @contextmanager
+    def running(self, counter: Callable[[], int], total: int):
+        self.counter = counter
+        self.total = total
+        self._start = time.time()
+        self.samples = []
+        self.incumbent_history = []
+        self._offset = 0
+        self._time_offset = 0.0
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        try:
+            yield self
+        finally:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+            verbose, self.verbose = self.verbose, False
+            self.sample()
+            self.verbose = verbose
+
+    def summary(self) -> dict:
+        elapsed, count = self.samples[-1] if self.samples else [self.elapsed(), 0]
+        rate = (count - self._offset) / elapsed if elapsed > 0 else 0.0
+        return {
+            'unit': self.unit,
+            'total': self.total,
+            'processed': count,
+            'elapsed': elapsed,
+            'rate': rate,
+            'sample_interval': self.interval,
+            'samples': self.samples,
+            'incumbent_history': self.incumbent_history
+        }
+
+    def export_json(self, path: str, result: Optional[dict] = None):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({'result': result, 'instrumentation': self.summary()}, f, indent=2)
@@ -0,0 +1,20 @@
+import os
+import sys
+from typing import List
+
+# Utilitários comuns aos solvers exatos.
+#
+# Os solvers desta pasta reaproveitam módulos de ../approximate (vectorized_prim
+# no bound 'onetree', o pipeline MST + 2-opt no warm start); add_approximate_path
+# coloca essa pasta no sys.path uma única vez. is_symmetric é a varredura
+# O(n²) da matriz feita ao carregar a instância.
+
+APPROXIMATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'approximate')
+
+def add_approximate_path():
+    if APPROXIMATE_DIR not in sys.path:
+        sys.path.append(APPROXIMATE_DIR)
+
+def is_symmetric(matrix: List[List[int]]) -> bool:
+    n = len(matrix)
+    return all(matrix[i][j] == matrix[j][i] for i in range(n) for j in range(i + 1, n))
@@ -0,0 +1,31 @@
+import time
+from typing import List, Optional, Tuple
+
+from matrix_utils import add_approximate_path, is_symmetric
+
+# Incumbente inicial para os solvers exatos a partir do pipeline aproximativo:
+# tour do TSPMSTApproximation (garantia de 2x em matriz métrica) melhorado
+# pelo 2-opt do TSPLocalSearch. Com esse limite superior desde o primeiro nó,
+# o branch and bound poda antes de chegar à primeira folha. O 2-opt supõe
+# matriz simétrica (o ganho de inverter um trecho ignora o sentido das
+# arestas), então em matriz assimétrica fica só o tour do MST.
+
+add_approximate_path()
+
+# Retorna (custo, tour começando na cidade 0, tempo gasto). `symmetric` evita
+# repetir a varredura quando o solver já a fez ao carregar a matriz.
+def approximate_incumbent(filename: str, matrix: List[List[int]],
+                          symmetric: Optional[bool] = None) -> Tuple[int, List[int], float]:
+    from mst_algorithm import TSPMSTApproximation
+    from local_search import TSPLocalSearch
+
+    start_time = time.time()
+    result = TSPMSTApproximation(filename, matrix=matrix, verbose=False).solve()
+    search = TSPLocalSearch(matrix)
+    tour = result['tour']
+    if is_symmetric(matrix) if symmetric is None else symmetric:
+        tour = search.two_opt(tour)
+
+    start = tour.index(0)
+    tour = tour[start:] + tour[:start]
+    return search.tour_cost(tour), tour, time.time() - start_time
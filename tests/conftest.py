@@ -0,0 +1,10 @@
+import os
+import sys
+
+# Os módulos importam os vizinhos pelo nome (são executados de dentro de
+# src/python/approximate e src/python/exact); os testes usam o mesmo caminho.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for directory in ('approximate', 'exact'):
+    path = os.path.join(ROOT, 'src', 'python', directory)
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,103 @@
+import random
+
+import numpy as np
+import pytest
+
+from alpha_nearness import TSPAlphaNearness
+from lower_bound import TSPHeldKarpBound
+from mst_algorithm import TSPMSTApproximation
+
+
+def random_matrix(n, seed):
+    rng = random.Random(seed)
+    matrix = [[0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            matrix[i][j] = matrix[j][i] = rng.randint(1, 50)
+    return matrix
+
+
+def random_tree(n, seed, skip=()):
+    rng = random.Random(seed)
+    nodes = [v for v in range(n) if v not in skip]
+    rng.shuffle(nodes)
+    parent = np.full(n, -1, dtype=np.int64)
+    for index in range(1, len(nodes)):
+        parent[nodes[index]] = nodes[rng.randrange(index)]
+    weight = np.array([rng.randint(1, 20) if parent[v] >= 0 else np.inf for v in range(n)], dtype=float)
+    return parent, weight
+
+
+# Maior aresta do caminho i -> j subindo pelos pais (-inf em i == j, inf sem caminho)
+def reference_path_max(parent, weight, i, j):
+    def ancestors(v):
+        chain = {v: -np.inf}
+        top = -np.inf
+        while parent[v] >= 0:
+            top = max(top, weight[v])
+            v = parent[v]
+            chain[v] = top
+        return chain
+
+    up_i, up_j = ancestors(i), ancestors(j)
+    common = [v for v in up_i if v in up_j]
+    if not common:
+        return np.inf
+    return min(max(up_i[v], up_j[v]) for v in common)
+
+
+@pytest.mark.parametrize('seed', range(6))
+@pytest.mark.parametrize('skip', [(), (0,)])
+def test_path_maxima_matches_brute_force(seed, skip):
+    n = 15
+    parent, weight = random_tree(n, seed, skip)
+    line = TSPAlphaNearness._tree_line(parent, weight)
+    beta = TSPAlphaNearness._path_maxima(line, range(n))
+
+    for i in range(n):
+        for j in range(n):
+            assert beta[i, j] == reference_path_max(parent, weight, i, j)
+
+
+def test_alpha_is_zero_on_tree_edges():
+    n = 40
+    matrix = random_matrix(n, seed=1)
+    edges = TSPMSTApproximation('<teste>', matrix=matrix, verbose=False).solve()['mst_edges']
+    alpha = TSPAlphaNearness(matrix)
+
+    parent = np.full(n, -1, dtype=np.int64)
+    for u, v, _ in edges:
+        parent[v] = u
+    rows = alpha._alpha_rows(parent, np.zeros(n))(0, n)
+    for u, v, _ in edges:
+        assert rows[u, v] == 0 and rows[v, u] == 0
+    # Fora da árvore alpha nunca é negativo
+    off_diagonal = ~np.eye(n, dtype=bool)
+    assert (rows[off_diagonal] >= 0).all()
+
+
+def test_one_tree_alpha_is_zero_on_one_tree_edges():
+    n = 30
+    matrix = random_matrix(n, seed=2)
+    pi = np.random.default_rng(0).normal(0, 3, n)
+    alpha = TSPAlphaNearness(matrix)
+    _, _, parent, (first, second) = TSPHeldKarpBound(alpha.cost).one_tree(pi)
+
+    rows = alpha._alpha_rows(parent, pi)(0, n)
+    for v in np.flatnonzero(parent >= 0):
+        assert rows[v, parent[v]] == 0
+
+    # As duas arestas da cidade especial vêm primeiro nos candidatos de 0
+    neighbors = alpha.from_one_tree(pi, k=5).neighbors
+    assert set(neighbors[0, :2].tolist()) == {first, second}
+
+
+def test_candidates_do_not_depend_on_the_row_block():
+    n = 50
+    matrix = random_matrix(n, seed=3)
+    edges = TSPMSTApproximation('<teste>', matrix=matrix, verbose=False).solve()['mst_edges']
+    pi = np.random.default_rng(1).normal(0, 3, n)
+    for block_size in (1, 7):
+        whole, blocked = TSPAlphaNearness(matrix), TSPAlphaNearness(matrix, block_size=block_size)
+        assert (whole.from_mst(edges).neighbors == blocked.from_mst(edges).neighbors).all()
+        assert (whole.from_one_tree(pi).neighbors == blocked.from_one_tree(pi).neighbors).all()
@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from branch_bound_python import BOUNDS, ENGINES, ORDERS, TSPBranchBound
+from held_karp import TSPHeldKarp
+
+
+def random_matrix(n, seed, symmetric=False):
+    rng = random.Random(seed)
+    matrix = [[0 if i == j else rng.randint(1, 100) for j in range(n)] for i in range(n)]
+    if symmetric:
+        for i in range(n):
+            for j in range(i):
+                matrix[i][j] = matrix[j][i]
+    return matrix
+
+
+def tour_cost(matrix, tour):
+    return sum(matrix[tour[k - 1]][tour[k]] for k in range(len(tour)))
+
+
+def write_instance(path, matrix):
+    path.write_text('\n'.join(' '.join(map(str, row)) for row in matrix) + '\n')
+
+
+def new_solver(tmp_path, matrix, bound='nearest', order='index', max_nodes=2_000_000):
+    instance = tmp_path / 'random.txt'
+    write_instance(instance, matrix)
+    solver = TSPBranchBound(str(instance))
+    solver.bound = bound
+    solver.order = order
+    solver.max_nodes = max_nodes
+    return solver
+
+
+# O motor recursivo só tem o bound 'nearest' e a ordem 'index' (ver main)
+COMBINATIONS = [('recursive', 'nearest', 'index')] + [
+    (engine, bound, order)
+    for engine in ENGINES if engine != 'recursive'
+    for bound in BOUNDS
+    for order in ORDERS
+]
+
+
+@pytest.mark.parametrize('engine, bound, order', COMBINATIONS)
+@pytest.mark.parametrize('symmetric', [True, False])
+@pytest.mark.parametrize('n', [4, 7])
+def test_every_combination_matches_held_karp(tmp_path, engine, bound, order, symmetric, n):
+    matrix = random_matrix(n, seed=10 * n + symmetric, symmetric=symmetric)
+    expected = TSPHeldKarp('<teste>', matrix=matrix).solve()['best_cost']
+
+    result = new_solver(tmp_path, matrix, bound, order).solve(engine)
+    assert result['best_cost'] == expected
+    assert sorted(result['best_path']) == list(range(n))
+    assert result['best_path'][0] == 0
+    assert tour_cost(matrix, result['best_path']) == expected
+
+
+@pytest.mark.parametrize('engine', ['best', 'hybrid'])
+@pytest.mark.parametrize('bound', BOUNDS)
+@pytest.mark.parametrize('symmetric', [True, False])
+def test_full_node_pool_falls_back_to_depth_first(tmp_path, engine, bound, symmetric):
+    n = 8
+    matrix = random_matrix(n, seed=3, symmetric=symmetric)
+    expected = TSPHeldKarp('<teste>', matrix=matrix).solve()['best_cost']
+
+    result = new_solver(tmp_path, matrix, bound, 'bound', max_nodes=4).solve(engine)
+    assert result['depth_first_fallbacks'] > 0
+    assert result['peak_pool'] <= 4 * n
+    assert result['best_cost'] == expected
+    assert tour_cost(matrix, result['best_path']) == expected
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+@pytest.mark.parametrize('symmetric', [True, False])
+def test_warm_start_keeps_the_optimum(tmp_path, engine, symmetric):
+    n = 8
+    matrix = random_matrix(n, seed=5, symmetric=symmetric)
+    expected = TSPHeldKarp('<teste>', matrix=matrix).solve()['best_cost']
+
+    solver = new_solver(tmp_path, matrix)
+    result = solver.solve(engine, warm_start=True)
+    assert expected <= result['warm_start_cost']
+    assert result['best_cost'] == expected
+    assert tour_cost(matrix, result['best_path']) == expected
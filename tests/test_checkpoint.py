@@ -0,0 +1,103 @@
+import json
+import os
+import random
+import signal
+import subprocess
+import sys
+import time
+
+import pytest
+
+import brute_force_python
+from brute_force_python import TSPBruteForce
+
+EXACT_DIR = os.path.dirname(os.path.abspath(brute_force_python.__file__))
+
+
+def random_matrix(n, seed):
+    rng = random.Random(seed)
+    return [[0 if i == j else rng.randint(1, 1000) for j in range(n)] for i in range(n)]
+
+
+def write_instance(path, matrix):
+    path.write_text('\n'.join(' '.join(map(str, row)) for row in matrix) + '\n')
+
+
+def new_solver(matrix, checkpoint, resume=False):
+    solver = TSPBruteForce('<teste>', matrix=matrix)
+    solver.monitor.verbose = False
+    solver.checkpoint_file = str(checkpoint)
+    solver.resume = resume
+    return solver
+
+
+def test_resume_after_interruption_matches_single_run(tmp_path, monkeypatch):
+    # Tarefas pequenas para haver várias em 9 cidades
+    monkeypatch.setattr(brute_force_python, 'TASK_FREE_POSITIONS', 4)
+    matrix = random_matrix(9, seed=5)
+    checkpoint = tmp_path / 'checkpoint.json'
+    reference = new_solver(matrix, tmp_path / 'reference.json').solve(use_symmetry=False)
+
+    interrupted = new_solver(matrix, checkpoint)
+    calls = []
+    original = TSPBruteForce.search_prefix
+
+    def interrupt_after_some_tasks(self, prefix, end=None):
+        if len(calls) == 500:
+            raise KeyboardInterrupt
+        calls.append(prefix)
+        original(self, prefix, end)
+
+    monkeypatch.setattr(TSPBruteForce, 'search_prefix', interrupt_after_some_tasks)
+    with pytest.raises(KeyboardInterrupt):
+        interrupted.solve(use_symmetry=False)
+    monkeypatch.setattr(TSPBruteForce, 'search_prefix', original)
+
+    state = json.loads(checkpoint.read_text())
+    assert state['completed_tasks'] == 500
+    history_before = state['incumbent_history']
+    assert history_before
+
+    resumed = new_solver(matrix, checkpoint, resume=True)
+    result = resumed.solve(use_symmetry=False)
+    assert result['best_cost'] == reference['best_cost']
+    assert result['best_path'] == reference['best_path']
+    assert result['permutations_tested'] == reference['permutations_tested']
+    # Histórico anterior à retomada preservado, com custos decrescentes
+    history = resumed.monitor.incumbent_history
+    assert history[:len(history_before)] == history_before
+    assert [cost for _, cost, _ in history] == sorted((cost for _, cost, _ in history), reverse=True)
+
+
+def test_sigterm_saves_checkpoint_and_exits_nonzero(tmp_path):
+    instance = tmp_path / 'random_13.txt'
+    write_instance(instance, random_matrix(13, seed=1))
+    checkpoint = tmp_path / 'checkpoint.json'
+
+    process = subprocess.Popen(
+        [sys.executable, 'brute_force_python.py', str(instance), '-y', '--no-symmetry',
+         '--checkpoint', str(checkpoint), '--checkpoint-interval', '3600'],
+        cwd=EXACT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(3.0)
+    process.send_signal(signal.SIGTERM)
+    assert process.wait(timeout=30) == 128 + signal.SIGTERM
+
+    state = json.loads(checkpoint.read_text())
+    assert state['completed_tasks'] > 0
+    assert state['best_path']
+    assert state['incumbent_history']
+
+
+def test_checkpoint_of_another_instance_is_rejected(tmp_path, monkeypatch):
+    monkeypatch.setattr(brute_force_python, 'TASK_FREE_POSITIONS', 4)
+    checkpoint = tmp_path / 'checkpoint.json'
+    new_solver(random_matrix(8, seed=1), checkpoint).solve(use_symmetry=False)
+
+    # Mesmo tamanho, motor e tarefas: só o digest distingue as instâncias
+    other = new_solver(random_matrix(8, seed=2), checkpoint, resume=True)
+    with pytest.raises(ValueError, match='outra instância'):
+        other.solve(use_symmetry=False)
+
+    same = new_solver(random_matrix(8, seed=1), checkpoint, resume=True)
+    assert same.solve(use_symmetry=False)['best_cost'] == \
+        new_solver(random_matrix(8, seed=1), tmp_path / 'fresh.json').solve(use_symmetry=False)['best_cost']
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from decomposition import TSPClusterDecomposition
+
+
+# Custo de costura de um caminho aberto: entrada vinda de `previous`, saída
+# para o cluster seguinte, menos a aresta do ciclo removida
+def stitch_cost(decomposition, path, previous, following):
+    enter = decomposition.distance(previous, path[0])
+    leave = decomposition.distance(np.full(len(following), path[-1]), following).min()
+    return int(enter + leave - decomposition.distance(path[-1], path[0]))
+
+
+def test_open_cycle_returns_the_scored_opening_in_both_directions():
+    rng = np.random.default_rng(0)
+    directions = set()
+    for _ in range(200):
+        points = rng.random((14, 2)) * 1000
+        decomposition = TSPClusterDecomposition(coordinates=points, processes=1)
+        cycle = rng.permutation(10)
+        previous, following = 10, np.arange(11, 14)
+
+        path = decomposition._open_cycle(cycle, previous, following)
+
+        # Todas as 2m aberturas possíveis: rotações nos dois sentidos
+        openings = [np.roll(cycle, -i) for i in range(10)]
+        openings += [opening[::-1] for opening in openings]
+        best = min(stitch_cost(decomposition, opening, previous, following) for opening in openings)
+
+        assert sorted(path.tolist()) == sorted(cycle.tolist())
+        assert any(np.array_equal(path, opening) for opening in openings)
+        assert stitch_cost(decomposition, path, previous, following) == best
+        position = int(np.flatnonzero(cycle == path[0])[0])
+        directions.add(cycle[(position + 1) % 10] == path[1])
+
+    assert directions == {True, False}
+
+
+@pytest.mark.parametrize('method', ['kmeans', 'grid'])
+def test_partition_respects_cluster_size(method):
+    rng = np.random.default_rng(1)
+    # Pontos concentrados: grade e k-means geram grupos acima do limite
+    points = np.concatenate([rng.normal(0, 1, (900, 2)), rng.random((100, 2)) * 100])
+    decomposition = TSPClusterDecomposition(coordinates=points, cluster_size=50, method=method)
+    clusters = decomposition.partition()
+
+    assert max(len(cluster) for cluster in clusters) <= 50
+    assert sorted(np.concatenate(clusters).tolist()) == list(range(1000))
+
+
+def test_partition_mst_respects_cluster_size():
+    rng = np.random.default_rng(2)
+    points = rng.random((300, 2)) * 1000
+    decomposition = TSPClusterDecomposition(coordinates=points, cluster_size=40)
+    matrix = decomposition.submatrix(np.arange(300))
+    clusters = TSPClusterDecomposition(matrix=matrix, cluster_size=40).partition()
+
+    assert max(len(cluster) for cluster in clusters) <= 40
+    assert sorted(np.concatenate(clusters).tolist()) == list(range(300))
+
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_solve_returns_a_valid_tour(processes):
+    rng = np.random.default_rng(3)
+    points = rng.random((400, 2)) * 1000
+    decomposition = TSPClusterDecomposition(coordinates=points, cluster_size=60, processes=processes)
+    result = decomposition.solve(progress=False)
+    tour = np.asarray(result['tour'])
+
+    assert sorted(result['tour']) == list(range(400))
+    assert result['cost'] == int(decomposition.distance(tour, np.roll(tour, -1)).sum())
@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from dynamic_update import TSPDynamicTour, random_changes
+
+
+def random_matrix(n, seed):
+    rng = random.Random(seed)
+    matrix = [[0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            matrix[i][j] = matrix[j][i] = rng.randint(1, 100)
+    return matrix
+
+
+def tour_cost(matrix, tour):
+    return sum(matrix[tour[k - 1]][tour[k]] for k in range(len(tour)))
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_cost_after_updates_matches_recomputed_cost(seed):
+    n = 60
+    rng = random.Random(seed)
+    matrix = random_matrix(n, seed)
+    dynamic = TSPDynamicTour(matrix, rng.sample(range(n), n), k=8)
+
+    for batch in range(10):
+        # Arestas do tour e arestas quaisquer, com repetições no mesmo lote
+        changes = random_changes(matrix, dynamic.tour(), 4, rng.choice([0.2, 3.0]), rng)
+        changes += [(rng.randrange(n), rng.randrange(n), rng.randint(1, 100)) for _ in range(4)]
+        changes.append(changes[0][:2] + (rng.randint(1, 100),))
+        outcome = dynamic.update_edges(changes)
+
+        tour = dynamic.tour()
+        assert sorted(tour) == list(range(n))
+        assert outcome['cost'] == dynamic.cost == tour_cost(matrix, tour)
+        assert outcome['cost_before_repair'] - outcome['gain'] == outcome['cost']
+
+        # Listas de candidatos continuam sendo os k mais próximos, em ordem
+        for a, candidates in enumerate(dynamic.neighbors):
+            weights = [matrix[a][c] for c in candidates]
+            assert weights == sorted(weights) and a not in candidates
+            outside = [matrix[a][c] for c in range(n) if c != a and c not in candidates]
+            assert len(candidates) == 8 and max(weights) <= min(outside)
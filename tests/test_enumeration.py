@@ -0,0 +1,141 @@
+import random
+from itertools import combinations, permutations
+from math import factorial
+
+import pytest
+
+from enumeration import TSPHeapEnumeration
+from brute_force_python import TSPBruteForce
+from brute_force_numpy import TSPNumpyBlockEnumeration
+
+
+def random_matrix(n, seed, symmetric=False):
+    rng = random.Random(seed)
+    matrix = [[0 if i == j else rng.randint(1, 100) for j in range(n)] for i in range(n)]
+    if symmetric:
+        for i in range(n):
+            for j in range(i):
+                matrix[i][j] = matrix[j][i]
+    return matrix
+
+
+def tour_cost(matrix, tour):
+    return sum(matrix[tour[k - 1]][tour[k]] for k in range(len(tour)))
+
+
+def reference_optimum(matrix):
+    n = len(matrix)
+    return min(tour_cost(matrix, [0] + list(p)) for p in permutations(range(1, n)))
+
+
+@pytest.mark.parametrize('n', range(2, 9))
+@pytest.mark.parametrize('fix_first', [True, False])
+def test_heap_visits_every_permutation_with_exact_costs(n, fix_first):
+    matrix = random_matrix(n, seed=n)
+    enumeration = TSPHeapEnumeration(matrix, fix_first=fix_first)
+    enumeration.monitor.verbose = False
+    enumeration.search()
+
+    assert enumeration.permutations_tested == factorial(n - 1 if fix_first else n)
+    # Custo mantido por deltas igual ao recalculado e ao ótimo de referência
+    assert tour_cost(matrix, enumeration.best_path) == enumeration.best_cost
+    assert enumeration.best_cost == reference_optimum(matrix)
+
+
+# Ordem de Heap de referência, sem deltas nem contagem por fórmula
+def heap_order(items):
+    items = list(items)
+    counters = [0] * len(items)
+    yield list(items)
+    i = 1
+    while i < len(items):
+        if counters[i] < i:
+            j = counters[i] if i & 1 else 0
+            items[j], items[i] = items[i], items[j]
+            yield list(items)
+            counters[i] += 1
+            i = 1
+        else:
+            counters[i] = 0
+            i += 1
+
+
+class RecordingMonitor:
+    def __init__(self):
+        self.history = []
+
+    def incumbent(self, cost, tested):
+        self.history.append((cost, tested))
+
+
+@pytest.mark.parametrize('n', [6, 8])
+@pytest.mark.parametrize('publish_level', [3, 5])
+def test_heap_counts_come_from_the_counters(n, publish_level):
+    matrix = random_matrix(n, seed=10 * n + publish_level)
+    expected, best = [], float('inf')
+    for tested, tour in enumerate(heap_order(range(n)), start=1):
+        cost = tour_cost(matrix, tour)
+        if cost < best:
+            best = cost
+            expected.append((cost, tested))
+
+    published = []
+
+    class Spy(TSPHeapEnumeration):
+        @property
+        def permutations_tested(self):
+            return self._tested
+
+        @permutations_tested.setter
+        def permutations_tested(self, value):
+            self._tested = value
+            published.append(value)
+
+    monitor = RecordingMonitor()
+    enumeration = Spy(matrix, fix_first=False, monitor=monitor)
+    enumeration.search(publish_level=publish_level)
+
+    # Contagem do incumbente igual à posição na ordem de Heap
+    assert monitor.history == expected
+    assert enumeration.permutations_tested == factorial(n)
+    # Fora dos incumbentes, só blocos completos de publish_level! permutações
+    block = factorial(publish_level)
+    incumbents = {tested for _, tested in expected}
+    assert set(range(block, factorial(n) + 1, block)) <= set(published)
+    assert all(value in incumbents or value % block == 0 for value in published[2:])
+
+
+@pytest.mark.parametrize('engine', ['dfs', 'heap', 'numpy', 'permutations'])
+@pytest.mark.parametrize('symmetric', [False, True])
+def test_brute_force_engines_agree(engine, symmetric):
+    matrix = random_matrix(8, seed=3, symmetric=symmetric)
+    solver = TSPBruteForce('<teste>', matrix=matrix)
+    solver.monitor.verbose = False
+    result = solver.solve(engine=engine)
+
+    assert result['best_cost'] == reference_optimum(matrix)
+    assert tour_cost(matrix, result['best_path']) == result['best_cost']
+    assert result['permutations_covered'] == factorial(7)
+    expected = factorial(7)
+    if engine == 'numpy':
+        expected = TSPNumpyBlockEnumeration.evaluations(8)
+    elif symmetric:
+        expected //= 2
+    assert result['permutations_tested'] == expected
+
+
+@pytest.mark.parametrize('n', range(4, 10))
+@pytest.mark.parametrize('suffix_length', [1, 3, 8])
+def test_numpy_engine_counts_evaluated_and_covered_permutations(n, suffix_length):
+    matrix = random_matrix(n, seed=n)
+    enumeration = TSPNumpyBlockEnumeration(matrix, suffix_length=suffix_length)
+    enumeration.monitor.verbose = False
+    enumeration.search()
+
+    k = enumeration.k
+    # Um bloco de k! sufixos por (conjunto do prefixo, última cidade do prefixo)
+    blocks = sum(max(len(chosen), 1) for chosen in combinations(range(1, n), n - 1 - k))
+    assert enumeration.permutations_tested == blocks * factorial(k)
+    assert enumeration.permutations_tested == TSPNumpyBlockEnumeration.evaluations(n, suffix_length)
+    assert enumeration.permutations_covered == factorial(n - 1)
+    assert enumeration.best_cost == reference_optimum(matrix)
@@ -0,0 +1,56 @@
+import random
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from brute_force_python import TSPBruteForce
+from held_karp import TSPHeldKarp
+from held_karp_memmap import TSPHeldKarpMemmap, colex_rank, next_layer
+
+
+def random_matrix(n, seed):
+    rng = random.Random(seed)
+    return [[0 if i == j else rng.randint(1, 1000) for j in range(n)] for i in range(n)]
+
+
+def tour_cost(matrix, tour):
+    return sum(matrix[tour[k - 1]][tour[k]] for k in range(len(tour)))
+
+
+@pytest.mark.parametrize('n', range(1, 10))
+def test_held_karp_matches_brute_force(n):
+    matrix = random_matrix(n, seed=100 + n)
+    held_karp = TSPHeldKarp('<teste>', matrix=matrix).solve()
+    assert sorted(held_karp['best_path']) == list(range(n))
+    if n < 2:
+        return
+
+    brute_force = TSPBruteForce('<teste>', matrix=matrix)
+    brute_force.monitor.verbose = False
+    expected = brute_force.solve()['best_cost']
+    assert held_karp['best_cost'] == expected
+    assert tour_cost(matrix, held_karp['best_path']) == expected
+
+
+@pytest.mark.parametrize('n', [3, 6, 10])
+def test_memmap_variant_matches_in_memory(n, tmp_path):
+    matrix = random_matrix(n, seed=n)
+    in_memory = TSPHeldKarp('<teste>', matrix=matrix).solve()
+    # Blocos pequenos exercitam a divisão em chunks
+    out_of_core = TSPHeldKarpMemmap('<teste>', matrix=matrix, workdir=str(tmp_path), chunk_rows=7).solve()
+    assert out_of_core['best_cost'] == in_memory['best_cost']
+    assert tour_cost(matrix, out_of_core['best_path']) == out_of_core['best_cost']
+    # Arquivos de pais removidos ao final
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_layers_are_sorted_and_indexed_by_colex_rank():
+    m = 8
+    masks = np.left_shift(1, np.arange(m, dtype=np.int64))
+    for size in range(2, m + 1):
+        masks = next_layer(masks, m)
+        expected = sorted(sum(1 << b for b in bits) for bits in combinations(range(m), size))
+        assert masks.tolist() == expected
+        for index, mask in enumerate(expected):
+            assert colex_rank(mask) == index
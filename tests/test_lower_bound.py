@@ -0,0 +1,39 @@
+import random
+
+import pytest
+
+from held_karp import TSPHeldKarp
+from lower_bound import TSPHeldKarpBound
+from mst_algorithm import TSPMSTApproximation
+
+
+def random_matrix(n, seed, symmetric):
+    rng = random.Random(seed)
+    matrix = [[0 if i == j else rng.randint(1, 100) for j in range(n)] for i in range(n)]
+    if symmetric:
+        for i in range(n):
+            for j in range(i):
+                matrix[i][j] = matrix[j][i]
+    return matrix
+
+
+@pytest.mark.parametrize('n', [3, 5, 8, 11])
+@pytest.mark.parametrize('symmetric', [True, False])
+@pytest.mark.parametrize('seed', range(3))
+def test_bound_never_exceeds_the_optimum(n, symmetric, seed):
+    matrix = random_matrix(n, seed, symmetric)
+    optimum = TSPHeldKarp('<teste>', matrix=matrix).solve()['best_cost']
+    upper_bound = TSPMSTApproximation('<teste>', matrix=matrix, verbose=False).solve()['cost']
+
+    bound = TSPHeldKarpBound(matrix)
+    assert bound.compute(upper_bound) <= optimum
+    assert bound.gap(optimum) is None or bound.gap(optimum) >= 0
+
+
+def test_bound_is_tight_when_the_one_tree_is_a_tour():
+    # Pontos em um círculo: a 1-árvore sem penalidades já é o tour ótimo
+    n = 8
+    matrix = [[min(abs(i - j), n - abs(i - j)) for j in range(n)] for i in range(n)]
+    bound = TSPHeldKarpBound(matrix)
+    assert bound.compute(2 * n) == n
+    assert bound.gap(n) == 0
@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from metaheuristics import TSPSimulatedAnnealing
+
+
+def tour_cost(matrix, tour):
+    return sum(matrix[tour[k - 1]][tour[k]] for k in range(len(tour)))
+
+
+def random_symmetric(n, seed):
+    rng = random.Random(seed)
+    matrix = [[0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            matrix[i][j] = matrix[j][i] = rng.randint(1, 100)
+    return matrix
+
+
+# Escada 2 x m com distância de Manhattan: ótimo 2(m-1) + 2
+def ladder(m):
+    points = [(x, 0) for x in range(m)] + [(x, 1) for x in range(m)]
+    return [[abs(ax - bx) + abs(ay - by) for bx, by in points] for ax, ay in points]
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_deltas_match_recomputed_costs_at_every_position(seed):
+    n = 9
+    matrix = random_symmetric(n, seed)
+    annealing = TSPSimulatedAnnealing(matrix)
+    tour = random.Random(seed).sample(range(n), n)
+    cost = tour_cost(matrix, tour)
+
+    for i in range(n):
+        for j in range(i + 1, n):
+            reversed_tour = tour[:i + 1] + tour[i + 1:j + 1][::-1] + tour[j + 1:]
+            assert annealing._two_opt_delta(tour, i, j) == tour_cost(matrix, reversed_tour) - cost
+            swapped = list(tour)
+            swapped[i], swapped[j] = swapped[j], swapped[i]
+            assert annealing._swap_delta(tour, i, j) == tour_cost(matrix, swapped) - cost
+
+
+def test_annealing_removes_a_bad_closing_edge():
+    m = 6
+    matrix = ladder(m)
+    # Linha de cima e linha de baixo no mesmo sentido: as arestas ruins são
+    # (cima[m-1], baixo[0]) e a de fechamento (baixo[m-1], cima[0]); só o
+    # 2-opt que remove a de fechamento chega ao ótimo
+    tour = list(range(2 * m))
+    assert tour_cost(matrix, tour) > 2 * (m - 1) + 2
+
+    result = TSPSimulatedAnnealing(matrix, seed=0).solve(tour, max_iterations=20000,
+                                                         swap_probability=0.0)
+    assert result['cost'] == 2 * (m - 1) + 2
+    assert tour_cost(matrix, result['tour']) == result['cost']
@@ -0,0 +1,67 @@
+import numpy as np
+
+from metric_closure import TSPMetricClosure, triangle_violations
+from mst_algorithm import TSPMSTApproximation
+
+
+def non_metric_matrix(n, seed):
+    rng = np.random.default_rng(seed)
+    matrix = rng.integers(1, 100, (n, n))
+    matrix = np.minimum(matrix, matrix.T)
+    np.fill_diagonal(matrix, 0)
+    return matrix
+
+
+def test_closure_is_metric_and_never_longer():
+    matrix = non_metric_matrix(40, seed=0)
+    metric = TSPMetricClosure(matrix, block_size=7, threads=2)
+    closure = metric.compute()
+
+    assert metric.violations > 0
+    assert triangle_violations(closure) == (0, 40)
+    assert (closure <= matrix).all()
+    # Cada atalho expandido é um caminho real com o custo do fecho
+    for i, j in [(0, 1), (5, 17), (39, 2)]:
+        path = metric.expand_path(i, j)
+        assert path[0] == i and path[-1] == j
+        assert sum(matrix[a, b] for a, b in zip(path, path[1:])) == closure[i, j]
+
+
+def test_triangle_check_samples_pivots_on_large_matrices():
+    matrix = non_metric_matrix(60, seed=1)
+    violations, pivots = triangle_violations(matrix, budget=10 * 60 * 60)
+    assert pivots == 10
+    assert 0 < violations <= triangle_violations(matrix)[0]
+
+
+def test_plain_mst_result_flags_non_metric_input():
+    solver = TSPMSTApproximation('<teste>', matrix=non_metric_matrix(12, seed=0).tolist(), verbose=False)
+    result = solver.solve()
+    solver.check_metric(result)
+    assert result['is_metric'] is False
+    assert result['triangle_violations'] > 0
+
+    # Euclidiana arredondada para cima continua métrica
+    points = np.random.default_rng(2).random((12, 2)) * 1000
+    euclidean = np.ceil(np.sqrt(((points[:, None] - points[None]) ** 2).sum(axis=2))).astype(np.int64)
+    solver = TSPMSTApproximation('<teste>', matrix=euclidean.tolist(), verbose=False)
+    result = solver.solve()
+    solver.check_metric(result)
+    assert result['is_metric'] is True
+
+
+def test_triangle_check_does_not_depend_on_row_blocks_or_input_type():
+    matrix = non_metric_matrix(50, seed=3)
+    expected = triangle_violations(matrix)
+    for block_size in (1, 7, 64):
+        assert triangle_violations(matrix, block_size=block_size) == expected
+        assert triangle_violations(matrix.tolist(), block_size=block_size) == expected
+    sampled = triangle_violations(matrix, budget=5 * 50 * 50)
+    assert triangle_violations(matrix.tolist(), budget=5 * 50 * 50, block_size=9) == sampled
+
+
+def test_reporting_does_not_check_the_matrix(capsys):
+    solver = TSPMSTApproximation('<teste>', matrix=non_metric_matrix(12, seed=0).tolist(), verbose=False)
+    result = solver.solve()
+    solver.print_results(result)
+    assert 'is_metric' not in result
@@ -0,0 +1,51 @@
+import random
+
+import numpy as np
+import pytest
+
+from mst_algorithm import TSPMSTApproximation
+from multistart import TSPMultiStart, _mst_tour
+
+
+# Pesos simétricos todos distintos: MST única, sem empates entre os Prims
+def distinct_matrix(n, seed):
+    rng = random.Random(seed)
+    weights = rng.sample(range(1, 10 * n * n), n * (n - 1) // 2)
+    matrix = [[0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            matrix[i][j] = matrix[j][i] = weights.pop()
+    return matrix
+
+
+def tour_cost(matrix, tour):
+    return sum(matrix[tour[k - 1]][tour[k]] for k in range(len(tour)))
+
+
+def test_best_tour_depends_only_on_the_seed():
+    matrix = distinct_matrix(60, seed=1)
+    outcomes = [TSPMultiStart(matrix, n_starts=6, processes=processes, seed=5).solve(progress=False)
+                for processes in (1, 2, 3)]
+
+    def starts(outcome):
+        return [(r['seed'], r['mst_cost'], r['cost'], r['moves']) for r in outcome['per_start']]
+
+    for outcome in outcomes[1:]:
+        assert outcome['tour'] == outcomes[0]['tour']
+        assert outcome['best_seed'] == outcomes[0]['best_seed']
+        assert starts(outcome) == starts(outcomes[0])
+    assert tour_cost(matrix, outcomes[0]['tour']) == outcomes[0]['cost']
+
+
+def test_first_start_is_the_deterministic_mst_tour():
+    matrix = distinct_matrix(40, seed=2)
+    expected = TSPMSTApproximation('<teste>', matrix=matrix, verbose=False).solve()['tour']
+    assert _mst_tour(np.asarray(matrix, dtype=np.int64), seed=123, deterministic=True,
+                     perturbation=0.1) == expected
+
+    outcome = TSPMultiStart(matrix, n_starts=3, processes=1, seed=0).solve(progress=False)
+    first = outcome['per_start'][0]
+    assert first['seed'] == 0
+    assert first['mst_cost'] == tour_cost(matrix, expected)
+    # A melhor partida nunca é pior que o 2-opt sobre o tour MST
+    assert outcome['cost'] <= first['cost'] <= first['mst_cost']
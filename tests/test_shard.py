@@ -0,0 +1,70 @@
+import random
+from itertools import permutations
+from math import factorial
+
+import pytest
+
+from brute_force_python import TSPBruteForce
+from brute_force_shard import (TSPBruteForceShard, permutation_rank, permutation_unrank,
+                               tour_rank, tour_unrank)
+
+
+def random_matrix(n, seed):
+    rng = random.Random(seed)
+    return [[0 if i == j else rng.randint(1, 20) for j in range(n)] for i in range(n)]
+
+
+def run_shards(matrix, directory, count):
+    for index in range(count):
+        TSPBruteForceShard('inst.txt', matrix=matrix).solve_shard(index, count, str(directory))
+
+
+@pytest.mark.parametrize('count', [1, 3, 7])
+def test_merge_matches_single_dfs_run(tmp_path, count):
+    # Custos pequenos: muitos empates, o desempate por rank precisa bater
+    matrix = random_matrix(8, seed=count)
+    run_shards(matrix, tmp_path, count)
+    merged = TSPBruteForceShard('inst.txt', matrix=matrix).merge(str(tmp_path))
+
+    reference = TSPBruteForce('inst.txt', matrix=matrix)
+    reference.monitor.verbose = False
+    expected = reference.solve(use_symmetry=False)
+    assert merged['best_cost'] == expected['best_cost']
+    assert merged['best_path'] == expected['best_path']
+    assert merged['permutations_tested'] == expected['permutations_tested']
+
+
+def test_merge_rejects_mixed_shard_sets(tmp_path):
+    matrix = random_matrix(7, seed=0)
+    run_shards(matrix, tmp_path, 2)
+    run_shards(matrix, tmp_path, 4)
+
+    with pytest.raises(ValueError, match='misturados'):
+        TSPBruteForceShard('inst.txt', matrix=matrix).merge(str(tmp_path))
+    merged = TSPBruteForceShard('inst.txt', matrix=matrix).merge(str(tmp_path), count=4)
+    assert merged['shards'] == 4
+
+
+def test_merge_rejects_shards_of_another_matrix(tmp_path):
+    run_shards(random_matrix(7, seed=0), tmp_path, 3)
+    TSPBruteForceShard('inst.txt', matrix=random_matrix(7, seed=1)).solve_shard(1, 3, str(tmp_path))
+
+    with pytest.raises(ValueError, match='outra instância'):
+        TSPBruteForceShard('inst.txt', matrix=random_matrix(7, seed=0)).merge(str(tmp_path))
+
+
+@pytest.mark.parametrize('n', range(1, 7))
+def test_rank_unrank_round_trip_in_lexicographic_order(n):
+    items = list(range(1, n + 1))
+    ordered = sorted(permutations(items))
+    for rank, permutation in enumerate(ordered):
+        assert permutation_rank(list(permutation)) == rank
+        assert permutation_unrank(rank, items) == list(permutation)
+
+
+def test_tour_rank_matches_brute_force_space():
+    n = 7
+    for rank in range(0, factorial(n - 1), 37):
+        tour = tour_unrank(rank, n)
+        assert tour[0] == 0
+        assert tour_rank(tour) == rank
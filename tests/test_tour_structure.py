@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+from tour_structure import TSPArrayTour, TSPTwoLevelList, create_tour
+
+
+# Ciclo sem orientação nem ponto de partida: conjunto de arestas
+def edges(tour):
+    return {frozenset((tour[i], tour[i - 1])) for i in range(len(tour))}
+
+
+# Inversão de referência do caminho a -> ... -> b em uma lista
+def reference_reverse(tour, a, b):
+    n = len(tour)
+    i = tour.index(a)
+    length = (tour.index(b) - i) % n + 1
+    rotated = tour[i:] + tour[:i]
+    return rotated[:length][::-1] + rotated[length:]
+
+
+def check_consistent(structure, n):
+    tour = structure.to_list()
+    assert sorted(tour) == list(range(n))
+    for k, city in enumerate(tour):
+        assert structure.next(city) == tour[(k + 1) % n]
+        assert structure.prev(city) == tour[k - 1]
+    return tour
+
+
+@pytest.mark.parametrize('factory', [TSPArrayTour, lambda t: TSPTwoLevelList(t, group_size=4)])
+@pytest.mark.parametrize('n', [5, 12, 40])
+def test_random_reversals_match_reference(factory, n):
+    rng = random.Random(n)
+    reference = list(range(n))
+    rng.shuffle(reference)
+    structure = factory(reference)
+
+    for _ in range(300):
+        a, b = rng.sample(range(n), 2)
+        expected = reference_reverse(structure.to_list(), a, b)
+        structure.reverse(a, b)
+        tour = check_consistent(structure, n)
+        assert edges(tour) == edges(expected)
+
+
+@pytest.mark.parametrize('factory', [TSPArrayTour, lambda t: TSPTwoLevelList(t, group_size=3)])
+def test_between_follows_traversal(factory):
+    rng = random.Random(7)
+    n = 15
+    structure = factory(list(range(n)))
+    for _ in range(50):
+        a, b = rng.sample(range(n), 2)
+        structure.reverse(a, b)
+    tour = structure.to_list()
+
+    for a in range(n):
+        for c in range(n):
+            i, j = tour.index(a), tour.index(c)
+            path = {tour[(i + k) % n] for k in range((j - i) % n + 1)}
+            for b in range(n):
+                assert structure.between(a, b, c) == (b in path)
+
+
+def test_create_tour_picks_structure_by_size():
+    assert isinstance(create_tour(list(range(10))), TSPArrayTour)
+    assert isinstance(create_tour(list(range(1000))), TSPTwoLevelList)